@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Asset Metadata - Header-only image metadata and a persistent asset index.
+
+Image dimensions are read from PNG, JPEG, GIF, WebP and SVG headers without
+decoding pixel data. The index remembers each file's size, mtime, content
+hash and dimensions so unchanged folders and files are not re-read.
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+INDEX_FORMAT = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# JPEG start-of-frame markers that carry the image size
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_SVG_TAG = re.compile(rb'<svg\b[^>]*>', re.IGNORECASE | re.DOTALL)
+_SVG_LENGTH = re.compile(rb'^\s*([\d.]+)\s*(?:px)?\s*$')
+
+
+def hash_file(path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Return the SHA-256 of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _svg_attribute(tag: bytes, name: bytes) -> Optional[bytes]:
+    match = re.search(rb'\s' + name + rb'\s*=\s*["\']([^"\']*)["\']', tag)
+    return match.group(1) if match else None
+
+
+def _svg_size(head: bytes) -> Optional[Tuple[int, int]]:
+    tag = _SVG_TAG.search(head)
+    if not tag:
+        return None
+    tag = tag.group()
+
+    width = _SVG_LENGTH.match(_svg_attribute(tag, b'width') or b'')
+    height = _SVG_LENGTH.match(_svg_attribute(tag, b'height') or b'')
+    if width and height:
+        return round(float(width.group(1))), round(float(height.group(1)))
+
+    view_box = _svg_attribute(tag, b'viewBox')
+    if view_box:
+        parts = view_box.replace(b',', b' ').split()
+        if len(parts) == 4:
+            return round(float(parts[2])), round(float(parts[3]))
+    return None
+
+
+def _jpeg_size(f) -> Optional[Tuple[int, int]]:
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':
+            byte = f.read(1)
+        if not byte:
+            return None
+
+        marker = byte[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue
+        if marker in (0xD9, 0xDA):
+            return None
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+
+        if marker in _JPEG_SOF_MARKERS:
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack('>xHH', data)
+            return width, height
+
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _webp_size(head: bytes) -> Optional[Tuple[int, int]]:
+    chunk = head[12:16]
+    if chunk == b'VP8 ' and len(head) >= 30:
+        width, height = struct.unpack('<HH', head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L' and len(head) >= 25:
+        bits = struct.unpack('<I', head[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X' and len(head) >= 30:
+        width = int.from_bytes(head[24:27], 'little') + 1
+        height = int.from_bytes(head[27:30], 'little') + 1
+        return width, height
+    return None
+
+
+def read_image_size(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Read an image's intrinsic (width, height) from its header.
+
+    Returns:
+        Dimensions in pixels, or None for unknown formats or unsized SVGs
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(4096)
+
+            if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+                return struct.unpack('>II', head[16:24])
+            if head.startswith((b'GIF87a', b'GIF89a')):
+                return struct.unpack('<HH', head[6:10])
+            if head.startswith(b'\xff\xd8'):
+                return _jpeg_size(f)
+            if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+                return _webp_size(head)
+            if Path(path).suffix.lower() == '.svg':
+                return _svg_size(head)
+    except (OSError, struct.error, ValueError):
+        pass
+    return None
+
+
+class AssetIndex:
+    """Persistent per-folder index of image size, hash and dimensions."""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self.folders: Dict[str, Dict] = {}
+        self.dirty = False
+        self.folders_rescanned = 0
+        self.files_reprocessed = 0
+        self.load()
+
+    def load(self) -> None:
+        """Load the index, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('format') == INDEX_FORMAT:
+            self.folders = data.get('folders', {})
+
+    def _file_names(self, folder_path: Path, key: str, folder_mtime: int) -> List[str]:
+        """List a folder's files, reusing the recorded listing if it has not changed."""
+        cached = self.folders.get(key)
+        if cached is not None and cached['mtime_ns'] == folder_mtime:
+            return list(cached['files'])
+
+        self.folders_rescanned += 1
+        with os.scandir(folder_path) as it:
+            return sorted(entry.name for entry in it if entry.is_file())
+
+    def scan_folder(self, folder_path: Path, key: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Return metadata for every file in a folder, refreshing only what changed.
+
+        A folder whose mtime is unchanged is not re-listed; a file whose size
+        and mtime are unchanged is not re-read.
+
+        Args:
+            folder_path: Folder to index (not recursive)
+            key: Index key for the folder, defaults to its name
+
+        Returns:
+            Mapping of file name → {size, mtime_ns, sha256, width, height}
+        """
+        key = key or folder_path.name
+        folder_mtime = os.stat(folder_path).st_mtime_ns
+        previous = self.folders.get(key, {}).get('files', {})
+        files = {}
+
+        for name in self._file_names(folder_path, key, folder_mtime):
+            path = folder_path / name
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            entry = previous.get(name)
+            if entry is None or entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+                size = read_image_size(path)
+                entry = {
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'sha256': hash_file(path),
+                    'width': size[0] if size else None,
+                    'height': size[1] if size else None,
+                }
+                self.files_reprocessed += 1
+            files[name] = entry
+
+        if self.folders.get(key) != {'mtime_ns': folder_mtime, 'files': files}:
+            self.folders[key] = {'mtime_ns': folder_mtime, 'files': files}
+            self.dirty = True
+
+        return files
+
+    def save(self) -> None:
+        """Persist the index atomically if anything changed."""
+        if not self.dirty:
+            return
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'format': INDEX_FORMAT, 'folders': self.folders}, f, sort_keys=True)
+        os.replace(temp_path, self.index_path)
+        self.dirty = False
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Index which source files reference each image asset and report unused assets."""
+
+import argparse
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Set
+from urllib.parse import unquote
+
+from file_index import find_files, shared_index
+from prefilter import file_contains_any
+from update_asset_paths import MANIFEST_FOLDERS, PUBLIC_IMAGE_PREFIX, SHARED_IMAGE_PREFIX, manifest_var_name
+
+ASSET_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg')
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.css', '.html', '.json', '.md', '.mdx')
+SOURCE_ROOTS = ('apps', 'packages')
+
+# Asset trees and the prefix source code uses to reference each one
+ASSET_ROOTS = {
+    'apps/main/public/img': PUBLIC_IMAGE_PREFIX,
+    'packages/shared-assets/images': SHARED_IMAGE_PREFIX,
+}
+
+# Generated manifests list every shared asset; their exports are tracked instead
+GENERATED_SOURCES = ('packages/shared-assets/src',)
+
+DEFAULT_UNUSED_DIR = 'unused-assets'
+
+# One alternation for path prefixes and manifest export names
+_REFERENCE = re.compile(
+    r'(?<![\w.-])(?P<prefix>' + re.escape(PUBLIC_IMAGE_PREFIX) + '|' + re.escape(SHARED_IMAGE_PREFIX) + r')'
+    r'|\b(?P<export>[A-Z][A-Z0-9_]*_(?:PNG|JPE?G|GIF|WEBP|AVIF|SVG))\b'
+)
+# A path runs to the delimiter that opened it (so names may contain spaces
+# and parens), or to a query string, fragment or line end
+_PATH_END = {
+    opener: re.compile('[' + re.escape(closer) + '?#\n]')
+    for opener, closer in (('"', '"'), ("'", "'"), ('`', '`'), ('(', ')'))
+}
+_UNDELIMITED_PATH_END = re.compile(r'''[\s"'`)?#]''')
+_PREFILTER_TOKENS = (
+    PUBLIC_IMAGE_PREFIX.encode('utf-8'),
+    b'shared-assets/images/',
+    b'_PNG', b'_JPG', b'_JPEG', b'_GIF', b'_WEBP', b'_AVIF', b'_SVG',
+)
+
+
+class AssetReferenceIndex:
+    """Asset → referencing-files index built in one pass over the sources."""
+
+    def __init__(self, project_root: str = "."):
+        self.project_root = Path(project_root).resolve()
+        self.assets: Dict[str, Dict] = {}
+        self.references: Dict[str, Set[Path]] = {}
+        # Template-literal references such as `/img/${name}` match by prefix
+        self.dynamic: Dict[str, Set[Path]] = {}
+        self.missing: Dict[str, Set[Path]] = {}
+        self._prefixes = {prefix: root for root, prefix in ASSET_ROOTS.items()}
+        self._exports: Dict[str, str] = {}
+        self.files_scanned = 0
+
+    def build(self) -> 'AssetReferenceIndex':
+        """Collect assets, then scan every source file once."""
+        self.collect_assets()
+        self.scan_sources()
+        return self
+
+    def collect_assets(self) -> None:
+        """List every asset under the asset roots with its size."""
+        for root, prefix in ASSET_ROOTS.items():
+            root_path = self.project_root / root
+            if not root_path.exists():
+                continue
+            for path in find_files(root_path, ASSET_EXTENSIONS):
+                relative = path.relative_to(root_path).as_posix()
+                key = f"{root}/{relative}"
+                self.assets[key] = {
+                    'path': path,
+                    'root': root,
+                    'prefix': prefix,
+                    'relative': relative,
+                    'size': path.stat().st_size,
+                    'export': None,
+                }
+                self.references[key] = set()
+
+                folder, _, file = relative.partition('/')
+                if prefix == SHARED_IMAGE_PREFIX and folder in MANIFEST_FOLDERS and '/' not in file:
+                    export = self.assets[key]['export'] = manifest_var_name(folder, file)
+                    self._exports[export] = key
+
+    def scan_sources(self) -> None:
+        """Record every asset reference in the source trees."""
+        generated = [self.project_root / path for path in GENERATED_SOURCES]
+
+        for root in SOURCE_ROOTS:
+            root_path = self.project_root / root
+            if not root_path.exists():
+                continue
+            for file_path in find_files(root_path, SOURCE_EXTENSIONS):
+                if any(directory in file_path.parents for directory in generated):
+                    continue
+                if not file_contains_any(file_path, _PREFILTER_TOKENS):
+                    continue
+                self.files_scanned += 1
+                self._scan_file(file_path)
+
+    def _scan_file(self, file_path: Path) -> None:
+        content = file_path.read_text(encoding='utf-8', errors='replace')
+
+        for match in _REFERENCE.finditer(content):
+            export = match.group('export')
+            if export:
+                key = self._exports.get(export)
+                if key:
+                    self.references[key].add(file_path)
+                continue
+
+            root = self._prefixes[match.group('prefix')]
+            opener = content[match.start() - 1] if match.start() else ''
+            end = _PATH_END.get(opener, _UNDELIMITED_PATH_END).search(content, match.end())
+            path = content[match.end():end.start() if end else len(content)].strip()
+            if '${' in path:
+                self.dynamic.setdefault(f"{root}/{path.partition('${')[0]}", set()).add(file_path)
+                continue
+
+            key = f"{root}/{unquote(path)}"
+            if key in self.references:
+                self.references[key].add(file_path)
+            elif path:
+                self.missing.setdefault(key, set()).add(file_path)
+
+    def referencing_files(self, key: str) -> Set[Path]:
+        """Files referencing an asset, including dynamic references that may resolve to it."""
+        files = set(self.references.get(key, ()))
+        for prefix, sources in self.dynamic.items():
+            if key.startswith(prefix):
+                files |= sources
+        return files
+
+    def unused(self) -> List[Dict]:
+        """Assets no source references, largest first."""
+        unused = [
+            asset for key, asset in self.assets.items()
+            if not self.referencing_files(key)
+        ]
+        return sorted(unused, key=lambda asset: (-asset['size'], asset['root'], asset['relative']))
+
+    def move_unused(self, destination: Path) -> int:
+        """
+        Move unused assets out of the deploy tree, keeping their layout.
+
+        Args:
+            destination: Directory outside the deploy tree
+
+        Returns:
+            Number of assets moved
+        """
+        moved = 0
+        for asset in self.unused():
+            target = destination / asset['root'] / asset['relative']
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(asset['path']), str(target))
+            moved += 1
+
+        shared_index.invalidate()
+        return moved
+
+    def to_json(self) -> Dict:
+        """Index as JSON-serializable data, with paths relative to the root."""
+        def relative(files: Set[Path]) -> List[str]:
+            return sorted(str(path.relative_to(self.project_root)) for path in files)
+
+        return {
+            'assets': {
+                key: {
+                    'size': asset['size'],
+                    'referenced_by': relative(self.referencing_files(key)),
+                }
+                for key, asset in sorted(self.assets.items())
+            },
+            'dynamic': {prefix: relative(files) for prefix, files in sorted(self.dynamic.items())},
+            'missing': {key: relative(files) for key, files in sorted(self.missing.items())},
+        }
+
+    def report(self) -> None:
+        """Print unused and missing assets with their sizes."""
+        print("\n" + "=" * 50)
+        print("Asset Reference Report")
+        print("=" * 50)
+
+        unused = self.unused()
+        print(f"\n{len(self.assets)} assets, {len(self.assets) - len(unused)} referenced, "
+              f"{self.files_scanned} source files with references")
+
+        if unused:
+            total = sum(asset['size'] for asset in unused)
+            print(f"\n🗑️  Unreferenced assets ({len(unused)} files, {total:,} bytes):")
+            for asset in unused:
+                print(f"  - {asset['root']}/{asset['relative']} ({asset['size']:,} bytes)")
+        else:
+            print("\nEvery asset is referenced.")
+
+        if self.dynamic:
+            print("\nDynamic references (assets under these prefixes count as used):")
+            for prefix in sorted(self.dynamic):
+                print(f"  - {prefix}*")
+
+        if self.missing:
+            print("\n⚠️  References to missing assets:")
+            for key, files in sorted(self.missing.items()):
+                print(f"  - {key} ({len(files)} files)")
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help='Write the asset → referencing-files index to PATH'
+    )
+    parser.add_argument(
+        '--move-unused',
+        nargs='?',
+        const=DEFAULT_UNUSED_DIR,
+        metavar='DIR',
+        help=f'Move unreferenced assets into DIR (default: {DEFAULT_UNUSED_DIR}/)'
+    )
+    args = parser.parse_args()
+
+    print("🔍 Indexing asset references")
+    print("=" * 50)
+
+    index = AssetReferenceIndex().build()
+    index.report()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(index.to_json(), f, indent=2)
+        print(f"\n📝 Wrote reference index: {args.json}")
+
+    if args.move_unused:
+        moved = index.move_unused(index.project_root / args.move_unused)
+        print(f"\n📦 Moved {moved} unreferenced assets to {args.move_unused}/")
+
+if __name__ == "__main__":
+    main()
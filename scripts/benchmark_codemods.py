@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Benchmark Codemods - Time the codemod entry points on synthetic corpora.
+
+Generates Anima-style TSX component trees and shared-assets image folders
+of the requested sizes, then times each entry point cold (empty caches and
+state) and warm (an immediate rerun in the same process). Every sample runs
+in a fresh process on a fresh copy of the corpus, so its peak RSS and cold
+timing are its own; medians of several samples are reported. Results can be
+saved as a baseline and later runs compared against it with regression
+thresholds that allow for the spread between samples.
+
+Example:
+    python scripts/benchmark_codemods.py --sizes 100,1000,10000 --save-baseline
+    python scripts/benchmark_codemods.py --sizes 100,1000,10000
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import random
+import resource
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_DENSITY = 0.2
+DEFAULT_REPEAT = 3
+DEFAULT_SAMPLES = 5
+
+# Images per shared-assets folder grow with the corpus, one per this many
+# components, so manifest and rewrite costs scale with it
+COMPONENTS_PER_IMAGE = 25
+MIN_IMAGES = 40
+DEFAULT_BASELINE = 'scripts/benchmark_baseline.json'
+
+# Slower than baseline by more than this fraction counts as a regression
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_RSS_THRESHOLD = 0.20
+# Differences below this many seconds are timer noise
+NOISE_FLOOR = 0.005
+
+ENTRY_POINTS = (
+    'transform_component',
+    'update_file',
+    'update_directory',
+    'generate_index_file',
+    'create_asset_manifest',
+)
+
+# Component page directories and the image folder each one maps to
+PAGES = ('Contact', 'About', 'Home', 'Blog', 'Shared')
+IMAGE_FOLDERS = ('contact', 'about', 'home', 'blog')
+ELEMENTS_PER_FILE = 24
+
+_TEXT_ELEMENT = (
+    '        <div className="absolute top-[{top}px] left-[{left}px] [font-family:\'Figtree\',Helvetica] '
+    'font-medium text-[#0205b7] text-base tracking-[0] leading-6 whitespace-nowrap">{text}</div>\n'
+)
+_REFERENCE_ELEMENTS = (
+    '        <img className="absolute w-[{width}px] h-[{height}px] top-[{top}px] left-[{left}px]" '
+    'alt="Frame" src="/img/{image}" />\n',
+    '        <div className="absolute w-[{width}px] h-[{height}px] top-[{top}px] left-[{left}px] '
+    'bg-[url(/img/{image})] bg-cover bg-[50%_50%]" />\n',
+    '        <Photo className="w-[{width}px]" source="/img/{image}" />\n',
+)
+_WORDS = ('Reiki', 'healing', 'energy', 'session', 'balance', 'calm', 'book', 'now', 'goddess', 'light')
+
+
+def tiny_png(width: int, height: int, shade: int) -> bytes:
+    """A valid RGB PNG; dimensions and shade make each one unique."""
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (struct.pack('>I', len(data)) + tag + data
+                + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+
+    row = b'\x00' + bytes((shade % 256, (shade * 7) % 256, (shade * 13) % 256)) * width
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height))
+            + chunk(b'IEND', b''))
+
+def render_component(number: int, density: float, images: List[str], rng: random.Random) -> str:
+    """Render one Anima-style component with about density × elements image references."""
+    lines = [
+        'import React from "react";\n',
+        '\n',
+        f'export const Frame{number} = (): JSX.Element => {{\n',
+        '  return (\n',
+        '    <div className="bg-white flex flex-row justify-center w-full">\n',
+        '      <div className="bg-white w-[1440px] h-[900px] relative">\n',
+    ]
+    for _ in range(ELEMENTS_PER_FILE):
+        position = {'top': rng.randrange(900), 'left': rng.randrange(1440)}
+        if images and rng.random() < density:
+            template = rng.choice(_REFERENCE_ELEMENTS)
+            lines.append(template.format(
+                width=rng.randrange(40, 800), height=rng.randrange(40, 600),
+                image=rng.choice(images), **position
+            ))
+        else:
+            text = ' '.join(rng.choice(_WORDS) for _ in range(rng.randrange(2, 8)))
+            lines.append(_TEXT_ELEMENT.format(text=text, **position))
+    lines += [
+        '      </div>\n',
+        '    </div>\n',
+        '  );\n',
+        '};\n',
+    ]
+    return ''.join(lines)
+
+def generate_corpus(root: Path, files: int, density: float, images: int, seed: int = 0) -> None:
+    """
+    Write a synthetic project under root.
+
+    Args:
+        root: Empty directory to populate
+        files: Number of TSX components
+        density: Fraction of JSX elements that reference an image
+        images: Images per shared-assets folder
+        seed: Random seed; equal arguments produce identical trees
+    """
+    rng = random.Random(seed)
+    images_dir = root / 'packages/shared-assets/images'
+    image_names = []
+    for folder_number, folder in enumerate(IMAGE_FOLDERS):
+        folder_path = images_dir / folder
+        folder_path.mkdir(parents=True)
+        for number in range(images):
+            name = f"{folder}-frame-{number}.png"
+            shade = folder_number * images + number
+            (folder_path / name).write_bytes(tiny_png(16 + number % 48, 9 + number % 31, shade))
+            image_names.append(name)
+
+    components_dir = root / 'packages/shared-components/src'
+    # Roughly 50 components per directory, like a real design export
+    for number in range(files):
+        page = PAGES[number % len(PAGES)]
+        directory = components_dir / page / f"Group{number // (50 * len(PAGES))}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"Frame{number}.tsx").write_text(
+            render_component(number, density, image_names, rng),
+            encoding='utf-8'
+        )
+
+def images_for(size: int) -> int:
+    """Images per shared-assets folder for a corpus of size components."""
+    return max(MIN_IMAGES, size // COMPONENTS_PER_IMAGE)
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux KiB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def _timed(func: Callable[[], None], repeat: int = 1) -> float:
+    """Median wall time of func over repeat runs, with its output discarded."""
+    times = []
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+def _spread(samples: List[float]) -> float:
+    """Distance from the median to the furthest sample."""
+    median = statistics.median(samples)
+    return max(abs(sample - median) for sample in samples)
+
+def run_entry_point(task: Tuple[str, str, int]) -> Dict:
+    """
+    Time one entry point cold then warm on a corpus. Runs in a fresh process
+    on a corpus no other sample has touched.
+
+    Args:
+        task: Tuple of (entry point, corpus root, warm repeats)
+
+    Returns:
+        Dict with 'cold', 'warm', 'items' and 'peak_rss_kb'
+    """
+    entry, root, repeat = task
+    root_path = Path(root)
+    scripts_dir = str(Path(__file__).resolve().parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+
+    from component_extractor import AnimaComponentExtractor
+    from file_index import find_files, shared_index
+    from update_asset_paths import AssetPathUpdater
+
+    components_dir = root_path / 'packages/shared-components/src'
+    shared_index.invalidate()
+
+    if entry == 'transform_component':
+        extractor = AnimaComponentExtractor(root)
+        sources = [
+            (path.read_text(encoding='utf-8'), path.stem)
+            for path in find_files(components_dir, ('.tsx',))
+        ]
+
+        def run():
+            for content, name in sources:
+                extractor.transform_component(content, name)
+        items = len(sources)
+
+    elif entry == 'update_file':
+        updater = AssetPathUpdater(root)
+        files = find_files(components_dir, ('.tsx', '.ts'), exclude_names=('index.ts',))
+
+        def run():
+            for file_path in files:
+                updater.update_file(file_path)
+            updater.state.save()
+        items = len(files)
+
+    elif entry == 'update_directory':
+        updater = AssetPathUpdater(root)
+
+        def run():
+            updater.update_directory(components_dir)
+        items = len(find_files(components_dir, ('.tsx', '.ts'), exclude_names=('index.ts',)))
+        shared_index.invalidate()
+
+    elif entry == 'generate_index_file':
+        extractor = AnimaComponentExtractor(root)
+        paths = find_files(components_dir, ('.tsx',))
+
+        def run():
+            extractor.generate_index_file(paths)
+        items = len(paths)
+
+    elif entry == 'create_asset_manifest':
+        updater = AssetPathUpdater(root)
+
+        def run():
+            updater.create_asset_manifest()
+        items = sum(1 for _ in (root_path / 'packages/shared-assets/images').rglob('*.png'))
+
+    else:
+        raise ValueError(f"Unknown entry point: {entry}")
+
+    cold = _timed(run)
+    warm = _timed(run, repeat)
+    return {'cold': cold, 'warm': warm, 'items': items, 'peak_rss_kb': peak_rss_kb()}
+
+
+class BenchmarkSuite:
+    """Generates corpora, runs entry points and compares against a baseline."""
+
+    def __init__(
+        self,
+        sizes: List[int],
+        density: float,
+        images: Optional[int],
+        repeat: int,
+        samples: int,
+        work_dir: Path
+    ):
+        self.sizes = sizes
+        self.density = density
+        # None scales the image folders with each corpus size
+        self.images = images
+        self.repeat = repeat
+        self.samples = samples
+        self.work_dir = Path(work_dir)
+        self.results: Dict[str, Dict] = {}
+
+    def run(self, entries: List[str]) -> Dict[str, Dict]:
+        """Run every entry point at every size; keys are 'entry/size'."""
+        spawn = multiprocessing.get_context('spawn')
+        for size in self.sizes:
+            template = self.work_dir / f"corpus-{size}"
+            images = self.images or images_for(size)
+            started = time.perf_counter()
+            generate_corpus(template, size, self.density, images)
+            print(f"🧪 Generated {size} components, {images} images per folder "
+                  f"in {time.perf_counter() - started:.1f}s")
+
+            for entry in entries:
+                samples = []
+                for _ in range(self.samples):
+                    # Entry points mutate their tree and leave caches and state
+                    # behind, so every sample gets a fresh copy
+                    corpus = self.work_dir / f"{entry}-{size}"
+                    shutil.copytree(template, corpus)
+                    with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                        samples.append(pool.submit(run_entry_point, (entry, str(corpus), self.repeat)).result())
+                    shutil.rmtree(corpus)
+
+                result = {
+                    'size': size,
+                    'images': images,
+                    'items': samples[0]['items'],
+                    'cold_samples': [sample['cold'] for sample in samples],
+                    'warm_samples': [sample['warm'] for sample in samples],
+                    'peak_rss_kb': int(statistics.median(sample['peak_rss_kb'] for sample in samples)),
+                }
+                result['cold'] = statistics.median(result['cold_samples'])
+                result['warm'] = statistics.median(result['warm_samples'])
+                self.results[f"{entry}/{size}"] = result
+                print(f"   {entry:<22} cold {result['cold']:8.3f}s ±{_spread(result['cold_samples']):.3f}  "
+                      f"warm {result['warm']:8.3f}s ±{_spread(result['warm_samples']):.3f}  "
+                      f"{result['peak_rss_kb'] / 1024:7.1f} MiB")
+
+            shutil.rmtree(template)
+        return self.results
+
+    def to_json(self) -> Dict:
+        """Results plus the corpus parameters they depend on."""
+        return {
+            'parameters': {
+                'density': self.density,
+                'images': self.images or 'scaled',
+                'repeat': self.repeat,
+                'samples': self.samples,
+            },
+            'python': sys.version.split()[0],
+            'results': self.results,
+        }
+
+    def report(self) -> None:
+        """Print a throughput and memory table."""
+        print("\n" + "=" * 86)
+        print(f"{'Entry point':<24}{'Items':>8}{'Cold s':>10}{'Warm s':>10}"
+              f"{'Cold items/s':>14}{'Warm items/s':>14}{'Peak MiB':>10}")
+        print("=" * 86)
+        for key, result in self.results.items():
+            entry = key.split('/')[0]
+            cold_rate = result['items'] / result['cold'] if result['cold'] else 0
+            warm_rate = result['items'] / result['warm'] if result['warm'] else 0
+            print(f"{entry:<24}{result['items']:>8}{result['cold']:>10.3f}{result['warm']:>10.3f}"
+                  f"{cold_rate:>14,.0f}{warm_rate:>14,.0f}{result['peak_rss_kb'] / 1024:>10.1f}")
+
+    def compare(self, baseline: Dict, threshold: float, rss_threshold: float) -> List[str]:
+        """
+        Compare median timings against a baseline.
+
+        A slowdown only counts when it also exceeds the noise floor and the
+        spread of the samples on either side.
+
+        Returns:
+            Regression descriptions; empty when nothing regressed
+        """
+        if baseline.get('parameters') != self.to_json()['parameters']:
+            print("⚠️  Baseline was recorded with different corpus parameters")
+
+        regressions = []
+        print("\n📊 Against baseline:")
+        for key, result in self.results.items():
+            previous = baseline.get('results', {}).get(key)
+            if previous is None:
+                print(f"   {key:<32} (no baseline)")
+                continue
+
+            for phase in ('cold', 'warm'):
+                delta = result[phase] - previous[phase]
+                ratio = result[phase] / previous[phase] if previous[phase] else 1.0
+                noise = max(
+                    NOISE_FLOOR,
+                    _spread(result[f"{phase}_samples"]),
+                    _spread(previous.get(f"{phase}_samples", [previous[phase]]))
+                )
+                regressed = delta > noise and ratio > 1 + threshold
+                status = "❌" if regressed else "✅"
+                print(f"   {status} {key + ' ' + phase:<38} {previous[phase]:8.3f}s → {result[phase]:8.3f}s "
+                      f"({(ratio - 1) * 100:+.1f}%)")
+                if regressed:
+                    regressions.append(f"{key} {phase}: {(ratio - 1) * 100:+.1f}% time")
+
+            rss_ratio = result['peak_rss_kb'] / previous['peak_rss_kb'] if previous['peak_rss_kb'] else 1.0
+            if rss_ratio > 1 + rss_threshold:
+                print(f"   ❌ {key + ' rss':<38} {previous['peak_rss_kb'] / 1024:8.1f} → "
+                      f"{result['peak_rss_kb'] / 1024:8.1f} MiB ({(rss_ratio - 1) * 100:+.1f}%)")
+                regressions.append(f"{key} peak RSS: {(rss_ratio - 1) * 100:+.1f}%")
+
+        return regressions
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--sizes',
+        type=lambda value: [int(size) for size in value.split(',')],
+        default=list(DEFAULT_SIZES),
+        metavar='N1,N2,...',
+        help=f"Corpus sizes in components (default: {','.join(map(str, DEFAULT_SIZES))})"
+    )
+    parser.add_argument(
+        '--density',
+        type=float,
+        default=DEFAULT_DENSITY,
+        help=f'Fraction of JSX elements referencing an image (default: {DEFAULT_DENSITY})'
+    )
+    parser.add_argument(
+        '--images',
+        type=int,
+        help=f'Images per shared-assets folder (default: one per {COMPONENTS_PER_IMAGE} '
+             f'components, at least {MIN_IMAGES})'
+    )
+    parser.add_argument(
+        '--entry',
+        action='append',
+        choices=ENTRY_POINTS,
+        help='Entry point to benchmark; repeat for several (default: all)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f'Warm runs per sample; the median is kept (default: {DEFAULT_REPEAT})'
+    )
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help=f'Fresh-process samples per entry point, each on its own corpus copy '
+             f'(default: {DEFAULT_SAMPLES})'
+    )
+    parser.add_argument(
+        '--baseline',
+        default=DEFAULT_BASELINE,
+        help=f'Baseline file (default: {DEFAULT_BASELINE})'
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Store these results as the new baseline instead of comparing'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f'Allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD})'
+    )
+    parser.add_argument(
+        '--rss-threshold',
+        type=float,
+        default=DEFAULT_RSS_THRESHOLD,
+        help=f'Allowed peak RSS growth as a fraction (default: {DEFAULT_RSS_THRESHOLD})'
+    )
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help='Also write the results to PATH'
+    )
+    args = parser.parse_args()
+
+    print("⏱️  Benchmarking codemod entry points")
+    print("=" * 50)
+
+    work_dir = Path(tempfile.mkdtemp(prefix='codemod-bench-'))
+    try:
+        suite = BenchmarkSuite(args.sizes, args.density, args.images, args.repeat, args.samples, work_dir)
+        suite.run(args.entry or list(ENTRY_POINTS))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    suite.report()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(suite.to_json(), f, indent=2)
+        print(f"\n📝 Results written: {args.json}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(suite.to_json(), f, indent=2)
+        print(f"\n📝 Baseline saved: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one.")
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = suite.compare(baseline, args.threshold, args.rss_threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+if __name__ == "__main__":
+    main()
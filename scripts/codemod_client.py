@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Codemod Client - Send jobs to a running codemod_daemon.py.
+
+Imports nothing from the codemod scripts so it starts fast enough for
+editor integrations and pre-commit hooks.
+
+Examples:
+    python scripts/codemod_client.py rewrite packages/shared-components/src/Header/Header.tsx
+    python scripts/codemod_client.py extract --preset contact
+    python scripts/codemod_client.py manifest --mode split --svg
+"""
+
+import argparse
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Dict
+
+DEFAULT_SOCKET = '.codemod-cache/daemon.sock'
+
+
+def send_job(request: Dict, socket_path: str = DEFAULT_SOCKET, timeout: float = 300.0) -> Dict:
+    """
+    Send one job and wait for its response.
+
+    Raises:
+        ConnectionError: No daemon is listening on socket_path
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(
+                f"No codemod daemon on {socket_path}; start one with scripts/codemod_daemon.py"
+            ) from e
+
+        client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with client.makefile('rb') as responses:
+            line = responses.readline()
+    if not line:
+        raise ConnectionError("Daemon closed the connection without responding")
+    return json.loads(line)
+
+def build_request(args: argparse.Namespace) -> Dict:
+    """Translate parsed arguments into a job request."""
+    request = {'job': args.job}
+    if args.job == 'extract':
+        if args.sections:
+            with open(args.sections, 'r', encoding='utf-8') as f:
+                request['sections'] = json.load(f)
+        else:
+            request['preset'] = args.preset
+    elif args.job == 'rewrite':
+        request['files'] = args.files
+        if args.directory:
+            request['directory'] = args.directory
+    elif args.job == 'manifest':
+        request['mode'] = args.mode
+        request['svg'] = args.svg
+        request['placeholders'] = args.placeholders
+        if args.variant_widths:
+            request['variant_widths'] = [int(width) for width in args.variant_widths.split(',')]
+    return request
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Codemod daemon client")
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET,
+        help=f'Daemon socket path (default: {DEFAULT_SOCKET})'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print the raw JSON response'
+    )
+    jobs = parser.add_subparsers(dest='job', required=True)
+
+    jobs.add_parser('ping', help='Check that the daemon is running')
+    jobs.add_parser('stats', help='Show uptime and cache counters')
+    jobs.add_parser('shutdown', help='Stop the daemon')
+
+    extract = jobs.add_parser('extract', help='Extract Anima sections')
+    extract.add_argument('--preset', choices=['contact', 'about'], default='contact')
+    extract.add_argument('--sections', metavar='FILE', help='JSON list of section configs')
+
+    rewrite = jobs.add_parser('rewrite', help='Rewrite asset paths in files')
+    rewrite.add_argument('files', nargs='*', help='Files relative to the project root')
+    rewrite.add_argument('--directory', help='Also rewrite every component under this directory')
+
+    manifest = jobs.add_parser('manifest', help='Regenerate the asset manifest')
+    manifest.add_argument('--mode', choices=['require', 'split'], default='require')
+    manifest.add_argument('--variant-widths', metavar='W1,W2,...', help='Generate responsive variants')
+    manifest.add_argument('--svg', action='store_true', help='Minify SVGs and build the icon sprite')
+    manifest.add_argument('--placeholders', action='store_true', help='Export blur placeholders')
+
+    args = parser.parse_args()
+
+    try:
+        response = send_job(build_request(args), str(Path(args.socket)))
+    except (ConnectionError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.json:
+        print(json.dumps(response, indent=2))
+    else:
+        if response.get('log'):
+            print(response['log'], end='')
+        if response['ok']:
+            print(json.dumps(response['result']))
+            print(f"⏱️  {response['elapsed_ms']} ms in daemon")
+        else:
+            print(f"❌ {response['error']}", file=sys.stderr)
+
+    sys.exit(0 if response['ok'] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Codemod Daemon - Resident worker for the extractor and asset path updater.
+
+Keeps compiled rewrite rules, the shared file index, the incremental state
+and the transform cache warm between jobs, so editor integrations and
+pre-commit hooks skip Python startup and directory walks. Jobs arrive over
+a Unix domain socket as one JSON object per line; each gets one JSON
+response line. See codemod_client.py for the command-line client.
+
+A file watcher keeps the index honest: before each job, pending change
+events drop only the cached listings they make stale. A polling watcher
+snapshots in a background thread, so jobs never wait on a full stat walk.
+"""
+
+import argparse
+import io
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+from component_extractor import ABOUT_SECTIONS, ABOUT_SOURCE, CONTACT_SECTIONS, AnimaComponentExtractor
+from file_index import shared_index
+from file_watcher import create_watcher
+from parallel import resolve_jobs
+from update_asset_paths import DEFAULT_STATE_FILE, AssetPathUpdater
+
+DEFAULT_SOCKET = '.codemod-cache/daemon.sock'
+
+# Transform results kept in memory on top of the on-disk cache
+TRANSFORM_MEMORY_ITEMS = 4096
+
+# Preset section configurations the extract job accepts by name
+SECTION_PRESETS = {
+    'contact': CONTACT_SECTIONS,
+}
+
+
+class JobError(Exception):
+    """A job request that cannot be run; reported back to the client."""
+
+
+class CodemodDaemon:
+    """Runs codemod jobs against warm extractor and updater instances."""
+
+    def __init__(self, project_root: str = ".", jobs: int = 1, polling: bool = False):
+        self.project_root = Path(project_root).resolve()
+        self.extractor = AnimaComponentExtractor(str(self.project_root), jobs=jobs)
+        if self.extractor.cache:
+            self.extractor.cache.memory_items = TRANSFORM_MEMORY_ITEMS
+        self.updater = AssetPathUpdater(str(self.project_root), state_file=DEFAULT_STATE_FILE, jobs=jobs)
+        self.watcher = create_watcher(
+            [self.project_root / 'packages', self.project_root / 'apps'],
+            polling
+        )
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.jobs_served = 0
+        self.running = True
+
+        # Changes seen by the background poller, drained before each job
+        self.pending: Set[Path] = set()
+        self.pending_lock = threading.Lock()
+        if self.watcher.kind == 'polling':
+            threading.Thread(target=self._poll_changes, name='codemod-poll', daemon=True).start()
+
+        self.handlers: Dict[str, Callable[[Dict], Dict]] = {
+            'ping': self.ping,
+            'extract': self.extract,
+            'rewrite': self.rewrite,
+            'manifest': self.manifest,
+            'stats': self.stats,
+            'shutdown': self.shutdown,
+        }
+
+    def _poll_changes(self) -> None:
+        """Take polling snapshots off the job path, queueing what changed."""
+        while self.running:
+            changed = self.watcher.read(self.watcher.interval)
+            if changed:
+                with self.pending_lock:
+                    self.pending |= changed
+
+    def sync_index(self) -> None:
+        """Apply pending file events to the shared file index."""
+        if self.watcher.kind == 'polling':
+            with self.pending_lock:
+                changed, self.pending = self.pending, set()
+            if changed:
+                shared_index.refresh(changed)
+            return
+
+        while True:
+            changed = self.watcher.read(0)
+            if not changed:
+                return
+            shared_index.refresh(changed)
+
+    def run(self, request: Dict) -> Dict:
+        """
+        Run one job, capturing what it prints.
+
+        Jobs run one at a time; the extractor and updater are not thread-safe.
+
+        Returns:
+            Response with 'ok', 'result' or 'error', 'log' and 'elapsed_ms'
+        """
+        started = time.perf_counter()
+        log = io.StringIO()
+        with self.lock:
+            try:
+                handler = self.handlers.get(request.get('job'))
+                if handler is None:
+                    raise JobError(f"Unknown job: {request.get('job')!r}")
+                self.sync_index()
+                with redirect_stdout(log):
+                    result = handler(request)
+                response = {'ok': True, 'result': result}
+            except JobError as e:
+                response = {'ok': False, 'error': str(e)}
+            except Exception as e:
+                response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            self.jobs_served += 1
+
+        response['log'] = log.getvalue()
+        response['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return response
+
+    def _resolve(self, name: str) -> Path:
+        """Resolve a client-supplied path, refusing anything outside the project."""
+        path = (self.project_root / name).resolve()
+        if path != self.project_root and self.project_root not in path.parents:
+            raise JobError(f"Path is outside the project: {name}")
+        return path
+
+    def _relative(self, paths: List[Path]) -> List[str]:
+        return [str(Path(path).relative_to(self.project_root)) for path in paths]
+
+    def ping(self, request: Dict) -> Dict:
+        """Liveness check."""
+        return {'pid': os.getpid()}
+
+    def extract(self, request: Dict) -> Dict:
+        """
+        Extract sections: {"preset": "contact"}, {"preset": "about"} or
+        {"sections": [{"source", "name", "target_dir"}, ...]}.
+        """
+        preset = request.get('preset')
+        if preset == 'about':
+            if not (self.project_root / ABOUT_SOURCE).exists():
+                raise JobError(f"{ABOUT_SOURCE} not found")
+            paths = self.extractor.refactor_monolith(ABOUT_SOURCE, ABOUT_SECTIONS)
+        elif preset is not None:
+            if preset not in SECTION_PRESETS:
+                raise JobError(f"Unknown preset: {preset!r}")
+            paths = self.extractor.batch_extract_sections(SECTION_PRESETS[preset])
+        else:
+            sections = request.get('sections')
+            if not sections:
+                raise JobError("extract needs a 'preset' or a list of 'sections'")
+            paths = self.extractor.batch_extract_sections(sections)
+        return {'extracted': self._relative(paths)}
+
+    def rewrite(self, request: Dict) -> Dict:
+        """Rewrite asset paths: {"files": [...]} and/or {"directory": "..."}."""
+        files = request.get('files', [])
+        directory = request.get('directory')
+        if not files and not directory:
+            raise JobError("rewrite needs 'files' or a 'directory'")
+
+        updates_before = len(self.updater.updates)
+        skipped_before = self.updater.skipped
+
+        # Check every path before touching any file
+        file_paths = [self._resolve(name) for name in files]
+        directory_path = self._resolve(directory) if directory else None
+
+        for name, file_path in zip(files, file_paths):
+            if not file_path.is_file():
+                raise JobError(f"No such file: {name}")
+            if self.updater.is_unchanged(file_path):
+                self.updater.skipped += 1
+            elif self.updater.update_file(file_path):
+                print(f"✅ Updated: {file_path.relative_to(self.project_root)}")
+        if self.updater.state:
+            self.updater.state.save()
+
+        if directory:
+            self.updater.update_directory(directory_path)
+
+        return {
+            'updated': [update['file'] for update in self.updater.updates[updates_before:]],
+            'skipped': self.updater.skipped - skipped_before,
+        }
+
+    def manifest(self, request: Dict) -> Dict:
+        """Regenerate the asset manifest with create_asset_manifest's options."""
+        options = {
+            key: request[key]
+            for key in ('mode', 'variant_widths', 'svg', 'placeholders')
+            if key in request
+        }
+        if options.get('mode', 'require') not in ('require', 'split'):
+            raise JobError(f"Unknown manifest mode: {options['mode']!r}")
+        self.updater.create_asset_manifest(**options)
+        return {'options': options}
+
+    def stats(self, request: Dict) -> Dict:
+        """Uptime and warm-state counters."""
+        cache = self.extractor.cache
+        return {
+            'uptime_s': round(time.time() - self.started, 1),
+            'jobs_served': self.jobs_served,
+            'watcher': self.watcher.kind,
+            'transform_cache': cache.summary() if cache else None,
+            'outputs': self.extractor.writer.summary(),
+        }
+
+    def shutdown(self, request: Dict) -> Dict:
+        """Stop accepting jobs once this response is sent."""
+        self.running = False
+        return {'stopping': True}
+
+    def close(self) -> None:
+        """Release the watcher."""
+        self.watcher.close()
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """Serves newline-delimited JSON requests on one connection."""
+
+    def handle(self) -> None:
+        daemon = self.server.codemod
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                response = {'ok': False, 'error': f"Bad request: {e}"}
+            else:
+                response = daemon.run(request)
+
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+            if not daemon.running:
+                # shutdown() blocks until serve_forever returns, so call it elsewhere
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: CodemodDaemon):
+        self.codemod = daemon
+        super().__init__(socket_path, _JobHandler)
+
+
+def claim_socket(socket_path: Path) -> None:
+    """Remove a stale socket file, refusing to start beside a live daemon."""
+    if not socket_path.exists():
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+        return
+    finally:
+        probe.close()
+    raise SystemExit(f"❌ A daemon is already listening on {socket_path}")
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Codemod Daemon")
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET,
+        help=f'Unix socket path relative to the project root (default: {DEFAULT_SOCKET})'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Worker processes for directory-wide jobs (0 = one per CPU)'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='Watch by polling file stats instead of inotify'
+    )
+    args = parser.parse_args()
+
+    daemon = CodemodDaemon(jobs=resolve_jobs(args.jobs), polling=args.poll)
+    socket_path = daemon.project_root / args.socket
+    claim_socket(socket_path)
+
+    server = _DaemonServer(str(socket_path), daemon)
+    print(f"🚀 Codemod daemon listening on {socket_path} (pid {os.getpid()}, {daemon.watcher.kind} watcher)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        daemon.close()
+        if socket_path.exists():
+            socket_path.unlink()
+        print(f"\n👋 Daemon stopped after {daemon.jobs_served} jobs")
+
+if __name__ == "__main__":
+    main()
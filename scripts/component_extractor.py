@@ -4,22 +4,62 @@ Anima Component Extractor - Automates extraction of Anima-generated components
 into the monorepo shared packages structure.
 """
 
+import argparse
 import os
 import re
-import json
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import shutil
+import sys
+import time
 from datetime import datetime
 
+from extraction_log import DEFAULT_LOG, ExtractionLog
+from file_index import find_files, shared_index
+from file_watcher import watch
+from output_writer import OutputWriter
+from parallel import map_in_pool, resolve_jobs
+from prefilter import file_contains_any
+from profiler import DEFAULT_PROFILE, shared_profiler
+from rewrite_engine import RewriteEngine, RewriteRule
+from section_scanner import MonolithIndex, detect_sections
+from transform_cache import TransformCache
+
+SHARED_IMAGES = '@reiki-goddess/shared-assets/images/'
+
+# Rules applied by transform_component when update_imports is set
+IMPORT_ENGINE = RewriteEngine([
+    RewriteRule('img-src', r'src="\/img\/(.*?)"', f'src={{require("{SHARED_IMAGES}\\1")}}'),
+    RewriteRule('css-url', r'url\(\/img\/(.*?)\)', f'url({SHARED_IMAGES}\\1)'),
+])
+
+# Bump when transform_component output changes for reasons other than the
+# import rules, so cached transforms are invalidated
+TRANSFORM_VERSION = f"1:{IMPORT_ENGINE.version}"
+TRANSFORM_CACHE_DIR = '.codemod-cache/transforms'
+
+# Rules applied by update_asset_paths
+ASSET_PATH_ENGINE = RewriteEngine([
+    RewriteRule('img-src', r'src="\/img\/(.*?)"', f'src={{require("{SHARED_IMAGES}\\1")}}',
+                tokens=(b'/img/',)),
+    RewriteRule('static-img', r'\/static\/img\/(.*?)"', f'{SHARED_IMAGES}\\1"',
+                tokens=(b'/static/img/',)),
+])
+
 class AnimaComponentExtractor:
     """Extracts and transforms Anima components for monorepo integration."""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", jobs: int = 1, use_cache: bool = True):
         self.project_root = Path(project_root).resolve()
         self.shared_components = self.project_root / "packages" / "shared-components" / "src"
         self.shared_assets = self.project_root / "packages" / "shared-assets"
-        self.extraction_log = []
+        self.extraction_log = ExtractionLog(self.project_root / DEFAULT_LOG)
+        self.jobs = jobs
+        self.writer = OutputWriter()
+        self.cache = (
+            TransformCache(self.project_root / TRANSFORM_CACHE_DIR, TRANSFORM_VERSION)
+            if use_cache else None
+        )
         
     def extract_component(
         self,
@@ -40,36 +80,95 @@ class AnimaComponentExtractor:
         Returns:
             Path to the extracted component
         """
+        started = time.perf_counter()
+        source, target_path, written = self.render_component(
+            source_path, component_name, target_dir, update_imports
+        )
+        self._log_extraction(source, target_path, component_name, written, time.perf_counter() - started)
+        return target_path
+    
+    def render_component(
+        self,
+        source_path: str,
+        component_name: str,
+        target_dir: str,
+        update_imports: bool = True
+    ) -> Tuple[Path, Path, bool]:
+        """
+        Read, transform and write a component without logging it.
+        
+        This is the per-file part of extract_component and is safe to run
+        in a pool worker.
+        
+        Returns:
+            Tuple of (source path, target path, whether the target changed)
+        """
         source = self.project_root / source_path
         
         if not source.exists():
             raise FileNotFoundError(f"Source file not found: {source}")
         
         # Read source content
-        with open(source, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with shared_profiler.phase('extract.read'):
+            with open(source, 'r', encoding='utf-8') as f:
+                content = f.read()
+                # On-disk bytes, not decoded characters
+                size = os.fstat(f.fileno()).st_size
+        shared_profiler.count('bytes_read', size)
         
         # Transform the component
-        transformed = self.transform_component(content, component_name, update_imports)
+        with shared_profiler.phase('extract.transform'):
+            transformed = self.transform_component(content, component_name, update_imports)
         
-        # Create target directory
+        # Write transformed component, leaving identical output untouched
         target_path = self.shared_components / target_dir / f"{component_name}.tsx"
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        with shared_profiler.phase('extract.write'):
+            written = self.writer.write(target_path, transformed)
         
-        # Write transformed component
-        with open(target_path, 'w', encoding='utf-8') as f:
-            f.write(transformed)
+        return source, target_path, written
+    
+    def render_config(
+        self,
+        config: Dict[str, str]
+    ) -> Tuple[Optional[Tuple[Path, Path, bool, float]], Optional[str]]:
+        """
+        Render one section config, returning (result, error) instead of raising.
         
-        # Log extraction
+        The result is (source path, target path, whether the target changed,
+        seconds taken).
+        """
+        try:
+            started = time.perf_counter()
+            paths = self.render_component(
+                config['source'],
+                config['name'],
+                config.get('target_dir', 'components')
+            )
+            return (*paths, time.perf_counter() - started), None
+        except Exception as e:
+            return None, str(e)
+    
+    def _log_extraction(
+        self,
+        source: Path,
+        target_path: Path,
+        component_name: str,
+        written: bool,
+        seconds: float
+    ) -> None:
+        """Record a finished extraction; always runs in the parent process."""
         self.extraction_log.append({
             'timestamp': datetime.now().isoformat(),
             'source': str(source),
             'target': str(target_path),
-            'component': component_name
+            'component': component_name,
+            'written': written,
+            'duration_ms': round(seconds * 1000, 3),
+            'bytes_in': source.stat().st_size,
+            'bytes_out': target_path.stat().st_size
         })
         
         print(f"✅ Extracted: {component_name} → {target_path.relative_to(self.project_root)}")
-        return target_path
     
     def transform_component(
         self,
@@ -88,22 +187,31 @@ class AnimaComponentExtractor:
         Returns:
             Transformed component content
         """
+        if self.cache is None:
+            return self._transform(content, component_name, update_imports)
+        
+        key = self.cache.key(content, component_name, update_imports)
+        transformed = self.cache.get(key)
+        if transformed is None:
+            shared_profiler.count('transform_cache_misses')
+            transformed = self._transform(content, component_name, update_imports)
+            self.cache.put(key, transformed)
+        else:
+            shared_profiler.count('transform_cache_hits')
+        return transformed
+    
+    def _transform(
+        self,
+        content: str,
+        component_name: str,
+        update_imports: bool
+    ) -> str:
+        """Uncached body of transform_component."""
         transformed = content
         
         if update_imports:
-            # Update image imports from /img/ to shared-assets
-            transformed = re.sub(
-                r'src="\/img\/(.*?)"',
-                r'src={require("@reiki-goddess/shared-assets/images/\1")}',
-                transformed
-            )
-            
-            # Update CSS image URLs
-            transformed = re.sub(
-                r'url\(\/img\/(.*?)\)',
-                r'url(@reiki-goddess/shared-assets/images/\1)',
-                transformed
-            )
+            # Update image src attributes and CSS image URLs in one pass
+            transformed, _ = IMPORT_ENGINE.apply(transformed)
             
             # Add shared-assets import if images are used
             if '@reiki-goddess/shared-assets' in transformed and 'import' not in transformed:
@@ -147,16 +255,35 @@ interface {component_name}Props {{
         """
         extracted_paths = []
         
-        for config in sections_config:
-            try:
-                path = self.extract_component(
-                    config['source'],
-                    config['name'],
-                    config.get('target_dir', 'components')
-                )
-                extracted_paths.append(path)
-            except Exception as e:
-                print(f"❌ Failed to extract {config['name']}: {e}")
+        # Workers render the components; logging and the index file are
+        # handled here in config order so output stays deterministic
+        if self.jobs > 1:
+            results = map_in_pool(
+                _extract_in_worker,
+                sections_config,
+                self.jobs,
+                initializer=_init_worker,
+                initargs=(str(self.project_root), self.cache is not None)
+            )
+        else:
+            results = [self.render_config(config) for config in sections_config]
+        
+        if self.cache:
+            self.cache.prune()
+        
+        for config, (paths, error) in zip(sections_config, results):
+            if error:
+                print(f"❌ Failed to extract {config['name']}: {error}")
+                continue
+            source, target_path, written, seconds = paths
+            if self.jobs > 1:
+                # Worker writers are discarded; fold their outcome in here
+                self.writer.record(written)
+            self._log_extraction(source, target_path, config['name'], written, seconds)
+            extracted_paths.append(target_path)
+        
+        # New components invalidate any cached listing of the target tree
+        shared_index.invalidate(self.shared_components)
         
         # Generate index file for extracted components
         if extracted_paths:
@@ -167,17 +294,24 @@ interface {component_name}Props {{
     def refactor_monolith(
         self,
         monolith_path: str,
-        sections_map: List[Dict]
+        sections_map: Optional[List[Dict]] = None
     ) -> List[Path]:
         """
         Break a monolithic component into modular sections.
         
         Args:
             monolith_path: Path to monolithic component
-            sections_map: List of section definitions with line ranges
+            sections_map: List of section definitions. Entries without
+                'start'/'end' line ranges take the next top-level
+                <section>/<div> detected in the JSX; when omitted, every
+                detected section is extracted with a generated name
         
         Returns:
             List of extracted section paths
+        
+        Raises:
+            ValueError: If the detected sections don't match the entries
+                without line ranges
         """
         source = self.project_root / monolith_path
         
@@ -185,7 +319,14 @@ interface {component_name}Props {{
             raise FileNotFoundError(f"Monolith file not found: {source}")
         
         with open(source, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            content = f.read()
+        lines = content.splitlines(keepends=True)
+        
+        # Index the monolith once: line offsets, JSX depths and import header
+        with shared_profiler.phase('refactor.index'):
+            index = MonolithIndex(content)
+            imports = index.import_header()
+            sections_map = self.resolve_sections(index, source.stem, sections_map)
         
         extracted_paths = []
         
@@ -199,7 +340,6 @@ interface {component_name}Props {{
             temp_content = ''.join(section_lines)
             
             # Add necessary imports from monolith
-            imports = self.extract_imports(lines[:30])  # Check first 30 lines for imports
             section_content = imports + '\n\n' + temp_content
             
             # Create wrapper component structure
@@ -211,23 +351,65 @@ interface {component_name}Props {{
             # Save as new component
             target_dir = section.get('target_dir', 'components')
             target_path = self.shared_components / target_dir / f"{section['name']}.tsx"
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write(wrapped_content)
+            with shared_profiler.phase('refactor.write'):
+                self.writer.write(target_path, wrapped_content)
             
             extracted_paths.append(target_path)
             print(f"✅ Refactored section: {section['name']} → {target_path.relative_to(self.project_root)}")
         
+        shared_index.invalidate(self.shared_components)
+        
         return extracted_paths
     
-    def extract_imports(self, lines: List[str]) -> str:
-        """Extract import statements from lines."""
-        imports = []
-        for line in lines:
-            if line.strip().startswith('import'):
-                imports.append(line)
-        return ''.join(imports)
+    def resolve_sections(
+        self,
+        index: MonolithIndex,
+        default_name: str,
+        sections_map: Optional[List[Dict]]
+    ) -> List[Dict]:
+        """
+        Fill in missing line ranges from the monolith's top-level JSX sections.
+        
+        Entries without a range take the detected sections not covered by an
+        explicit range, in order; the counts must match exactly, so a section
+        the scanner missed can't shift every later name onto the wrong block.
+        
+        Raises:
+            ValueError: If the detected sections don't match the unranged entries
+        """
+        detected = detect_sections(index.content, index=index)
+        
+        if sections_map is None:
+            return [
+                {'name': f"{default_name}Section{number}", 'target_dir': default_name, **line_range}
+                for number, line_range in enumerate(detected, 1)
+            ]
+        
+        explicit = [section for section in sections_map if 'start' in section and 'end' in section]
+        unranged = [section['name'] for section in sections_map if section not in explicit]
+        if not unranged:
+            return list(sections_map)
+        
+        available = [
+            line_range for line_range in detected
+            if not any(
+                line_range['start'] <= section['end'] and section['start'] <= line_range['end']
+                for section in explicit
+            )
+        ]
+        if len(available) != len(unranged):
+            found = ', '.join(f"{r['start']}-{r['end']}" for r in available) or 'none'
+            raise ValueError(
+                f"{default_name}: detected {len(available)} sections (lines {found}) "
+                f"for {len(unranged)} names ({', '.join(unranged)}); "
+                f"give these sections explicit start/end line ranges"
+            )
+        
+        remaining = iter(available)
+        return [
+            section if section in explicit else {**section, **next(remaining)}
+            for section in sections_map
+        ]
     
     def wrap_section_content(self, content: str, section_name: str) -> str:
         """Wrap section content in proper component structure."""
@@ -248,6 +430,11 @@ export const {section_name}: React.FC<{section_name}Props> = ({{ className }}) =
     
     def generate_index_file(self, component_paths: List[Path]) -> None:
         """Generate index.ts file for extracted components."""
+        with shared_profiler.phase('extract.index_file'):
+            self._generate_index_file(component_paths)
+    
+    def _generate_index_file(self, component_paths: List[Path]) -> None:
+        """Body of generate_index_file."""
         exports = []
         
         for path in component_paths:
@@ -263,16 +450,16 @@ export const {section_name}: React.FC<{section_name}Props> = ({{ className }}) =
         existing_exports = []
         if index_path.exists():
             with open(index_path, 'r') as f:
-                existing_exports = f.readlines()
+                existing_exports = [line.rstrip('\n') for line in f if line.strip()]
         
         # Merge and deduplicate exports
         all_exports = list(set(existing_exports + exports))
         all_exports.sort()
         
-        with open(index_path, 'w') as f:
-            f.write('\n'.join(all_exports))
-        
-        print(f"✅ Updated index file: {index_path.relative_to(self.project_root)}")
+        if self.writer.write(index_path, '\n'.join(all_exports)):
+            print(f"✅ Updated index file: {index_path.relative_to(self.project_root)}")
+        else:
+            print(f"✓ Index file unchanged: {index_path.relative_to(self.project_root)}")
     
     def update_asset_paths(self, directory: str) -> int:
         """
@@ -287,42 +474,121 @@ export const {section_name}: React.FC<{section_name}Props> = ({{ className }}) =
         target_dir = self.project_root / directory
         updated_count = 0
         
-        for file_path in target_dir.rglob("*.tsx"):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            original = content
-            
-            # Update image paths
-            content = re.sub(
-                r'src="\/img\/(.*?)"',
-                r'src={require("@reiki-goddess/shared-assets/images/\1")}',
-                content
-            )
-            
-            # Update static paths
-            content = re.sub(
-                r'\/static\/img\/(.*?)"',
-                r'@reiki-goddess/shared-assets/images/\1"',
-                content
-            )
-            
-            if content != original:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+        with shared_profiler.phase('extract.assets.discover'):
+            files = find_files(target_dir, ('.tsx',))
+        
+        for file_path in files:
+            if self.update_asset_file(file_path):
                 updated_count += 1
-                print(f"✅ Updated assets in: {file_path.relative_to(self.project_root)}")
         
         return updated_count
     
-    def save_extraction_log(self) -> None:
-        """Save extraction log to file."""
-        log_path = self.project_root / "extraction_log.json"
+    def update_asset_file(self, file_path: Path) -> bool:
+        """Update asset paths in a single file, returning whether it changed."""
+        # Skip files with no candidate reference before decoding them
+        with shared_profiler.phase('extract.assets.read'):
+            if not file_contains_any(file_path, ASSET_PATH_ENGINE.tokens):
+                return False
+            
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                size = os.fstat(f.fileno()).st_size
+        shared_profiler.count('bytes_read', size)
+        
+        # Update image and static paths in one pass
+        with shared_profiler.phase('extract.assets.match'):
+            content, replaced = ASSET_PATH_ENGINE.apply(content)
         
-        with open(log_path, 'w') as f:
-            json.dump(self.extraction_log, f, indent=2)
+        if not replaced:
+            return False
+        
+        with shared_profiler.phase('extract.assets.write'):
+            self.writer.write(file_path, content)
+        print(f"✅ Updated assets in: {file_path.relative_to(self.project_root)}")
+        return True
+    
+    def watch_roots(self, sections_config: List[Dict[str, str]], monolith_path: Optional[str] = None) -> List[Path]:
+        """Directories holding the section sources and the shared components."""
+        sources = [config['source'] for config in sections_config]
+        if monolith_path:
+            sources.append(monolith_path)
+        
+        roots = {self.shared_components}
+        for source in sources:
+            directory = (self.project_root / source).parent
+            if directory.is_dir():
+                roots.add(directory)
+        
+        # Nested roots would be watched twice
+        return sorted(
+            root for root in roots
+            if not any(other in root.parents for other in roots)
+        )
+    
+    def handle_changes(
+        self,
+        changed: Set[Path],
+        sections_config: List[Dict[str, str]],
+        monolith_path: Optional[str] = None,
+        sections_map: Optional[List[Dict]] = None
+    ) -> None:
+        """
+        Re-extract only the sections whose sources changed, then update asset
+        paths in the changed shared component files.
+        
+        Args:
+            changed: Changed paths from the file watcher; a directory means
+                its contents should be rescanned
+            sections_config: Section configurations being watched
+            monolith_path: Monolith refactored with sections_map, if any
+            sections_map: Section definitions for refactor_monolith
+        """
+        affected = [
+            config for config in sections_config
+            if {self.project_root / config['source'], (self.project_root / config['source']).parent} & changed
+        ]
+        if affected:
+            self.batch_extract_sections(affected)
+        
+        if monolith_path:
+            monolith = self.project_root / monolith_path
+            if {monolith, monolith.parent} & changed and monolith.exists():
+                try:
+                    self.refactor_monolith(monolith_path, sections_map)
+                except ValueError as e:
+                    # Keep watching; the next save may bring the counts back in line
+                    print(f"❌ {e}")
+        
+        shared_index.invalidate(self.shared_components)
+        
+        for path in sorted(changed):
+            if path != self.shared_components and self.shared_components not in path.parents:
+                continue
+            if path.is_dir():
+                self.update_asset_paths(str(path.relative_to(self.project_root)))
+            elif path.suffix == '.tsx' and path.exists():
+                self.update_asset_file(path)
+    
+    def close_extraction_log(self) -> None:
+        """Close the extraction log; entries are already on disk as they finish."""
+        self.extraction_log.close()
         
-        print(f"📝 Extraction log saved: {log_path.relative_to(self.project_root)}")
+        if len(self.extraction_log):
+            print(f"📝 Extraction log: {self.extraction_log.path.relative_to(self.project_root)} "
+                  f"(run {self.extraction_log.run_id})")
+
+
+# Per-process extractor used by batch_extract_sections workers
+_worker_extractor: Optional[AnimaComponentExtractor] = None
+
+def _init_worker(project_root: str, use_cache: bool) -> None:
+    """Create the extractor used by this worker process."""
+    global _worker_extractor
+    _worker_extractor = AnimaComponentExtractor(project_root, use_cache=use_cache)
+
+def _extract_in_worker(config: Dict[str, str]) -> Tuple[Optional[Tuple[Path, Path, bool, float]], Optional[str]]:
+    """Render one configured section in a worker process."""
+    return _worker_extractor.render_config(config)
 
 
 # Configuration for Contact page sections
@@ -355,47 +621,34 @@ CONTACT_SECTIONS = [
 ]
 
 # Configuration for About page refactoring
+ABOUT_SOURCE = 'About/src/screens/About/About.tsx'
 ABOUT_SECTIONS = [
     {
         'name': 'AboutHeroSection',
-        'start': 38,
-        'end': 100,
         'target_dir': 'About'
     },
     {
         'name': 'AboutIntroSection',
-        'start': 100,
-        'end': 150,
         'target_dir': 'About'
     },
     {
         'name': 'AboutGallerySection',
-        'start': 150,
-        'end': 250,
         'target_dir': 'About'
     },
     {
         'name': 'AboutTestimonialsSection',
-        'start': 250,
-        'end': 350,
         'target_dir': 'About'
     },
     {
         'name': 'AboutServicesSection',
-        'start': 350,
-        'end': 420,
         'target_dir': 'About'
     },
     {
         'name': 'AboutCTASection',
-        'start': 420,
-        'end': 480,
         'target_dir': 'About'
     },
     {
         'name': 'AboutFooterSection',
-        'start': 480,
-        'end': 503,
         'target_dir': 'About'
     }
 ]
@@ -403,10 +656,54 @@ ABOUT_SECTIONS = [
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Anima Component Extractor")
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Extract components in N worker processes (0 = one per CPU)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Recompute every transform instead of using the on-disk cache'
+    )
+    parser.add_argument(
+        '--about',
+        action='store_true',
+        help='Also refactor the About monolith, naming its detected sections from '
+             'ABOUT_SECTIONS (stops if the section count differs)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and re-extract sections as their sources are saved'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='Watch by polling file stats instead of inotify'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=DEFAULT_PROFILE,
+        metavar='PATH',
+        help=f'Record phase timings, rule counts and bytes; write JSON to PATH (default: {DEFAULT_PROFILE})'
+    )
+    args = parser.parse_args()
+    
+    if args.profile:
+        shared_profiler.enable()
+    
     print("🚀 Starting Anima Component Extraction")
     print("=" * 50)
     
-    extractor = AnimaComponentExtractor()
+    extractor = AnimaComponentExtractor(
+        jobs=resolve_jobs(args.jobs),
+        use_cache=not args.no_cache
+    )
     
     # Step 1: Extract Contact sections
     print("\n📦 Extracting Contact Page Sections...")
@@ -415,23 +712,45 @@ def main():
     
     # Step 2: Refactor About page
     print("\n📦 Refactoring About Page...")
-    # Note: This would need the actual line numbers verified
-    # about_paths = extractor.refactor_monolith(
-    #     'About/src/screens/About/About.tsx',
-    #     ABOUT_SECTIONS
-    # )
-    # print(f"   Refactored into {len(about_paths)} About sections")
+    about_source = ABOUT_SOURCE if args.about else None
+    if not args.about:
+        print("   Skipped: run with --about once detected sections are verified")
+    elif (extractor.project_root / about_source).exists():
+        try:
+            # Boundaries come from the JSX structure; ABOUT_SECTIONS only names them
+            about_paths = extractor.refactor_monolith(about_source, ABOUT_SECTIONS)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"   Refactored into {len(about_paths)} About sections")
+    else:
+        print(f"   Skipped: {about_source} not found")
     
     # Step 3: Update asset paths
     print("\n🔄 Updating Asset Paths...")
     updated = extractor.update_asset_paths('packages/shared-components')
     print(f"   Updated {updated} files with new asset paths")
     
-    # Step 4: Save extraction log
-    extractor.save_extraction_log()
+    # Step 4: Close the streaming extraction log
+    extractor.close_extraction_log()
     
     print("\n✨ Extraction Complete!")
     print(f"   Total components extracted: {len(extractor.extraction_log)}")
+    print(f"   Output files: {extractor.writer.summary()}")
+    if extractor.cache and extractor.jobs == 1:
+        print(f"   Transform cache: {extractor.cache.summary()}")
+    
+    if args.profile:
+        shared_profiler.summary()
+        shared_profiler.save(extractor.project_root / args.profile)
+        print(f"\n📝 Profile written: {args.profile}")
+    
+    if args.watch:
+        watch(
+            extractor.watch_roots(CONTACT_SECTIONS, about_source),
+            lambda changed: extractor.handle_changes(changed, CONTACT_SECTIONS, about_source, ABOUT_SECTIONS),
+            polling=args.poll
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Find byte-identical image assets and collapse them onto one canonical copy."""
+
+import argparse
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+from urllib.parse import quote
+
+from asset_metadata import hash_file
+from asset_references import AssetReferenceIndex
+from file_index import shared_index
+from fix_imports import normalize_imports
+from output_writer import OutputWriter
+from rewrite_engine import RewriteEngine, RewriteRule
+
+# A reference is not part of a longer path and ends at a quote, closing
+# paren, query string or fragment
+_REFERENCE_START = r'(?<![\w.-])'
+_REFERENCE_END = r'''(?=["'`)?#])'''
+
+# Package the manifest exports are imported from
+SHARED_ASSETS_MODULE = '@reiki-goddess/shared-assets'
+
+
+def reference_forms(asset: Dict) -> List[str]:
+    """Strings source code may use for an asset, plain and URL-encoded."""
+    plain = asset['prefix'] + asset['relative']
+    forms = [plain]
+    for safe in ("/@()'", "/@"):
+        encoded = quote(plain, safe=safe)
+        if encoded not in forms:
+            forms.append(encoded)
+    return forms
+
+def page_folder(asset: Dict) -> str:
+    """Top-level folder of an asset within its tree, '' for loose files."""
+    folder, _, rest = asset['relative'].partition('/')
+    return folder if rest else ''
+
+def canonical_rank(asset: Dict) -> Tuple:
+    """Sort key preferring URL-safe, then referenced, then short names."""
+    name = asset['relative']
+    awkward = any(char in name for char in ' ()\'')
+    return (awkward, -asset['reference_count'], len(name), name)
+
+
+class AssetDeduplicator:
+    """Groups duplicate assets by content hash and rewrites references to them."""
+
+    def __init__(self, project_root: str = "."):
+        self.project_root = Path(project_root).resolve()
+        self.index = AssetReferenceIndex(project_root)
+        self.assets: List[Dict] = []
+        self.groups: List[List[Dict]] = []
+        self.writer = OutputWriter()
+        self.removed = 0
+
+    def collect_assets(self) -> None:
+        """Index assets and their references in one pass over the sources."""
+        self.index.build()
+        for key, asset in self.index.assets.items():
+            self.assets.append(dict(
+                asset,
+                key=key,
+                sha256=None,
+                reference_count=len(self.index.referencing_files(key))
+            ))
+
+    def find_duplicates(self) -> List[List[Dict]]:
+        """
+        Group byte-identical assets.
+
+        Only files sharing a size with another file are hashed, in
+        streaming chunks.
+
+        Returns:
+            Groups of two or more identical assets
+        """
+        by_size: Dict[int, List[Dict]] = {}
+        for asset in self.assets:
+            by_size.setdefault(asset['size'], []).append(asset)
+
+        by_hash: Dict[str, List[Dict]] = {}
+        for candidates in by_size.values():
+            if len(candidates) < 2:
+                continue
+            for asset in candidates:
+                asset['sha256'] = hash_file(asset['path'])
+                by_hash.setdefault(asset['sha256'], []).append(asset)
+
+        self.groups = [group for group in by_hash.values() if len(group) > 1]
+        self.groups.sort(key=lambda group: -group[0]['size'] * (len(group) - 1))
+        return self.groups
+
+    def plan(self) -> List[Tuple[Dict, Dict]]:
+        """
+        Pick a canonical copy per page folder of each asset tree in each group.
+
+        Copies in different trees are served differently (public URL vs
+        package import), and update_asset_paths.py maps each page to its
+        own folder, so only duplicates within one folder of one tree are
+        collapsed; other copies are reported and left in place.
+
+        Returns:
+            (duplicate, canonical) pairs
+        """
+        pairs = []
+        for group in self.groups:
+            by_folder: Dict[Tuple[str, str], List[Dict]] = {}
+            for asset in group:
+                by_folder.setdefault((asset['root'], page_folder(asset)), []).append(asset)
+            for copies in by_folder.values():
+                copies.sort(key=canonical_rank)
+                pairs.extend((duplicate, copies[0]) for duplicate in copies[1:])
+        return pairs
+
+    def build_engine(self, pairs: List[Tuple[Dict, Dict]]) -> RewriteEngine:
+        """Rewrite rules mapping each duplicate's references to its canonical copy."""
+        rules = []
+        for duplicate, canonical in pairs:
+            target = reference_forms(canonical)[0]
+            for reference in reference_forms(duplicate):
+                rules.append(RewriteRule(
+                    f"dedupe:{reference}",
+                    _REFERENCE_START + re.escape(reference) + _REFERENCE_END,
+                    lambda match, target=target: target,
+                    tokens=(reference.encode('utf-8'),)
+                ))
+            if duplicate['export'] and canonical['export']:
+                rules.append(RewriteRule(
+                    f"dedupe:{duplicate['export']}",
+                    r'\b' + duplicate['export'] + r'\b',
+                    lambda match, target=canonical['export']: target,
+                    tokens=(duplicate['export'].encode('utf-8'),)
+                ))
+        # Longest first, so a name is never matched as the prefix of another
+        rules.sort(key=lambda rule: len(rule.pattern), reverse=True)
+        return RewriteEngine(rules)
+
+    def rewrite_references(self, pairs: List[Tuple[Dict, Dict]]) -> int:
+        """
+        Point references at canonical copies.
+
+        Returns:
+            Number of files rewritten
+        """
+        engine = self.build_engine(pairs)
+        sources = {
+            file_path
+            for duplicate, _ in pairs
+            for file_path in self.index.references[duplicate['key']]
+        }
+        rewritten = 0
+        for file_path in sorted(sources):
+            content = file_path.read_text(encoding='utf-8')
+            new_content, count = engine.apply(content)
+            if count:
+                # Two exports collapsing onto one can repeat an import specifier
+                new_content = normalize_imports(new_content, (SHARED_ASSETS_MODULE,))
+            if count and self.writer.write(file_path, new_content):
+                rewritten += 1
+                print(f"✅ Rewrote {count} references in: {file_path.relative_to(self.project_root)}")
+        return rewritten
+
+    def remove_duplicates(self, pairs: List[Tuple[Dict, Dict]]) -> List[Tuple[Dict, Set[Path]]]:
+        """
+        Delete the non-canonical copies nothing references any more.
+
+        Sources are re-indexed after rewriting; a copy still referenced
+        (dynamically, or by an export its canonical copy lacks) is kept.
+
+        Returns:
+            (duplicate, still-referencing files) for every copy kept
+        """
+        index = AssetReferenceIndex(str(self.project_root)).build()
+        kept = []
+        for duplicate, _ in pairs:
+            remaining = index.referencing_files(duplicate['key'])
+            if remaining:
+                kept.append((duplicate, remaining))
+                continue
+            os.unlink(duplicate['path'])
+            self.removed += 1
+
+        shared_index.invalidate()
+        return kept
+
+    def report(self, pairs: List[Tuple[Dict, Dict]]) -> None:
+        """Print duplicate groups and the bytes deduplication saves."""
+        print("\n" + "=" * 50)
+        print("Duplicate Asset Report")
+        print("=" * 50)
+
+        if not self.groups:
+            print("\nNo duplicate assets found.")
+            return
+
+        canonical_of = {id(duplicate): canonical for duplicate, canonical in pairs}
+        uncollapsed_bytes = 0
+        for group in self.groups:
+            print(f"\n{group[0]['sha256'][:12]} ({group[0]['size']:,} bytes × {len(group)}):")
+            for asset in sorted(group, key=lambda asset: (asset['root'], asset['relative'])):
+                canonical = canonical_of.get(id(asset))
+                status = f"→ {canonical['relative']}" if canonical else "(kept)"
+                print(f"  - {asset['root']}/{asset['relative']} "
+                      f"[{asset['reference_count']} refs] {status}")
+            folders = {(asset['root'], page_folder(asset)) for asset in group}
+            uncollapsed_bytes += group[0]['size'] * (len(folders) - 1)
+
+        saved = sum(duplicate['size'] for duplicate, _ in pairs)
+        print(f"\n💾 Same-folder duplicates: {len(pairs)} files, {saved:,} bytes saved")
+        if uncollapsed_bytes:
+            print(f"   Copies in other trees or page folders: {uncollapsed_bytes:,} bytes "
+                  f"(kept, so each page keeps its own folder)")
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--apply',
+        action='store_true',
+        help='Rewrite references and delete duplicates (default: report only)'
+    )
+    args = parser.parse_args()
+
+    print("🔍 Scanning for duplicate assets")
+    print("=" * 50)
+
+    deduplicator = AssetDeduplicator()
+    deduplicator.collect_assets()
+    deduplicator.find_duplicates()
+    pairs = deduplicator.plan()
+
+    if args.apply and pairs:
+        print("\n📝 Rewriting references...")
+        rewritten = deduplicator.rewrite_references(pairs)
+        kept = deduplicator.remove_duplicates(pairs)
+        print(f"   Rewrote {rewritten} files, removed {deduplicator.removed} duplicates")
+        for duplicate, files in kept:
+            print(f"⚠️  Kept {duplicate['root']}/{duplicate['relative']}: still referenced by "
+                  + ', '.join(str(path.relative_to(deduplicator.project_root)) for path in sorted(files)))
+        if deduplicator.removed:
+            print("   Regenerate the asset manifest: python scripts/update_asset_paths.py")
+
+    deduplicator.report(pairs)
+
+    if not args.apply and pairs:
+        print("\nRun with --apply to rewrite references and delete duplicates.")
+
+if __name__ == "__main__":
+    main()
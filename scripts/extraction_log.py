@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Extraction Log - Streaming JSONL log of component extractions.
+
+Each finished extraction is appended as one JSON line, flushed at the end
+of the line, so memory stays flat however large the run and a crash keeps
+every entry written before it. Runs append to the same file; entries carry
+a run ID so one run can be picked out later.
+
+Run as a script to filter and aggregate a log without loading it whole:
+    python scripts/extraction_log.py --run latest --summary
+    python scripts/extraction_log.py --component Contact --slowest 10
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+DEFAULT_LOG = 'extraction_log.jsonl'
+
+
+class ExtractionLog:
+    """Append-only JSONL writer, opened on the first entry."""
+
+    def __init__(self, path: Path, run_id: Optional[str] = None):
+        self.path = Path(path)
+        self.run_id = run_id or f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}"
+        self.count = 0
+        self._file = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, entry: Dict) -> None:
+        """Write one entry; it is on disk once this returns."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Line buffering flushes each entry as its newline is written
+            self._file = open(self.path, 'a', encoding='utf-8', buffering=1)
+        self._file.write(json.dumps({'run': self.run_id, **entry}, separators=(',', ':')) + '\n')
+        self.count += 1
+
+    def close(self) -> None:
+        """Close the file; a later append reopens it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_entries(path: Path, predicate: Optional[Callable[[Dict], bool]] = None) -> Iterator[Dict]:
+    """
+    Stream entries from a log, skipping a truncated final line.
+
+    Args:
+        path: JSONL log file
+        predicate: Keep only entries for which this returns True
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if predicate is None or predicate(entry):
+                yield entry
+
+def latest_run(path: Path) -> Optional[str]:
+    """Run ID of the last entry in a log."""
+    run = None
+    for entry in read_entries(path):
+        run = entry.get('run')
+    return run
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LogSummary:
+    """Aggregates entries in one pass, keeping only per-entry durations."""
+
+    def __init__(self):
+        self.count = 0
+        self.written = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.durations: List[float] = []
+        self.runs = set()
+        self.by_target_dir: Dict[str, int] = {}
+
+    def add(self, entry: Dict) -> None:
+        """Fold one entry into the totals."""
+        self.count += 1
+        self.written += bool(entry.get('written'))
+        self.bytes_in += entry.get('bytes_in', 0)
+        self.bytes_out += entry.get('bytes_out', 0)
+        self.durations.append(entry.get('duration_ms', 0.0))
+        self.runs.add(entry.get('run'))
+        target_dir = Path(entry.get('target', '')).parent.name
+        self.by_target_dir[target_dir] = self.by_target_dir.get(target_dir, 0) + 1
+
+    def report(self) -> None:
+        """Print the aggregated totals."""
+        if not self.count:
+            print("No matching entries.")
+            return
+
+        total = sum(self.durations)
+        print(f"Entries: {self.count} across {len(self.runs)} runs "
+              f"({self.written} written, {self.count - self.written} unchanged)")
+        print(f"Time:    {total:.1f} ms total, {total / self.count:.2f} ms mean, "
+              f"{_percentile(self.durations, 0.95):.2f} ms p95, {max(self.durations):.2f} ms max")
+        print(f"Bytes:   {self.bytes_in:,} read, {self.bytes_out:,} written")
+        print("By target directory:")
+        for target_dir, count in sorted(self.by_target_dir.items(), key=lambda item: -item[1]):
+            print(f"  - {target_dir}: {count}")
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Filter and aggregate an extraction log")
+    parser.add_argument(
+        'path',
+        nargs='?',
+        default=DEFAULT_LOG,
+        help=f'Log file (default: {DEFAULT_LOG})'
+    )
+    parser.add_argument(
+        '--run',
+        help="Only entries from this run ID, or 'latest'"
+    )
+    parser.add_argument(
+        '--component',
+        metavar='REGEX',
+        help='Only components whose name matches REGEX'
+    )
+    parser.add_argument(
+        '--since',
+        metavar='ISO_TIME',
+        help='Only entries at or after this timestamp, e.g. 2025-01-31T09:00'
+    )
+    parser.add_argument(
+        '--slowest',
+        type=int,
+        metavar='N',
+        help='List the N slowest entries'
+    )
+    parser.add_argument(
+        '--summary',
+        action='store_true',
+        help='Print aggregate counts, timing and bytes (default when nothing else is asked)'
+    )
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if not path.exists():
+        print(f"❌ Log not found: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    run = latest_run(path) if args.run == 'latest' else args.run
+    component = re.compile(args.component) if args.component else None
+
+    def matches(entry: Dict) -> bool:
+        if run and entry.get('run') != run:
+            return False
+        if component and not component.search(entry.get('component', '')):
+            return False
+        # ISO timestamps compare correctly as strings
+        return not args.since or entry.get('timestamp', '') >= args.since
+
+    summary = LogSummary()
+    slowest: List[Dict] = []
+    for entry in read_entries(path, matches):
+        summary.add(entry)
+        if args.slowest:
+            slowest.append(entry)
+            if len(slowest) > args.slowest * 4:
+                slowest = sorted(slowest, key=lambda e: -e.get('duration_ms', 0))[:args.slowest]
+
+    if args.summary or not args.slowest:
+        summary.report()
+
+    if args.slowest:
+        print(f"\nSlowest {args.slowest}:")
+        for entry in sorted(slowest, key=lambda e: -e.get('duration_ms', 0))[:args.slowest]:
+            print(f"  {entry.get('duration_ms', 0):8.2f} ms  {entry.get('component')}  "
+                  f"({entry.get('bytes_in', 0):,} → {entry.get('bytes_out', 0):,} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+File Index - Shared, pruned file discovery for the codemod scripts.
+
+Walks a tree once with os.scandir, skipping dependency and build output
+directories, and caches the listing so every tool in the same run can
+query it by extension without walking the tree again.
+"""
+
+import bisect
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Directories never worth descending into
+DEFAULT_EXCLUDE_DIRS = frozenset({
+    'node_modules',
+    'dist',
+    'build',
+    'coverage',
+    '.git',
+    '.turbo',
+    '.vite',
+    '.codemod-cache',
+    '__pycache__',
+})
+
+# Generated declaration output
+DEFAULT_EXCLUDE_SUFFIXES = ('.d.ts', '.d.ts.map')
+
+
+class FileIndex:
+    """Caches pruned directory listings and answers extension queries."""
+
+    def __init__(
+        self,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS,
+        exclude_suffixes: Tuple[str, ...] = DEFAULT_EXCLUDE_SUFFIXES
+    ):
+        self.exclude_dirs = frozenset(exclude_dirs)
+        self.exclude_suffixes = tuple(exclude_suffixes)
+        self._listings: Dict[str, List[str]] = {}
+
+    def _walk(self, root: str) -> List[str]:
+        """Walk a tree once, returning every kept file path in sorted order."""
+        files = []
+        stack = [root]
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.exclude_dirs:
+                        subdirs.append(entry.path)
+                elif not entry.name.endswith(self.exclude_suffixes):
+                    files.append(entry.path)
+
+            # Reverse so directories are visited in name order
+            stack.extend(reversed(subdirs))
+
+        files.sort()
+        return files
+
+    def listing(self, root: Path) -> List[str]:
+        """
+        Return every file under root, reusing a cached walk when possible.
+
+        A cached listing of an ancestor directory is filtered instead of
+        walking the subtree again.
+        """
+        root_str = os.path.abspath(root)
+        cached = self._listings.get(root_str)
+        if cached is not None:
+            return cached
+
+        for cached_root, files in self._listings.items():
+            prefix = cached_root.rstrip(os.sep) + os.sep
+            if root_str.startswith(prefix):
+                relative = root_str[len(prefix):].split(os.sep)
+                if self.exclude_dirs.intersection(relative):
+                    return []
+                return [path for path in files if path.startswith(root_str + os.sep)]
+
+        files = self._walk(root_str)
+        self._listings[root_str] = files
+        return files
+
+    def find(
+        self,
+        root: Path,
+        extensions: Iterable[str],
+        exclude_names: Iterable[str] = ()
+    ) -> List[Path]:
+        """
+        Find files under root with any of the given extensions.
+
+        Args:
+            root: Directory to search
+            extensions: File suffixes to match, e.g. ('.tsx', '.ts')
+            exclude_names: Exact file names to leave out, e.g. ('index.ts',)
+
+        Returns:
+            Matching paths in sorted order
+        """
+        extensions = tuple(extensions)
+        exclude_names = set(exclude_names)
+        return [
+            Path(path) for path in self.listing(root)
+            if path.endswith(extensions) and os.path.basename(path) not in exclude_names
+        ]
+
+    def invalidate(self, root: Optional[Path] = None) -> None:
+        """Drop cached listings for a root (or all roots) after files are added or removed."""
+        if root is None:
+            self._listings.clear()
+            return
+
+        root_str = os.path.abspath(root)
+        for cached_root in list(self._listings):
+            if cached_root == root_str or cached_root.startswith(root_str + os.sep) \
+                    or root_str.startswith(cached_root + os.sep):
+                del self._listings[cached_root]
+
+    def refresh(self, changed: Iterable[Path]) -> None:
+        """
+        Drop only the cached listings that changed paths make stale.
+
+        A file modified in place leaves every listing valid; an added or
+        removed file, or a changed directory, invalidates the listings
+        covering it. Long-running tools call this with watcher events.
+        """
+        for path in changed:
+            path_str = os.path.abspath(path)
+            if path_str.endswith(self.exclude_suffixes):
+                continue
+            exists = os.path.isfile(path_str)
+            if not exists and os.path.isdir(path_str):
+                self.invalidate(Path(path_str))
+                continue
+
+            for cached_root, files in list(self._listings.items()):
+                prefix = cached_root.rstrip(os.sep) + os.sep
+                if not path_str.startswith(prefix):
+                    continue
+                relative = path_str[len(prefix):].split(os.sep)
+                if self.exclude_dirs.intersection(relative[:-1]):
+                    continue
+                position = bisect.bisect_left(files, path_str)
+                listed = position < len(files) and files[position] == path_str
+                if listed != exists:
+                    del self._listings[cached_root]
+
+
+# Index shared by every tool imported into the same process
+shared_index = FileIndex()
+
+
+def find_files(
+    root: Path,
+    extensions: Iterable[str],
+    exclude_names: Iterable[str] = ()
+) -> List[Path]:
+    """Find files under root using the shared index."""
+    return shared_index.find(root, extensions, exclude_names)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+File State Cache - Persistent per-file state for incremental codemod runs.
+
+Each entry records a file's size, mtime and content hash together with the
+version of the rule set that last processed it. A file whose stat and rule
+version still match can be skipped without being opened.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+STATE_FORMAT = 1
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of a bytes-like object (bytes or mmap)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class FileStateCache:
+    """On-disk map of path → (size, mtime, content hash, rule version)."""
+
+    def __init__(self, state_path: Path, root: Path):
+        """
+        Args:
+            state_path: JSON file holding the persisted state
+            root: Directory that recorded paths are made relative to
+        """
+        self.state_path = Path(state_path)
+        self.root = Path(root)
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self.load()
+
+    def key(self, file_path: Path) -> str:
+        """Return the state key for a path."""
+        path = Path(os.path.abspath(file_path))
+        try:
+            return str(path.relative_to(self.root))
+        except ValueError:
+            return str(path)
+
+    def load(self) -> None:
+        """Load state from disk, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('format') == STATE_FORMAT:
+            self.entries = data.get('files', {})
+
+    def clear(self) -> None:
+        """Forget every entry so the next run reprocesses all files."""
+        self.entries = {}
+        self.dirty = True
+
+    def is_fresh(self, file_path: Path, stat: os.stat_result, rules_version: str) -> bool:
+        """Check whether a file is unchanged since it was last processed."""
+        entry = self.entries.get(self.key(file_path))
+        return (
+            entry is not None
+            and entry['size'] == stat.st_size
+            and entry['mtime_ns'] == stat.st_mtime_ns
+            and entry['rules'] == rules_version
+        )
+
+    def known_digest(self, file_path: Path, rules_version: str) -> Optional[str]:
+        """Return the recorded content hash if these rules processed the file."""
+        entry = self.entries.get(self.key(file_path))
+        if entry is not None and entry['rules'] == rules_version:
+            return entry['sha256']
+        return None
+
+    def record(
+        self,
+        file_path: Path,
+        digest: str,
+        rules_version: str,
+        stat: Optional[os.stat_result] = None
+    ) -> None:
+        """Record a file as processed."""
+        stat = stat or os.stat(file_path)
+        self.entries[self.key(file_path)] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+            'rules': rules_version
+        }
+        self.dirty = True
+
+    def prune(self, seen: Iterable[Path], directory: Path) -> int:
+        """
+        Drop entries under a directory for files a full walk no longer found,
+        so deleted and renamed files don't accumulate across runs.
+
+        Args:
+            seen: Every file the walk of directory found
+            directory: Walked directory; entries elsewhere are kept
+
+        Returns:
+            Number of entries dropped
+        """
+        directory_key = self.key(directory)
+        prefix = '' if directory_key == '.' else os.path.join(directory_key, '')
+        keep = {self.key(file_path) for file_path in seen}
+        stale = [key for key in self.entries if key.startswith(prefix) and key not in keep]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        """Persist state atomically if anything changed."""
+        if not self.dirty:
+            return
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'format': STATE_FORMAT, 'files': self.entries}, f, sort_keys=True)
+        os.replace(temp_path, self.state_path)
+        self.dirty = False
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+File Watcher - Change notification for the codemod scripts' --watch mode.
+
+On Linux the kernel's inotify interface is used through ctypes, so a save
+is seen as soon as the file is closed. Elsewhere, or when inotify is
+unavailable, the watched trees are polled with (mtime, size) snapshots.
+Events are debounced: an Anima export or an editor's save-all that touches
+many files produces one batch of changed paths.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from file_index import DEFAULT_EXCLUDE_DIRS
+
+DEFAULT_DEBOUNCE = 0.1
+DEFAULT_POLL_INTERVAL = 0.25
+
+# inotify(7) event bits
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE
+    | _IN_DELETE | _IN_DELETE_SELF | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Return libc if it provides inotify, else None."""
+    name = ctypes.util.find_library('c')
+    if not name:
+        return None
+    try:
+        libc = ctypes.CDLL(name, use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, 'inotify_init1'):
+        return None
+    return libc
+
+def _watched_dirs(root: Path) -> List[Path]:
+    """Directories under root, skipping dependency and build output."""
+    dirs = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        dirs.append(Path(current))
+        try:
+            with os.scandir(current) as it:
+                stack.extend(
+                    entry.path for entry in it
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in DEFAULT_EXCLUDE_DIRS
+                )
+        except OSError:
+            continue
+    return dirs
+
+
+class PollingWatcher:
+    """Detects changes by diffing (mtime, size) snapshots of the watched trees."""
+
+    kind = 'polling'
+
+    def __init__(self, roots: Iterable[Path], interval: float = DEFAULT_POLL_INTERVAL):
+        self.roots = [Path(root) for root in roots]
+        self.interval = interval
+        self.snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.roots:
+            for directory in _watched_dirs(root):
+                try:
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            if entry.is_file(follow_symlinks=False):
+                                stat = entry.stat(follow_symlinks=False)
+                                snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def read(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Wait for changes.
+
+        Args:
+            timeout: Seconds to wait, or None to wait until something changes
+
+        Returns:
+            Paths added, modified or removed since the last call (empty on timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else deadline - time.monotonic()
+            time.sleep(max(0.0, min(self.interval, remaining)))
+
+            snapshot = self._take_snapshot()
+            changed = {
+                path for path in snapshot.keys() | self.snapshot.keys()
+                if snapshot.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InotifyWatcher:
+    """Receives change events from the Linux kernel for every watched directory."""
+
+    kind = 'inotify'
+
+    def __init__(self, roots: Iterable[Path], libc: ctypes.CDLL):
+        self.libc = libc
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = [Path(root) for root in roots]
+        self.watches: Dict[int, Path] = {}
+        for root in self.roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root: Path) -> None:
+        """Watch a directory and every directory below it."""
+        for directory in _watched_dirs(root):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = directory
+
+    def read(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Wait for changes.
+
+        A directory in the result means its contents may have changed
+        wholesale (it was created or moved in, or events were dropped) and
+        should be rescanned.
+
+        Args:
+            timeout: Seconds to wait, or None to wait until something changes
+
+        Returns:
+            Changed paths (empty on timeout)
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost; report the roots so callers rescan them
+                changed.update(self.roots)
+                continue
+            if mask & _IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                # Files created before the new watch existed are covered by
+                # the caller rescanning the directory
+                self._add_tree(path)
+            if mask & _IN_DELETE_SELF:
+                continue
+            changed.add(path)
+
+        return changed
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(roots: Iterable[Path], polling: bool = False):
+    """Return an inotify watcher where supported, else a polling watcher."""
+    roots = [Path(root) for root in roots if Path(root).is_dir()]
+    if not polling:
+        libc = _load_libc()
+        if libc is not None:
+            try:
+                return InotifyWatcher(roots, libc)
+            except OSError:
+                pass
+    return PollingWatcher(roots)
+
+def watch(
+    roots: Iterable[Path],
+    on_change: Callable[[Set[Path]], None],
+    debounce: float = DEFAULT_DEBOUNCE,
+    polling: bool = False
+) -> None:
+    """
+    Call on_change with each debounced batch of changed paths until interrupted.
+
+    Args:
+        roots: Directories to watch recursively; missing ones are ignored
+        on_change: Receives the set of changed file (or directory) paths
+        debounce: Quiet period in seconds that ends a batch
+        polling: Force the stat-polling watcher
+    """
+    watcher = create_watcher(roots, polling)
+    print(f"\n👀 Watching {len(watcher.roots)} directories ({watcher.kind}); press Ctrl+C to stop")
+
+    try:
+        while True:
+            changed = watcher.read()
+            # Keep collecting until the burst goes quiet
+            while True:
+                more = watcher.read(debounce)
+                if not more:
+                    break
+                changed |= more
+
+            started = time.monotonic()
+            on_change(changed)
+            print(f"⏱️  Processed {len(changed)} changes in {(time.monotonic() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("\n👋 Watch stopped")
+    finally:
+        watcher.close()
@@ -1,51 +1,163 @@
 #!/usr/bin/env python3
 """Fix malformed comments in TypeScript files."""
 
+import argparse
 import re
+import sys
 from pathlib import Path
+from typing import List, Tuple
 
-def fix_comments_in_file(file_path):
-    """Fix malformed single-line comments in a file."""
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Fix patterns like "/ comment" to "// comment"
-    # But avoid matching division operators like "a / b"
-    fixed_content = re.sub(r'(\s+)/ ([A-Z]|\w+\s)', r'\1// \2', content)
-    
-    if fixed_content != content:
-        with open(file_path, 'w') as f:
-            f.write(fixed_content)
-        print(f"Fixed: {file_path}")
-        return True
-    return False
+from file_index import find_files
+from output_writer import OutputWriter
+from parallel import map_in_pool, resolve_jobs
+from section_scanner import JsxScanner, skip_regex
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TARGET = PROJECT_ROOT / "packages/shared-components/src"
+
+# Text after "/ " that marks a comment rather than a regex (same test as before)
+_COMMENT_TEXT = re.compile(r'/ (?:[A-Z]|\w+\s)')
+# "/ .../flags" followed by a use of the value (a method call, or closing
+# the expression) is a regex literal, not a comment; "docs/setup.md" is not
+_REGEX_LITERAL = re.compile(r'/ (?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])*/[dgimsuvy]*(?!\w)\s*(?:[),;\]]|\.\w+\()')
+
+
+class CommentScanner(JsxScanner):
+    """
+    Linear TS/TSX scanner that finds '/ comment' lines missing a slash.
+
+    Strings, template literals, regex literals and JSX text are skipped, and
+    a '/' is only treated as a broken comment where division is impossible.
+    """
+
+    def __init__(self, content: str):
+        super().__init__(content)
+        self.fixes: List[int] = []
+
+    def scan(self) -> List[int]:
+        """Return offsets where a '/' must be inserted to repair a comment."""
+        super().scan()
+        return self.fixes
+
+    def expression_slash(self, i: int) -> int:
+        """
+        Handle a '/' where an expression is expected: either a comment that
+        lost a slash, or a regex literal. Returns the offset to resume at.
+        """
+        text = self.content
+        preceded_by_space = i == 0 or text[i - 1].isspace()
+
+        if preceded_by_space and _COMMENT_TEXT.match(text, i) and not _REGEX_LITERAL.match(text, i):
+            self.fixes.append(i)
+            newline = text.find('\n', i)
+            return self.skip_comment(i, len(text) if newline == -1 else newline)
+
+        return skip_regex(text, i)
+
+
+def repair_comments(content: str) -> Tuple[str, int]:
+    """
+    Repair '/ comment' lines in TypeScript source.
+
+    Returns:
+        Tuple of (repaired content, number of comments fixed)
+    """
+    fixes = CommentScanner(content).scan()
+    if not fixes:
+        return content, 0
+
+    parts = []
+    previous = 0
+    for offset in fixes:
+        parts.append(content[previous:offset])
+        parts.append('/')
+        previous = offset
+    parts.append(content[previous:])
+    return ''.join(parts), len(fixes)
+
+def fix_comments_in_file(task: Tuple[str, bool]) -> Tuple[int, str]:
+    """
+    Fix malformed single-line comments in a file. Runs in a pool worker.
+
+    Args:
+        task: Tuple of (file path, check only without writing)
+
+    Returns:
+        Tuple of (comments fixed, error message or '')
+    """
+    file_path, check = task
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        fixed_content, fixed = repair_comments(content)
+
+        if fixed and not check:
+            OutputWriter().write(Path(file_path), fixed_content)
+        return fixed, ''
+    except Exception as e:
+        return 0, str(e)
+
+def collect_files(paths: List[str]) -> List[Path]:
+    """Expand files and directories into the TypeScript files to process."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(find_files(path, ('.ts', '.tsx')))
+        elif path.suffix in ('.ts', '.tsx') and path.exists():
+            files.append(path)
+    return files
 
 def main():
     """Main function to fix comments in all TypeScript files."""
-    project_root = Path("/Users/taylorquigley/Documents/Directories/reiki-goddess-healing")
-    components_dir = project_root / "packages/shared-components/src"
-    
-    files_to_fix = [
-        "HeaderSection/HeaderSection.test.tsx",
-        "Contact/ContactCTAFooter.tsx",
-        "Contact/ContactLastNameField.tsx",
-        "Contact/ContactPhoneField.tsx",
-        "Contact/ContactEmailField.tsx",
-        "Contact/ContactMessageField.tsx",
-        "ResponsiveContainer/ResponsiveContainer.tsx",
-        "ResponsiveContainer.tsx",
-        "PrivacyCompliance.tsx",
-        "SecureContactForm.tsx"
-    ]
-    
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        default=[str(DEFAULT_TARGET)],
+        help='Files or directories to process (default: packages/shared-components/src)'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Report files that need fixing without writing; exit 1 if any do or any file fails'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Worker processes (default: one per CPU)'
+    )
+    args = parser.parse_args()
+
+    files = collect_files(args.paths)
+    results = map_in_pool(
+        fix_comments_in_file,
+        [(str(file_path), args.check) for file_path in files],
+        resolve_jobs(args.jobs)
+    )
+
     fixed_count = 0
-    for file_path in files_to_fix:
-        full_path = components_dir / file_path
-        if full_path.exists():
-            if fix_comments_in_file(full_path):
-                fixed_count += 1
-    
-    print(f"\nFixed {fixed_count} files")
+    error_count = 0
+    for file_path, (fixed, error) in zip(files, results):
+        if error:
+            error_count += 1
+            print(f"❌ Error processing {file_path}: {error}")
+        elif fixed:
+            fixed_count += 1
+            action = "Needs fixing" if args.check else "Fixed"
+            print(f"{action}: {file_path} ({fixed} comments)")
+
+    if args.check:
+        print(f"\n{fixed_count} files need fixing")
+    else:
+        print(f"\nFixed {fixed_count} files")
+    if error_count:
+        print(f"{error_count} files could not be processed")
+
+    # Unreadable files fail the run too; --check also fails on files needing fixes
+    sys.exit(1 if error_count or (args.check and fixed_count) else 0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
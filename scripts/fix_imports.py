@@ -1,40 +1,259 @@
 #!/usr/bin/env python3
-"""Fix duplicate React imports in extracted components."""
+"""Merge duplicate React imports in the import header of shared package files."""
 
+import argparse
 import re
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 
-def fix_duplicate_imports(file_path):
+from file_index import find_files
+from output_writer import OutputWriter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TARGET = PROJECT_ROOT / "packages"
+
+# Modules whose duplicate value imports are merged
+DEFAULT_MODULES = ('react',)
+
+_IMPORT = re.compile(r"""
+    import\s+
+    (?P<type>type\s+)?
+    (?P<clause>[\w$*{}\s,]+?)\s*
+    from\s*
+    (?P<quote>['"])(?P<module>[^'"\n]+)(?P=quote)
+    [ \t]*;?
+""", re.VERBOSE)
+_SIDE_EFFECT_IMPORT = re.compile(r"""import\s*(['"])[^'"\n]+\1[ \t]*;?""")
+_LINE_COMMENT = re.compile(r'//[^\n]*')
+_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_DIRECTIVE = re.compile(r"""(['"])use \w+\1[ \t]*;?""")
+# Type-only declarations generate_interface places between imports
+_TYPE_DECLARATION = re.compile(r'(?:export\s+)?(?:(?P<interface>interface)\s+[\w$]+|type\s+[\w$]+(?:<[^>]*>)?\s*=)')
+
+
+class ImportStatement:
+    """One parsed import statement in the header."""
+
+    def __init__(self, match: re.Match):
+        self.start = match.start()
+        self.end = match.end()
+        self.type_only = bool(match.group('type'))
+        self.quote = match.group('quote')
+        self.module = match.group('module')
+        self.default: Optional[str] = None
+        self.namespace: Optional[str] = None
+        self.named: List[str] = []
+
+        clause = match.group('clause')
+        named = ''
+        if '{' in clause:
+            clause, _, rest = clause.partition('{')
+            named = rest.partition('}')[0]
+
+        for part in (p.strip() for p in clause.split(',')):
+            if part.startswith('*'):
+                self.namespace = part
+            elif part:
+                self.default = part
+
+        self.named = [
+            ' '.join(spec.split()) for spec in named.split(',') if spec.strip()
+        ]
+
+    def has_duplicates(self) -> bool:
+        return len(set(self.named)) != len(self.named)
+
+
+def scan_header(content: str) -> Tuple[List[ImportStatement], int]:
+    """
+    Parse the leading import block without touching the file body.
+
+    Comments, directives and interface/type declarations may sit between
+    imports; the header ends at the first other statement.
+
+    Returns:
+        Tuple of (import statements, offset where the header ends)
+    """
+    imports = []
+    position = 0
+    header_end = 0
+    size = len(content)
+
+    while position < size:
+        if content[position].isspace():
+            position += 1
+            continue
+
+        match = (
+            _IMPORT.match(content, position)
+            or _SIDE_EFFECT_IMPORT.match(content, position)
+        )
+        if match and match.re is _IMPORT:
+            imports.append(ImportStatement(match))
+        if match:
+            position = header_end = match.end()
+            continue
+
+        match = (
+            _LINE_COMMENT.match(content, position)
+            or _BLOCK_COMMENT.match(content, position)
+            or _DIRECTIVE.match(content, position)
+        )
+        if match:
+            position = match.end()
+            continue
+
+        match = _TYPE_DECLARATION.match(content, position)
+        if match:
+            position = _skip_declaration(content, match)
+            continue
+
+        break
+
+    return imports, header_end
+
+def _skip_declaration(content: str, match: re.Match) -> int:
+    """Return the offset after an interface body or a type alias."""
+    depth = 0
+    position = match.end()
+
+    for offset in range(position, len(content)):
+        char = content[offset]
+        if char in '{([':
+            depth += 1
+        elif char in '})]':
+            depth -= 1
+            if depth == 0 and char == '}' and match.group('interface'):
+                return offset + 1
+        elif depth == 0 and not match.group('interface'):
+            if char == ';':
+                return offset + 1
+            # Unterminated alias: ends at a newline not continuing a union
+            if char == '\n' and not content[offset:].lstrip().startswith(('|', '&')):
+                return offset
+
+    return len(content)
+
+def merge_statement(statements: List[ImportStatement]) -> Optional[str]:
+    """Build one import from duplicates of the same module, or None if unsafe."""
+    defaults = {s.default for s in statements if s.default}
+    if len(defaults) > 1 or any(s.namespace for s in statements):
+        return None
+
+    named: List[str] = []
+    for statement in statements:
+        for spec in statement.named:
+            if spec not in named:
+                named.append(spec)
+
+    first = statements[0]
+    parts = []
+    if defaults:
+        parts.append(defaults.pop())
+    if named:
+        parts.append(f"{{ {', '.join(named)} }}")
+    return f"import {', '.join(parts)} from {first.quote}{first.module}{first.quote};"
+
+def normalize_imports(content: str, modules: Sequence[str] = DEFAULT_MODULES) -> str:
+    """
+    Merge duplicate value imports of the given modules in the header.
+
+    The first import of a module becomes the merged statement, later ones
+    are removed, and everything after the header is left untouched.
+    """
+    imports, _ = scan_header(content)
+
+    groups: Dict[str, List[ImportStatement]] = {}
+    for statement in imports:
+        if statement.module in modules and not statement.type_only:
+            groups.setdefault(statement.module, []).append(statement)
+
+    edits: List[Tuple[int, int, str]] = []
+    for statements in groups.values():
+        if len(statements) == 1 and not statements[0].has_duplicates():
+            continue
+        merged = merge_statement(statements)
+        if merged is None:
+            continue
+        edits.append((statements[0].start, statements[0].end, merged))
+        for statement in statements[1:]:
+            edits.append(_removal(content, statement))
+
+    for start, end, replacement in sorted(edits, reverse=True):
+        content = content[:start] + replacement + content[end:]
+    return content
+
+def _removal(content: str, statement: ImportStatement) -> Tuple[int, int, str]:
+    """
+    Edit removing a statement together with its own line.
+
+    When blank lines surround the statement, one of them goes too, so the
+    removal never leaves a double blank line; other lines are untouched.
+    """
+    start = content.rfind('\n', 0, statement.start) + 1
+    line_end = content.find('\n', statement.end)
+    line_end = len(content) if line_end == -1 else line_end
+    if content[start:statement.start].strip():
+        # Follows other code on its line; remove the statement alone
+        return statement.start, statement.end, ''
+    trailing = content[statement.end:line_end]
+    if trailing.strip():
+        # A trailing comment keeps its line
+        return start, statement.end + len(trailing) - len(trailing.lstrip()), ''
+
+    end = min(line_end + 1, len(content))
+    next_end = content.find('\n', end)
+    blank_before = start > 0 and not content[content.rfind('\n', 0, start - 1) + 1:start].strip()
+    blank_after = next_end != -1 and not content[end:next_end].strip()
+    if blank_before and blank_after:
+        end = next_end + 1
+    return start, end, ''
+
+def fix_duplicate_imports(file_path, modules: Sequence[str] = DEFAULT_MODULES, writer: Optional[OutputWriter] = None):
     """Fix duplicate React imports in a file."""
-    with open(file_path, 'r') as f:
+    with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
-    
-    # Pattern to match the duplicate import issue
-    pattern = r"import React from 'react';\n\ninterface (\w+)Props \{\n  className\?: string;\n  // Add props as needed\n\}\n\nimport React(?:, \{ (.*?) \})? from \"react\";"
-    
-    def replacer(match):
-        component_name = match.group(1)
-        imports = match.group(2)
-        if imports:
-            return f"import React, {{ {imports} }} from 'react';\n\ninterface {component_name}Props {{\n  className?: string;\n  // Add props as needed\n}}"
-        else:
-            return f"import React from 'react';\n\ninterface {component_name}Props {{\n  className?: string;\n  // Add props as needed\n}}"
-    
-    fixed_content = re.sub(pattern, replacer, content)
-    
+
+    fixed_content = normalize_imports(content, modules)
+
     if fixed_content != content:
-        with open(file_path, 'w') as f:
-            f.write(fixed_content)
-        print(f"✅ Fixed imports in: {file_path.name}")
+        (writer or OutputWriter()).write(Path(file_path), fixed_content)
+        print(f"✅ Fixed imports in: {Path(file_path).name}")
         return True
     return False
 
-# Fix all Contact components
-contact_dir = Path("packages/shared-components/src/Contact")
-fixed_count = 0
+def main():
+    """Normalize imports across the shared packages."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        default=[str(DEFAULT_TARGET)],
+        help='Files or directories to process (default: packages/)'
+    )
+    parser.add_argument(
+        '--module',
+        action='append',
+        dest='modules',
+        help=f"Module whose duplicate imports are merged (default: {', '.join(DEFAULT_MODULES)})"
+    )
+    args = parser.parse_args()
+    modules = tuple(args.modules or DEFAULT_MODULES)
+
+    files = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            files.extend(find_files(path, ('.ts', '.tsx')))
+        elif path.exists():
+            files.append(path)
+
+    writer = OutputWriter()
+    fixed_count = 0
+    for file_path in files:
+        if fix_duplicate_imports(file_path, modules, writer):
+            fixed_count += 1
 
-for file_path in contact_dir.glob("*.tsx"):
-    if fix_duplicate_imports(file_path):
-        fixed_count += 1
+    print(f"\n✨ Fixed {fixed_count} files")
 
-print(f"\n✨ Fixed {fixed_count} files")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
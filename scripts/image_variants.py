@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Image Variants - Responsive WebP/AVIF/JPEG variants for shared-assets images.
+
+Each raster image is resized to the configured widths and encoded in every
+supported format, in a process pool. Variant file names embed the source
+content hash, so an image whose bytes have not changed is never re-encoded.
+
+Encoding needs Pillow (AVIF additionally needs a Pillow build or plugin with
+AVIF support); without it the pipeline only reports what already exists.
+"""
+
+import io
+import os
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from output_writer import OutputWriter
+from parallel import map_in_pool
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import pillow_avif  # noqa: F401 - registers the AVIF plugin on older Pillow
+except ImportError:
+    pass
+
+DEFAULT_WIDTHS = (480, 960, 1440)
+DEFAULT_FORMATS = ('avif', 'webp', 'jpeg')
+RASTER_SUFFIXES = ('.png', '.jpg', '.jpeg')
+
+# Encoder settings per output format
+_SAVE_OPTIONS = {
+    'avif': {'format': 'AVIF', 'quality': 50, 'speed': 8},
+    'webp': {'format': 'WEBP', 'quality': 75, 'method': 6},
+    'jpeg': {'format': 'JPEG', 'quality': 78, 'optimize': True, 'progressive': True},
+}
+_EXTENSIONS = {'avif': '.avif', 'webp': '.webp', 'jpeg': '.jpg'}
+
+
+def supported_formats(formats: Sequence[str] = DEFAULT_FORMATS) -> List[str]:
+    """Return the requested formats the installed Pillow can encode."""
+    if Image is None:
+        return []
+    Image.init()
+    return [fmt for fmt in formats if _SAVE_OPTIONS[fmt]['format'] in Image.SAVE]
+
+def variant_widths(source_width: int, widths: Sequence[int]) -> List[int]:
+    """Target widths smaller than the source, plus the source width itself."""
+    return sorted({width for width in widths if width < source_width} | {source_width})
+
+def has_alpha(path: Path) -> bool:
+    """Check a PNG header for an alpha channel or transparency chunk."""
+    with open(path, 'rb') as f:
+        head = f.read(4096)
+    if not head.startswith(b'\x89PNG') or len(head) < 26:
+        return False
+    # Colour types 4 and 6 carry alpha; tRNS must precede the first IDAT
+    return head[25] in (4, 6) or b'tRNS' in head.split(b'IDAT', 1)[0]
+
+def encode_variants(task: Tuple[str, List[Tuple[int, str, str]]]) -> Tuple[int, str]:
+    """
+    Encode the missing variants of one source image. Runs in a pool worker.
+
+    Args:
+        task: Tuple of (source path, [(width, format, output path), ...])
+
+    Returns:
+        Tuple of (variants written, error message or '')
+    """
+    source, outputs = task
+    writer = OutputWriter()
+    written = 0
+    try:
+        with Image.open(source) as image:
+            image.load()
+            transparent = image.mode in ('RGBA', 'LA') or 'transparency' in image.info
+            resized = {}
+
+            for width, fmt, output in outputs:
+                if width not in resized:
+                    height = max(1, round(image.height * width / image.width))
+                    resized[width] = (
+                        image if width == image.width
+                        else image.resize((width, height), Image.LANCZOS)
+                    )
+
+                variant = resized[width]
+                if fmt == 'jpeg':
+                    variant = variant.convert('RGB')
+                elif variant.mode not in ('RGB', 'RGBA'):
+                    variant = variant.convert('RGBA' if transparent else 'RGB')
+
+                buffer = io.BytesIO()
+                variant.save(buffer, **_SAVE_OPTIONS[fmt])
+                writer.write_atomic(Path(output), buffer.getvalue())
+                written += 1
+    except Exception as e:
+        return written, str(e)
+
+    return written, ''
+
+
+class VariantPipeline:
+    """Plans, encodes and prunes responsive variants of indexed images."""
+
+    def __init__(
+        self,
+        package_root: Path,
+        widths: Sequence[int] = DEFAULT_WIDTHS,
+        formats: Sequence[str] = DEFAULT_FORMATS,
+        jobs: int = 1
+    ):
+        """
+        Args:
+            package_root: shared-assets package; variants go to its variants/ folder
+            widths: Target widths in pixels
+            formats: Output formats, in srcset preference order
+            jobs: Worker processes used for encoding
+        """
+        self.package_root = Path(package_root)
+        self.output_dir = self.package_root / "variants"
+        self.widths = tuple(widths)
+        self.formats = tuple(formats)
+        self.jobs = jobs
+        self.encoded = 0
+        self.errors: List[str] = []
+
+    def variant_path(self, folder: str, name: str, digest: str, width: int, fmt: str) -> Path:
+        """Output path of one variant; the source hash keeps stale outputs apart."""
+        stem = Path(name).stem
+        return self.output_dir / folder / f"{stem}.{digest[:12]}.{width}w{_EXTENSIONS[fmt]}"
+
+    def plan(self, source: Path, folder: str, entry: Dict) -> List[Tuple[int, str, Path]]:
+        """List every (width, format, path) variant of an indexed image."""
+        if not source.name.lower().endswith(RASTER_SUFFIXES) or not entry.get('width'):
+            return []
+
+        # JPEG has no alpha channel; transparent images get AVIF/WebP only
+        formats = self.formats
+        if 'jpeg' in formats and has_alpha(source):
+            formats = tuple(fmt for fmt in formats if fmt != 'jpeg')
+
+        return [
+            (width, fmt, self.variant_path(folder, source.name, entry['sha256'], width, fmt))
+            for width in variant_widths(entry['width'], self.widths)
+            for fmt in formats
+        ]
+
+    def build(self, images_dir: Path, images: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict[str, Dict[str, List]]]:
+        """
+        Encode missing variants and return what exists on disk.
+
+        Args:
+            images_dir: shared-assets images directory
+            images: Mapping of folder → file name → metadata from AssetIndex
+
+        Returns:
+            Mapping of folder → file name → format → [(width, path relative
+            to the package root), ...] for the variants present on disk
+        """
+        plans = {
+            (folder, name): self.plan(images_dir / folder / name, folder, entry)
+            for folder, files in images.items()
+            for name, entry in files.items()
+        }
+
+        encodable = set(supported_formats(self.formats))
+        tasks = []
+        for (folder, name), planned in plans.items():
+            missing = [
+                (width, fmt, str(path)) for width, fmt, path in planned
+                if fmt in encodable and not path.exists()
+            ]
+            if missing:
+                tasks.append((str(images_dir / folder / name), missing))
+
+        for (source, _), (written, error) in zip(tasks, map_in_pool(encode_variants, tasks, self.jobs)):
+            self.encoded += written
+            if error:
+                self.errors.append(f"{source}: {error}")
+
+        variants: Dict[str, Dict[str, Dict[str, List]]] = {}
+        for (folder, name), planned in plans.items():
+            for width, fmt, path in planned:
+                if path.exists():
+                    relative = path.relative_to(self.package_root).as_posix()
+                    by_format = variants.setdefault(folder, {}).setdefault(name, {})
+                    by_format.setdefault(fmt, []).append((width, relative))
+
+        self.prune(plans)
+        return variants
+
+    def prune(self, plans: Dict[Tuple[str, str], List[Tuple[int, str, Path]]]) -> int:
+        """
+        Delete variants no longer planned, e.g. of changed or removed images.
+
+        Returns:
+            Number of files deleted
+        """
+        keep = {path for planned in plans.values() for _, _, path in planned}
+        removed = 0
+        if not self.output_dir.exists():
+            return removed
+
+        with os.scandir(self.output_dir) as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+                with os.scandir(folder.path) as it:
+                    for entry in it:
+                        if entry.is_file() and Path(entry.path) not in keep:
+                            os.unlink(entry.path)
+                            removed += 1
+        return removed
+
+    def summary(self) -> str:
+        """One-line summary of encoding activity."""
+        if Image is None:
+            return "Pillow not installed; using existing variants only"
+        return f"{self.encoded} variants encoded, {len(self.errors)} errors"
+
+
+def variant_var_name(var_name: str, width: int, fmt: str) -> str:
+    """Import binding for one variant of a manifest entry."""
+    return f"{var_name}_{width}W_{fmt.upper()}"
@@ -1,35 +1,235 @@
 #!/usr/bin/env python3
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request, stream_with_context
+import argparse
+import gzip
+import hashlib
 import json
-from datetime import datetime
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 import os
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
 app = Flask(__name__)
 
+STATUS_FILE = 'learning-loop/metrics/status.json'
+
+# Parsed status.json, reloaded only when its mtime or size changes
+_status_cache = {'key': None, 'data': None, 'body': None, 'etag': None, 'last_modified': None}
+_status_lock = threading.Lock()
+
+def load_status():
+    # Cached status entry, or None if status.json is missing or invalid
+    try:
+        stat = os.stat(STATUS_FILE)
+    except OSError:
+        return None
+    
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _status_lock:
+        if _status_cache['key'] != key:
+            try:
+                with open(STATUS_FILE, 'rb') as f:
+                    data = json.load(f)
+                body = json.dumps(data).encode('utf-8')
+            except (OSError, ValueError) as e:
+                # Remember the failure too, so a broken file is parsed once per change
+                app.logger.warning('Cannot read %s: %s', STATUS_FILE, e)
+                data = body = None
+            _status_cache.update(
+                key=key,
+                data=data,
+                body=body,
+                etag=hashlib.sha1(body).hexdigest() if body else None,
+                last_modified=datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+            )
+        return dict(_status_cache) if _status_cache['body'] else None
+
 @app.route('/status')
 def status():
     # Read latest status from file (written by orchestrator)
-    try:
-        with open('learning-loop/metrics/status.json', 'r') as f:
-            status_data = json.load(f)
-    except:
+    cached = load_status()
+    if cached is None:
         status_data = {'status': 'No data available', 'timestamp': datetime.now().isoformat()}
+        return jsonify(status_data)
     
-    return jsonify(status_data)
+    response = app.response_class(cached['body'], mimetype='application/json')
+    # Weak, so the tag stays valid for the gzip and brotli encodings of the body
+    response.set_etag(cached['etag'], weak=True)
+    response.last_modified = cached['last_modified']
+    # Clients may keep the body but must revalidate; unchanged polls get a 304
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+AGENTS = {
+    'learning-curator': {'status': 'ready', 'score': 95},
+    'reiki-frontend-strategist': {'status': 'busy', 'score': 88},
+    'business-api-strategist': {'status': 'ready', 'score': 92},
+    'qa-strategist': {'status': 'ready', 'score': 90},
+    'security-strategist': {'status': 'ready', 'score': 85},
+    'infrastructure-strategist': {'status': 'ready', 'score': 87},
+    'business-domain-strategist': {'status': 'ready', 'score': 91}
+}
+
+def agent_states(status_data=None):
+    # Defaults, overlaid with any per-agent entries the orchestrator writes to status.json
+    agents_data = {name: dict(state) for name, state in AGENTS.items()}
+    reported = (status_data or {}).get('agents') if isinstance(status_data, dict) else None
+    if isinstance(reported, dict):
+        for name, state in reported.items():
+            if isinstance(state, dict):
+                agents_data.setdefault(name, {}).update(state)
+    return agents_data
 
 @app.route('/agents')
 def agents():
     # Show agent status
-    agents_data = {
-        'learning-curator': {'status': 'ready', 'score': 95},
-        'reiki-frontend-strategist': {'status': 'busy', 'score': 88},
-        'business-api-strategist': {'status': 'ready', 'score': 92},
-        'qa-strategist': {'status': 'ready', 'score': 90},
-        'security-strategist': {'status': 'ready', 'score': 85},
-        'infrastructure-strategist': {'status': 'ready', 'score': 87},
-        'business-domain-strategist': {'status': 'ready', 'score': 91}
-    }
-    return jsonify(agents_data)
+    cached = load_status()
+    return jsonify(agent_states(cached['data'] if cached else None))
+
+STREAM_POLL_INTERVAL = 0.5
+STREAM_HEARTBEAT = 15
+
+# Each open /stream holds a server thread, so subscribers are capped; serve()
+# adds this many threads on top of --threads so streams never starve /status
+MAX_STREAMS = 32
+STREAM_RETRY_AFTER = 10
+
+class StatusBroadcaster:
+    """One status.json watch loop shared by every /stream subscriber."""
+    
+    def __init__(self, max_subscribers=MAX_STREAMS):
+        self.condition = threading.Condition()
+        self.max_subscribers = max_subscribers
+        self.subscribers = 0
+        self.stopped = False
+        self.version = 0
+        self.etag = None
+        self.status = {'status': 'No data available'}
+        self.agents = agent_states()
+        self.thread = None
+    
+    def start(self):
+        with self.condition:
+            if self.thread is None:
+                self.refresh()
+                self.thread = threading.Thread(target=self.watch, name='status-watch', daemon=True)
+                self.thread.start()
+    
+    def refresh(self):
+        cached = load_status()
+        etag = cached['etag'] if cached else None
+        if etag == self.etag and self.version:
+            return
+        status_data = cached['data'] if cached else {'status': 'No data available'}
+        with self.condition:
+            self.etag = etag
+            self.status = status_data
+            self.agents = agent_states(status_data)
+            self.version += 1
+            self.condition.notify_all()
+    
+    def watch(self):
+        while True:
+            time.sleep(STREAM_POLL_INTERVAL)
+            self.refresh()
+    
+    def subscribe(self):
+        # Claim a subscriber slot; False once max_subscribers streams are open
+        with self.condition:
+            if self.subscribers >= self.max_subscribers:
+                return False
+            self.subscribers += 1
+            return True
+    
+    def unsubscribe(self):
+        with self.condition:
+            self.subscribers -= 1
+    
+    def snapshot(self):
+        with self.condition:
+            return self.version, self.status, self.agents
+    
+    def stop(self):
+        # End every open stream, so a server shutting down isn't held by its subscribers
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+    
+    def wait(self, version, timeout):
+        # Block until a version newer than the caller's, a stop, or the timeout; return the latest snapshot
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version or self.stopped, timeout)
+            return self.version, self.status, self.agents
+
+broadcaster = StatusBroadcaster()
+
+def dict_delta(old, new):
+    changed = {key: value for key, value in new.items() if old.get(key) != value}
+    removed = [key for key in old if key not in new]
+    return {'changed': changed, 'removed': removed} if changed or removed else None
+
+def sse_event(event, data, event_id=None):
+    lines = [f'event: {event}']
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+@app.route('/stream')
+def stream():
+    # Server-Sent Events: full snapshots on connect, then deltas as status.json changes
+    if not broadcaster.subscribe():
+        # Capped so open streams can't take the threads /status and /agents need
+        response = jsonify({'error': 'Too many stream subscribers', 'max_streams': broadcaster.max_subscribers})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(STREAM_RETRY_AFTER)
+        return response
+    broadcaster.start()
+    
+    def events():
+        version, status_data, agents_data = broadcaster.snapshot()
+        yield 'retry: 3000\n\n'
+        yield sse_event('status', status_data, version)
+        yield sse_event('agents', agents_data, version)
+        
+        while True:
+            latest, new_status, new_agents = broadcaster.wait(version, STREAM_HEARTBEAT)
+            if broadcaster.stopped:
+                return
+            if latest == version:
+                yield ': heartbeat\n\n'
+                continue
+            
+            version = latest
+            for event, old, new in (('status-delta', status_data, new_status), ('agents-delta', agents_data, new_agents)):
+                delta = dict_delta(old, new) if isinstance(old, dict) and isinstance(new, dict) else None
+                if delta:
+                    yield sse_event(event, delta, version)
+                elif old != new:
+                    # Not a pair of objects; send the whole value
+                    yield sse_event(event.replace('-delta', ''), new, version)
+            status_data, agents_data = new_status, new_agents
+    
+    response = Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    # Runs when the server closes the response, even if the client left before the first event
+    response.call_on_close(broadcaster.unsubscribe)
+    return response
 
 @app.route('/')
 def index():
@@ -42,9 +242,174 @@ def index():
             <li><a href="/status">System Status</a></li>
             <li><a href="/agents">Agent Status</a></li>
         </ul>
+        <p id="connection">Connecting...</p>
+        <h2>System Status</h2>
+        <pre id="status"></pre>
+        <h2>Agents</h2>
+        <pre id="agents"></pre>
+        <script>
+            const state = {status: {}, agents: {}};
+            const render = (name) => {
+                document.getElementById(name).textContent = JSON.stringify(state[name], null, 2);
+            };
+            const connect = () => {
+                const source = new EventSource('/stream');
+                for (const name of ['status', 'agents']) {
+                    source.addEventListener(name, (event) => {
+                        state[name] = JSON.parse(event.data);
+                        render(name);
+                    });
+                    source.addEventListener(name + '-delta', (event) => {
+                        const delta = JSON.parse(event.data);
+                        Object.assign(state[name], delta.changed);
+                        delta.removed.forEach((key) => delete state[name][key]);
+                        render(name);
+                    });
+                }
+                source.onopen = () => { document.getElementById('connection').textContent = 'Live'; };
+                source.onerror = () => {
+                    document.getElementById('connection').textContent = 'Reconnecting...';
+                    // EventSource gives up on an error status such as 503 (server full); retry later
+                    if (source.readyState === EventSource.CLOSED) {
+                        setTimeout(connect, 10000);
+                    }
+                };
+            };
+            connect();
+        </script>
     </body>
     </html>
     '''
 
+# JSON bodies smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 512
+
+# Compressed bodies of ETag-tagged responses, so unchanged status is compressed once
+_compressed_cache = {}
+_compressed_lock = threading.Lock()
+
+def choose_encoding():
+    if brotli is not None and request.accept_encodings['br']:
+        return 'br'
+    if request.accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+@app.after_request
+def compress_json(response):
+    if (response.mimetype != 'application/json' or response.status_code != 200
+            or response.is_streamed or 'Content-Encoding' in response.headers):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding()
+    if encoding is None:
+        return response
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_BYTES:
+        return response
+    
+    etag, _ = response.get_etag()
+    key = (etag, encoding) if etag else None
+    compressed = _compressed_cache.get(key) if key else None
+    if compressed is None:
+        if encoding == 'br':
+            compressed = brotli.compress(body, quality=5)
+        else:
+            compressed = gzip.compress(body, compresslevel=6)
+        if key:
+            with _compressed_lock:
+                if len(_compressed_cache) >= 32:
+                    _compressed_cache.clear()
+                _compressed_cache[key] = compressed
+    
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_TIMEOUT = 30
+
+def serve_threaded(host, port, threads):
+    # Fallback without waitress: Werkzeug's server with a bounded thread pool and HTTP/1.1 keep-alive
+    from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+    
+    class KeepAliveHandler(WSGIRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        timeout = KEEPALIVE_TIMEOUT
+    
+    class PooledWSGIServer(BaseWSGIServer):
+        def __init__(self):
+            super().__init__(host, port, app, handler=KeepAliveHandler)
+            self.pool = ThreadPoolExecutor(threads, thread_name_prefix='monitor')
+            self.connections = set()
+        
+        def process_request(self, request, client_address):
+            self.pool.submit(self.process_in_pool, request, client_address)
+        
+        def process_in_pool(self, request, client_address):
+            self.connections.add(request)
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.connections.discard(request)
+                self.shutdown_request(request)
+        
+        def close_connections(self):
+            # Unblock workers waiting on idle keep-alive connections, so shutdown doesn't wait them out
+            for connection in list(self.connections):
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+    
+    server = PooledWSGIServer()
+    try:
+        server.serve_forever()
+    finally:
+        server.close_connections()
+        server.server_close()
+        server.pool.shutdown(wait=False)
+
+def serve(host, port, threads, max_streams=MAX_STREAMS):
+    # Production mode: debug and reloader off, a fixed pool of request threads
+    # plus one per allowed /stream subscriber, so open dashboards can't starve /status
+    broadcaster.max_subscribers = max_streams
+    pool = threads + max_streams
+    try:
+        if waitress_serve is not None:
+            print(f'Serving on http://{host}:{port} with waitress '
+                  f'({threads} request threads + {max_streams} stream threads)')
+            waitress_serve(app, host=host, port=port, threads=pool, channel_timeout=KEEPALIVE_TIMEOUT)
+        else:
+            print(f'Serving on http://{host}:{port} with a {pool}-thread pool, {max_streams} for streams '
+                  f'(install waitress for a production server)')
+            serve_threaded(host, port, pool)
+    finally:
+        broadcaster.stop()
+
 if __name__ == '__main__':
-    app.run(debug=True, port=8080)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Autonomous orchestrator monitor')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=16,
+        help='Threads for /status, /agents and pages, on top of the stream threads (default: 16)'
+    )
+    parser.add_argument(
+        '--max-streams',
+        type=int,
+        default=MAX_STREAMS,
+        help=f'Open /stream subscribers allowed, one thread each; more get a 503 (default: {MAX_STREAMS})'
+    )
+    parser.add_argument('--debug', action='store_true', help='Run the Flask debug server with the reloader')
+    args = parser.parse_args()
+    
+    if args.debug:
+        app.run(debug=True, host=args.host, port=args.port)
+    else:
+        serve(args.host, args.port, args.threads, args.max_streams)
\ No newline at end of file
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Load test for monitor.py: requests per second and latency percentiles.
+
+Without --url the app is driven in-process through the Flask test client,
+which measures handler cost alone. With --url it runs against a live
+server over keep-alive connections, one per worker thread; --streams then
+keeps that many /stream subscribers open for the whole run, the way open
+dashboards would, so /status latency is measured with streams holding
+server threads.
+
+Examples:
+    python scripts/monitor_loadtest.py --path /status --path /agents
+    python scripts/monitor_loadtest.py --url http://127.0.0.1:8080 --concurrency 32 --conditional
+    python scripts/monitor_loadtest.py --url http://127.0.0.1:8080 --streams 40
+"""
+
+import argparse
+import http.client
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+class TestClientTransport:
+    """Issues requests to the monitor app in-process."""
+
+    def __init__(self):
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        from monitor import app
+        self.client = app.test_client()
+
+    def get(self, path: str, headers: Dict[str, str]) -> Dict:
+        response = self.client.get(path, headers=headers)
+        return {'status': response.status_code, 'etag': response.headers.get('ETag'), 'bytes': len(response.data)}
+
+    def close(self) -> None:
+        pass
+
+
+class HttpTransport:
+    """Issues requests over one persistent HTTP/1.1 connection."""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+
+    def get(self, path: str, headers: Dict[str, str]) -> Dict:
+        self.connection.request('GET', path, headers=headers)
+        response = self.connection.getresponse()
+        body = response.read()
+        if response.getheader('Connection', '').lower() == 'close':
+            self.connection.close()
+        return {'status': response.status, 'etag': response.getheader('ETag'), 'bytes': len(body)}
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class StreamSubscriber:
+    """Holds one /stream subscription open in a thread, counting its events."""
+
+    def __init__(self, url: str):
+        self.parts = urlsplit(url)
+        self.sock: Optional[socket.socket] = None
+        self.status: Optional[int] = None
+        self.events = 0
+        self.error: Optional[str] = None
+        self.connected = threading.Event()
+        self.closing = False
+        self.thread = threading.Thread(target=self.read, daemon=True)
+        self.thread.start()
+
+    def read(self) -> None:
+        try:
+            self.sock = socket.create_connection((self.parts.hostname, self.parts.port or 80), timeout=30)
+            self.sock.sendall(f"GET /stream HTTP/1.1\r\nHost: {self.parts.netloc}\r\n\r\n".encode('ascii'))
+            stream = self.sock.makefile('rb')
+            self.status = int(stream.readline().split()[1])
+            self.connected.set()
+            if self.status != 200:
+                return
+            # Every event is its own chunk, so event lines start a line even inside chunked framing
+            for line in stream:
+                if line.startswith(b'event:'):
+                    self.events += 1
+        except Exception as e:
+            if not self.closing:
+                self.error = f"{type(e).__name__}: {e}"
+        finally:
+            self.connected.set()
+
+    def close(self) -> None:
+        self.closing = True
+        if self.sock is not None:
+            try:
+                # Unblocks the reader thread; close() alone leaves it waiting on the socket
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+
+
+def open_streams(url: str, count: int, timeout: float = 10.0) -> List[StreamSubscriber]:
+    """Open count /stream subscriptions and wait until each is answered."""
+    subscribers = [StreamSubscriber(url) for _ in range(count)]
+    deadline = time.perf_counter() + timeout
+    for subscriber in subscribers:
+        subscriber.connected.wait(max(0.0, deadline - time.perf_counter()))
+    return subscribers
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+def run_load(
+    paths: List[str],
+    concurrency: int,
+    duration: float,
+    url: Optional[str] = None,
+    conditional: bool = False,
+    encoding: Optional[str] = None
+) -> Dict[str, Dict]:
+    """
+    Hammer the given paths from concurrency threads for duration seconds.
+
+    Args:
+        paths: Paths requested round-robin by every worker
+        concurrency: Worker threads, each with its own client or connection
+        duration: Seconds to run
+        url: Live server base URL, or None for the in-process test client
+        conditional: Send If-None-Match with the last ETag seen per path
+        encoding: Accept-Encoding value to send, e.g. 'gzip' or 'br'
+
+    Returns:
+        Per-path results: requests, rps, p50/p95/p99 ms, status counts, bytes
+    """
+    latencies: Dict[str, List[float]] = {path: [] for path in paths}
+    statuses: Dict[str, Dict[int, int]] = {path: {} for path in paths}
+    transferred: Dict[str, int] = {path: 0 for path in paths}
+    errors: List[str] = []
+    lock = threading.Lock()
+    start = threading.Barrier(concurrency + 1)
+    deadline = [0.0]
+
+    def worker():
+        transport = HttpTransport(url) if url else TestClientTransport()
+        local = {path: [] for path in paths}
+        local_status: Dict[str, Dict[int, int]] = {path: {} for path in paths}
+        local_bytes = {path: 0 for path in paths}
+        etags: Dict[str, str] = {}
+        start.wait()
+        index = 0
+        try:
+            while time.perf_counter() < deadline[0]:
+                path = paths[index % len(paths)]
+                index += 1
+                headers = {}
+                if encoding:
+                    headers['Accept-Encoding'] = encoding
+                if conditional and path in etags:
+                    headers['If-None-Match'] = etags[path]
+
+                began = time.perf_counter()
+                result = transport.get(path, headers)
+                local[path].append(time.perf_counter() - began)
+                local_status[path][result['status']] = local_status[path].get(result['status'], 0) + 1
+                local_bytes[path] += result['bytes']
+                if result['etag']:
+                    etags[path] = result['etag']
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {e}")
+        finally:
+            transport.close()
+
+        with lock:
+            for path in paths:
+                latencies[path].extend(local[path])
+                transferred[path] += local_bytes[path]
+                for status, count in local_status[path].items():
+                    statuses[path][status] = statuses[path].get(status, 0) + count
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    deadline[0] = time.perf_counter() + duration
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    results = {}
+    for path in paths:
+        ordered = sorted(latencies[path])
+        results[path] = {
+            'requests': len(ordered),
+            'rps': len(ordered) / elapsed if elapsed else 0.0,
+            'p50_ms': percentile(ordered, 0.50) * 1000,
+            'p95_ms': percentile(ordered, 0.95) * 1000,
+            'p99_ms': percentile(ordered, 0.99) * 1000,
+            'statuses': statuses[path],
+            'bytes': transferred[path],
+        }
+    results['errors'] = errors
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the orchestrator monitor')
+    parser.add_argument('--url', help='Base URL of a running monitor (default: in-process test client)')
+    parser.add_argument('--path', action='append', help='Path to request; repeat for several (default: /status)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent clients (default: 8)')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds to run (default: 5)')
+    parser.add_argument('--conditional', action='store_true', help='Revalidate with If-None-Match like a polling dashboard')
+    parser.add_argument('--encoding', help="Accept-Encoding to send, e.g. 'gzip' or 'br'")
+    parser.add_argument(
+        '--streams',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Keep N /stream subscribers open during the run (needs --url)'
+    )
+    args = parser.parse_args()
+    if args.streams and not args.url:
+        parser.error('--streams needs --url; the test client cannot hold streams open')
+
+    paths = args.path or ['/status']
+    target = args.url or 'in-process test client'
+    print(f"Load testing {target}: {args.concurrency} clients for {args.duration:g}s")
+
+    subscribers = open_streams(args.url, args.streams) if args.streams else []
+    if subscribers:
+        opened = sum(subscriber.status == 200 for subscriber in subscribers)
+        print(f"Holding {opened} of {args.streams} streams open "
+              f"({sum(subscriber.status == 503 for subscriber in subscribers)} refused with 503)")
+
+    try:
+        results = run_load(paths, args.concurrency, args.duration, args.url, args.conditional, args.encoding)
+    finally:
+        for subscriber in subscribers:
+            subscriber.close()
+    errors = results.pop('errors')
+    errors.extend(subscriber.error for subscriber in subscribers if subscriber.error)
+
+    print(f"\n{'Path':<16}{'Requests':>10}{'RPS':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Avg bytes':>11}  Statuses")
+    for path, result in results.items():
+        average_bytes = result['bytes'] / result['requests'] if result['requests'] else 0
+        statuses = ', '.join(f"{status}×{count}" for status, count in sorted(result['statuses'].items()))
+        print(f"{path:<16}{result['requests']:>10}{result['rps']:>10.0f}{result['p50_ms']:>10.2f}"
+              f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{average_bytes:>11.0f}  {statuses}")
+
+    if subscribers:
+        unanswered = sum(subscriber.status is None for subscriber in subscribers)
+        print(f"\nStreams: {sum(subscriber.events for subscriber in subscribers)} events received"
+              + (f", {unanswered} never answered" if unanswered else ""))
+
+    if errors:
+        print(f"\n{len(errors)} client errors, first: {errors[0]}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Output Writer - Write-only-if-changed, atomic file output for codemods.
+
+Rewriting a file with identical bytes still bumps its mtime, which sets off
+Vite HMR and invalidates vitest/TypeScript build caches. The writer
+compares against what is on disk first and leaves unchanged files alone.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from profiler import shared_profiler
+
+# Read once at import: os.umask can only be queried by setting it, which
+# is not thread-safe once the daemon's threads are running
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class OutputWriter:
+    """Writes files atomically, skipping writes that would not change them."""
+
+    def __init__(self, encoding: str = 'utf-8'):
+        self.encoding = encoding
+        self.written = 0
+        self.skipped = 0
+
+    def is_current(self, path: Path, data: bytes) -> bool:
+        """Check whether a file already holds exactly these bytes."""
+        try:
+            if os.path.getsize(path) != len(data):
+                return False
+            with open(path, 'rb') as f:
+                return f.read() == data
+        except OSError:
+            return False
+
+    def write(self, path: Path, content: str) -> bool:
+        """
+        Write content to path unless the file already matches.
+
+        Args:
+            path: Target file
+            content: Text to write
+
+        Returns:
+            True if the file was written, False if it was left untouched
+        """
+        path = Path(path)
+        data = content.encode(self.encoding)
+
+        if self.is_current(path, data):
+            self.skipped += 1
+            return False
+
+        self.write_atomic(path, data)
+        self.written += 1
+        shared_profiler.count('bytes_written', len(data))
+        return True
+
+    def write_atomic(self, path: Path, data: bytes) -> None:
+        """Write bytes via a temp file in the same directory and rename it into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if path.exists():
+                shutil.copymode(path, temp_name)
+            else:
+                # mkstemp creates 0600; new files get the mode open() would give them
+                os.chmod(temp_name, 0o666 & ~_UMASK)
+            os.replace(temp_name, path)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+
+    def record(self, written: bool) -> None:
+        """Fold in the outcome of a write performed by another process."""
+        if written:
+            self.written += 1
+        else:
+            self.skipped += 1
+
+    def summary(self) -> str:
+        """One-line summary of write activity."""
+        return f"{self.written} written, {self.skipped} unchanged (skipped)"
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Parallel helpers - Process-pool fan-out for per-file codemod work.
+
+Workers only perform the per-file transform; callers consume results in
+input order so logs, reports and generated files stay deterministic.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Translate a --jobs value into a worker count (0 or None → all cores)."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def map_in_pool(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    jobs: int,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Sequence[Any] = ()
+) -> List[Any]:
+    """
+    Map a function over items, in a process pool when jobs > 1.
+
+    Args:
+        func: Module-level (picklable) function applied to each item
+        items: Work items
+        jobs: Number of worker processes
+        initializer: Optional per-worker setup function
+        initargs: Arguments passed to the initializer
+
+    Returns:
+        Results in the same order as the input items
+    """
+    items = list(items)
+
+    if jobs <= 1 or len(items) < 2:
+        if initializer:
+            initializer(*initargs)
+        return [func(item) for item in items]
+
+    workers = min(jobs, len(items))
+    chunksize = max(1, len(items) // (workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=initializer,
+        initargs=tuple(initargs)
+    ) as pool:
+        return list(pool.map(func, items, chunksize=chunksize))
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Placeholders - Tiny inline blur placeholders (LQIP) for shared-assets images.
+
+Each raster image is reduced to a few pixels and wrapped in an SVG with a
+blur filter, producing a data URI small enough to inline in the manifest.
+Results are cached by content hash, so only new or changed images are
+decoded. Without Pillow, a header-only placeholder with the image's aspect
+ratio is emitted instead, which still reserves layout space.
+"""
+
+import base64
+import io
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import quote
+
+from parallel import map_in_pool
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PLACEHOLDER_FORMAT = 2
+PLACEHOLDER_SIZE = 16
+RASTER_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+
+def _svg_data_uri(svg: str) -> str:
+    return "data:image/svg+xml," + quote(svg, safe=" =:/',")
+
+def aspect_placeholder(width: int, height: int) -> str:
+    """Header-only placeholder: an empty SVG with the image's aspect ratio."""
+    return _svg_data_uri(f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {width} {height}'/>")
+
+def render_placeholder(path: str) -> Tuple[Optional[str], str]:
+    """
+    Render a blurred placeholder for one image. Runs in a pool worker.
+
+    Returns:
+        Tuple of (data URI or None, error message or '')
+    """
+    try:
+        with Image.open(path) as image:
+            # JPEG can decode at 1/8 scale straight from the DCT coefficients
+            image.draft('RGB', (PLACEHOLDER_SIZE * 4, PLACEHOLDER_SIZE * 4))
+            image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+            image.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG', optimize=True)
+            width, height = image.size
+    except Exception as e:
+        return None, str(e)
+
+    encoded = base64.b64encode(buffer.getvalue()).decode('ascii')
+    svg = (
+        f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {width} {height}'>"
+        "<filter id='b' color-interpolation-filters='sRGB'><feGaussianBlur stdDeviation='1'/></filter>"
+        f"<image filter='url(#b)' preserveAspectRatio='none' width='100%' height='100%' "
+        f"href='data:image/png;base64,{encoded}'/></svg>"
+    )
+    return _svg_data_uri(svg), ''
+
+
+class PlaceholderCache:
+    """Persistent content-hash → placeholder map."""
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+        self.entries: Dict[str, str] = {}
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load the cache, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('format') == PLACEHOLDER_FORMAT and data.get('size') == PLACEHOLDER_SIZE:
+            self.entries = data.get('placeholders', {})
+
+    def save(self, keep: Optional[Set[str]] = None) -> None:
+        """
+        Persist the cache atomically if anything changed.
+
+        Args:
+            keep: Content hashes still in use; other entries are dropped
+        """
+        if keep is not None and set(self.entries) - keep:
+            self.entries = {digest: uri for digest, uri in self.entries.items() if digest in keep}
+            self.dirty = True
+        if not self.dirty:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'format': PLACEHOLDER_FORMAT,
+                'size': PLACEHOLDER_SIZE,
+                'placeholders': self.entries,
+            }, f, sort_keys=True)
+        os.replace(temp_path, self.cache_path)
+        self.dirty = False
+
+
+class PlaceholderGenerator:
+    """Produces placeholders for indexed images, decoding only uncached ones."""
+
+    def __init__(self, cache_path: Path, jobs: int = 1):
+        self.cache = PlaceholderCache(cache_path)
+        self.jobs = jobs
+        self.generated = 0
+        self.errors = []
+
+    def build(self, images_dir: Path, images: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict[str, str]]:
+        """
+        Return a placeholder for every raster image with known dimensions.
+
+        Args:
+            images_dir: shared-assets images directory
+            images: Mapping of folder → file name → metadata from AssetIndex
+
+        Returns:
+            Mapping of folder → file name → data URI
+        """
+        rasters = [
+            (folder, name, entry)
+            for folder, files in images.items()
+            for name, entry in sorted(files.items())
+            if name.lower().endswith(RASTER_SUFFIXES) and entry.get('width')
+        ]
+
+        if Image is not None:
+            pending = {}
+            for folder, name, entry in rasters:
+                if entry['sha256'] not in self.cache.entries:
+                    pending.setdefault(entry['sha256'], str(images_dir / folder / name))
+
+            results = map_in_pool(render_placeholder, list(pending.values()), self.jobs)
+            for (digest, path), (uri, error) in zip(pending.items(), results):
+                if uri:
+                    self.cache.entries[digest] = uri
+                    self.cache.dirty = True
+                    self.generated += 1
+                else:
+                    self.errors.append(f"{path}: {error}")
+
+            self.cache.save(keep={entry['sha256'] for _, _, entry in rasters})
+
+        placeholders: Dict[str, Dict[str, str]] = {}
+        for folder, name, entry in rasters:
+            uri = self.cache.entries.get(entry['sha256']) or aspect_placeholder(entry['width'], entry['height'])
+            placeholders.setdefault(folder, {})[name] = uri
+        return placeholders
+
+    def summary(self) -> str:
+        """One-line summary of placeholder activity."""
+        if Image is None:
+            return "Pillow not installed; using aspect-ratio placeholders"
+        return f"{self.generated} generated, {len(self.cache.entries)} cached, {len(self.errors)} errors"
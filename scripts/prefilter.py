@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Prefilter - Byte-level rejection of files that cannot match any rule.
+
+Files are memory-mapped and searched for literal tokens before any decode
+or regex work, so a file with no candidate reference costs little more
+than reading it.
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@contextmanager
+def open_mapped(file_path: Path) -> Iterator[Buffer]:
+    """
+    Map a file read-only for the duration of the block.
+
+    Empty files cannot be mapped and yield b'' instead.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
+def contains_any(buffer: Buffer, tokens: Iterable[bytes]) -> bool:
+    """Check whether a buffer contains at least one of the tokens."""
+    return any(buffer.find(token) != -1 for token in tokens)
+
+
+def file_contains_any(file_path: Path, tokens: Iterable[bytes]) -> bool:
+    """Check whether a file contains at least one of the tokens, without decoding it."""
+    with open_mapped(file_path) as view:
+        return contains_any(view, tokens)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Profiler - Opt-in phase timers, rule counters and byte counts for codemods.
+
+Instrumented code calls the shared profiler unconditionally. While it is
+disabled, phase() hands back one reusable no-op context manager and count()
+returns at once, so the cost is a method call per site. Once enabled it
+records wall time per phase, per-rule match/replace counts and handler
+time, and bytes read and written, then emits a JSON profile and a table
+sorted by time.
+
+Phase names are dotted; a nested phase (assets.rewrite.match) is also
+counted in its parent (assets.rewrite), so percentages overlap.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+DEFAULT_PROFILE = '.codemod-cache/profile.json'
+
+
+class _NullPhase:
+    """Context manager that does nothing; shared by every disabled phase."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Times one entry into a phase."""
+
+    __slots__ = ('stats', 'started')
+
+    def __init__(self, stats: List[float]):
+        self.stats = stats
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stats[0] += 1
+        self.stats[1] += time.perf_counter() - self.started
+        return False
+
+
+class Profiler:
+    """Collects phase timings and counters while enabled."""
+
+    def __init__(self):
+        self.enabled = False
+        self.started = 0.0
+        self.phases: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.rules: Dict[str, List[float]] = {}
+
+    def enable(self) -> None:
+        """Start recording, discarding anything recorded before."""
+        self.enabled = True
+        self.started = time.perf_counter()
+        self.phases.clear()
+        self.counters.clear()
+        self.rules.clear()
+
+    def disable(self) -> None:
+        """Stop recording; collected data is kept."""
+        self.enabled = False
+
+    def phase(self, name: str):
+        """Context manager timing a phase; a shared no-op while disabled."""
+        if not self.enabled:
+            return _NULL_PHASE
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = [0, 0.0]
+        return _Phase(stats)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter, e.g. files skipped or bytes_read."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def rule(self, name: str, replaced: bool, seconds: float) -> None:
+        """Record one rule match, whether it changed the text and its handler time."""
+        stats = self.rules.get(name)
+        if stats is None:
+            stats = self.rules[name] = [0, 0, 0.0]
+        stats[0] += 1
+        stats[1] += replaced
+        stats[2] += seconds
+
+    def to_json(self) -> Dict:
+        """Profile as JSON-serializable data, times in milliseconds."""
+        return {
+            'wall_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'phases': {
+                name: {'calls': int(calls), 'total_ms': round(seconds * 1000, 3)}
+                for name, (calls, seconds) in sorted(self.phases.items())
+            },
+            'rules': {
+                name: {'matched': int(matched), 'replaced': int(replaced), 'handler_ms': round(seconds * 1000, 3)}
+                for name, (matched, replaced, seconds) in sorted(self.rules.items())
+            },
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the JSON profile."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def summary(self) -> None:
+        """Print phases and rules sorted by time, then counters."""
+        profile = self.to_json()
+        wall = profile['wall_ms'] or 1.0
+
+        print("\n" + "=" * 72)
+        print(f"Profile ({profile['wall_ms']:.1f} ms wall)")
+        print("=" * 72)
+        print(f"{'Phase':<40}{'Calls':>8}{'Total ms':>12}{'% wall':>10}")
+        for name, stats in sorted(profile['phases'].items(), key=lambda item: -item[1]['total_ms']):
+            print(f"{name:<40}{stats['calls']:>8}{stats['total_ms']:>12.2f}"
+                  f"{stats['total_ms'] / wall * 100:>9.1f}%")
+
+        if profile['rules']:
+            # Rules share one regex scan; only replacement handlers are timed per rule
+            print(f"\n{'Rule':<40}{'Matched':>8}{'Replaced':>10}{'Handler ms':>12}")
+            for name, stats in sorted(profile['rules'].items(), key=lambda item: -item[1]['handler_ms']):
+                print(f"{name:<40}{stats['matched']:>8}{stats['replaced']:>10}{stats['handler_ms']:>12.2f}")
+
+        if profile['counters']:
+            print(f"\n{'Counter':<40}{'Value':>14}")
+            for name, value in profile['counters'].items():
+                print(f"{name:<40}{value:>14,}")
+
+
+# Profiler shared by every tool imported into the same process
+shared_profiler = Profiler()
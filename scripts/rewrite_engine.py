@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Rewrite Engine - Single-pass regex rewriting shared by the codemod scripts.
+
+Rules are compiled once and merged into one alternation, so a file is
+scanned a single time and the output is built in one buffer instead of
+allocating a fresh copy of the file for every ``re.sub`` pass.
+"""
+
+import hashlib
+import re
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+from prefilter import Buffer, contains_any
+from profiler import shared_profiler
+
+# Backreferences inside a replacement template (\1 or \g<1>)
+_TEMPLATE_GROUP = re.compile(r'\\(?:g<(\d+)>|(\d+))')
+
+
+def _shift_template(template: str, offset: int) -> str:
+    """Renumber a rule's template groups onto the combined pattern."""
+    return _TEMPLATE_GROUP.sub(
+        lambda m: f'\\g<{offset + int(m.group(1) or m.group(2))}>',
+        template
+    )
+
+
+class RuleMatch:
+    """
+    A rule's view of a match in the combined pattern.
+
+    Groups are numbered as in the rule's own pattern, and positions refer to
+    the whole text, so rules anchored by lookarounds see the same match they
+    would alone instead of a re-match of the matched substring.
+    """
+
+    __slots__ = ('match', 'offset', 're')
+
+    def __init__(self, match: re.Match, offset: int, regex: re.Pattern):
+        self.match = match
+        self.offset = offset
+        self.re = regex
+
+    @property
+    def string(self) -> str:
+        return self.match.string
+
+    def _index(self, group: Union[int, str]) -> Union[int, str]:
+        if isinstance(group, str):
+            if group not in self.re.groupindex:
+                raise IndexError("no such group")
+            return group
+        if not 0 <= group <= self.re.groups:
+            raise IndexError("no such group")
+        return self.offset + group
+
+    def group(self, *groups: Union[int, str]):
+        if not groups:
+            return self.match.group(self.offset)
+        values = tuple(self.match.group(self._index(group)) for group in groups)
+        return values[0] if len(values) == 1 else values
+
+    def __getitem__(self, group: Union[int, str]) -> Optional[str]:
+        return self.group(group)
+
+    def groups(self, default: Optional[str] = None) -> Tuple[Optional[str], ...]:
+        return tuple(
+            default if value is None else value
+            for value in (self.match.group(self.offset + i) for i in range(1, self.re.groups + 1))
+        )
+
+    def groupdict(self, default: Optional[str] = None) -> Dict[str, Optional[str]]:
+        return {
+            name: default if self.match.group(name) is None else self.match.group(name)
+            for name in self.re.groupindex
+        }
+
+    def start(self, group: Union[int, str] = 0) -> int:
+        return self.match.start(self._index(group))
+
+    def end(self, group: Union[int, str] = 0) -> int:
+        return self.match.end(self._index(group))
+
+    def span(self, group: Union[int, str] = 0) -> Tuple[int, int]:
+        return self.match.span(self._index(group))
+
+    def expand(self, template: str) -> str:
+        return self.match.expand(_shift_template(template, self.offset))
+
+
+Replacement = Union[str, Callable[[RuleMatch], str]]
+
+
+class RewriteRule:
+    """A single pattern → replacement rule."""
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        replacement: Replacement,
+        collapse_slashes: bool = False,
+        tokens: Sequence[bytes] = ()
+    ):
+        """
+        Args:
+            name: Identifier used in stats and reports
+            pattern: Regular expression to match
+            replacement: Template using \\1-style groups, or a callable
+                receiving a RuleMatch numbered like the rule's own pattern
+            collapse_slashes: Replace ``//`` with ``/`` in the rewritten text
+            tokens: Literal byte strings, one of which every match contains;
+                used to reject files before decoding them
+        """
+        self.name = name
+        self.pattern = pattern
+        self.replacement = replacement
+        self.collapse_slashes = collapse_slashes
+        self.tokens = tuple(tokens)
+        self.regex = re.compile(pattern)
+
+
+class RewriteEngine:
+    """Applies an ordered set of rules to text in one scan."""
+
+    def __init__(self, rules: Sequence[RewriteRule]):
+        self.rules = list(rules)
+        self._handlers: Dict[int, Tuple[RewriteRule, Callable[[re.Match], str]]] = {}
+
+        parts = []
+        group_index = 1
+        for rule in self.rules:
+            parts.append(f'({rule.pattern})')
+            self._handlers[group_index] = (rule, self._build_handler(rule, group_index))
+            group_index += 1 + rule.regex.groups
+
+        self.regex = re.compile('|'.join(parts)) if parts else None
+        self.stats: Dict[str, int] = {rule.name: 0 for rule in self.rules}
+        self.tokens = self._collect_tokens()
+        self.version = self._fingerprint()
+
+    def _collect_tokens(self) -> Optional[Tuple[bytes, ...]]:
+        """Union of rule tokens, or None if any rule cannot be prefiltered."""
+        tokens = []
+        for rule in self.rules:
+            if not rule.tokens:
+                return None
+            tokens.extend(token for token in rule.tokens if token not in tokens)
+        return tuple(tokens)
+
+    def may_match(self, buffer: Buffer) -> bool:
+        """Cheap byte-level check; False means no rule can match the buffer."""
+        return self.tokens is None or contains_any(buffer, self.tokens)
+
+    def _fingerprint(self) -> str:
+        """Hash of every rule definition, used to invalidate cached results."""
+        digest = hashlib.sha256()
+        for rule in self.rules:
+            replacement = rule.replacement
+            if callable(replacement):
+                replacement = getattr(replacement, '__qualname__', repr(replacement))
+            digest.update(f'{rule.name}\0{rule.pattern}\0{replacement}\0{rule.collapse_slashes}\0'.encode('utf-8'))
+            digest.update(b'\0'.join(rule.tokens) + b'\n')
+        return digest.hexdigest()[:16]
+
+    def _build_handler(self, rule: RewriteRule, offset: int) -> Callable[[re.Match], str]:
+        """Build the replacement function for a rule at a group offset."""
+        if callable(rule.replacement):
+            replacement = rule.replacement
+            regex = rule.regex
+
+            def expand(match: re.Match) -> str:
+                return replacement(RuleMatch(match, offset, regex))
+        else:
+            # Shift the rule's own group numbers onto the combined pattern
+            template = _shift_template(rule.replacement, offset)
+
+            def expand(match: re.Match) -> str:
+                return match.expand(template)
+
+        if rule.collapse_slashes:
+            def handler(match: re.Match) -> str:
+                return expand(match).replace('//', '/')
+            return handler
+
+        return expand
+
+    def _dispatch(self, match: re.Match) -> str:
+        rule, handler = self._handlers[match.lastindex]
+        self.stats[rule.name] += 1
+        return handler(match)
+
+    def _dispatch_profiled(self, match: re.Match) -> str:
+        rule, handler = self._handlers[match.lastindex]
+        self.stats[rule.name] += 1
+        started = time.perf_counter()
+        replacement = handler(match)
+        shared_profiler.rule(rule.name, replacement != match.group(), time.perf_counter() - started)
+        return replacement
+
+    def apply(self, content: str) -> Tuple[str, int]:
+        """
+        Rewrite content with every rule in a single pass.
+
+        Where several rules could match at the same position, the rule
+        listed first wins.
+
+        Args:
+            content: Text to rewrite
+
+        Returns:
+            Tuple of (rewritten content, number of replacements)
+        """
+        if self.regex is None:
+            return content, 0
+        if shared_profiler.enabled:
+            with shared_profiler.phase('regex.scan'):
+                return self.regex.subn(self._dispatch_profiled, content)
+        return self.regex.subn(self._dispatch, content)
+
+    def reset_stats(self) -> None:
+        """Clear per-rule replacement counters."""
+        for name in self.stats:
+            self.stats[name] = 0
+
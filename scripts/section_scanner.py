@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Section Scanner - Single-pass JSX structure index for monolithic Anima screens.
+
+Builds a line-offset index and a map of every JSX element with its nesting
+depth, so top-level <section>/<div> blocks can be located automatically
+instead of through hand-maintained line ranges.
+
+JsxScanner, the TS/TSX mode machine underneath, is shared with
+fix_comments.py.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Next character of interest in each scanner mode
+_JS_SPECIAL = re.compile(r'[/\'"`{}<]')
+_TEMPLATE_SPECIAL = re.compile(r'[\\`$]')
+_TAG_SPECIAL = re.compile(r'[/\'"{>]')
+_CHILDREN_SPECIAL = re.compile(r'[{<]')
+
+_TAG_NAME = re.compile(r'[A-Za-z][\w.:-]*')
+# TSX generic parameters, <T,>(x) or <T extends U>(x), are not tags
+_GENERIC_PARAMETERS = re.compile(r'<\s*[A-Za-z_$][\w$]*\s*(?:,|extends\s+(?!=))')
+
+# Keywords after which '/' or '<' starts an expression rather than an operator
+EXPRESSION_KEYWORDS = frozenset({
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+    'void', 'throw', 'instanceof', 'yield', 'await',
+})
+
+
+def skip_regex(text: str, i: int) -> int:
+    """Return the offset just past a regex literal (and flags) starting at i."""
+    j = i + 1
+    in_class = False
+    while j < len(text) and text[j] != '\n':
+        char = text[j]
+        if char == '\\':
+            j += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            j += 1
+            while j < len(text) and text[j].isalpha():
+                j += 1
+            return j
+        j += 1
+    return j
+
+
+class JsxElement:
+    """A JSX element and its position in the source."""
+
+    def __init__(self, tag: str, depth: int, start: int):
+        self.tag = tag
+        self.depth = depth
+        self.start = start
+        self.end = start
+        self.start_line = 0
+        self.end_line = 0
+
+    def __repr__(self) -> str:
+        return f"JsxElement({self.tag!r}, depth={self.depth}, lines={self.start_line}-{self.end_line})"
+
+
+class JsxScanner:
+    """
+    Linear TS/TSX mode machine: JS code, template literals, JSX tags and JSX
+    children, with strings, comments and regex literals skipped.
+
+    Subclasses hook element boundaries (open_element/close_element) and the
+    '/' that starts an expression (expression_slash).
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        # (start, end) of skipped comments, so lookbacks see the code before them
+        self.comments: List[Tuple[int, int]] = []
+
+    def open_element(self, tag: str, start: int) -> None:
+        """Called for each JSX element opened at start; '' for a fragment."""
+
+    def close_element(self, end: int) -> None:
+        """Called when the innermost open element ends at end."""
+
+    def expression_slash(self, i: int) -> int:
+        """Handle a '/' where an expression is expected; return the offset to resume at."""
+        return skip_regex(self.content, i)
+
+    def skip_comment(self, start: int, end: int) -> int:
+        """Record a comment span and return its end."""
+        self.comments.append((start, end))
+        return end
+
+    def _token_before(self, i: int) -> int:
+        """Offset of the last code character before i, past whitespace and comments; -1 if none."""
+        text = self.content
+        span = len(self.comments) - 1
+        j = i - 1
+        while j >= 0:
+            while span >= 0 and self.comments[span][0] > j:
+                span -= 1
+            if text[j].isspace():
+                j -= 1
+            elif span >= 0 and j < self.comments[span][1]:
+                j = self.comments[span][0] - 1
+            else:
+                return j
+        return -1
+
+    def _follows_operand(self, i: int) -> bool:
+        """
+        Decide whether the token before offset i is a value, making a '/' or
+        '<' at i an operator rather than the start of a regex or JSX tag.
+        """
+        text = self.content
+        j = self._token_before(i)
+        if j < 0:
+            return False
+
+        if text[j].isalnum() or text[j] in '_$':
+            start = j
+            while start > 0 and (text[start - 1].isalnum() or text[start - 1] in '_$'):
+                start -= 1
+            return text[start:j + 1] not in EXPRESSION_KEYWORDS
+        if text[j] in '+-' and j > 0 and text[j - 1] == text[j]:
+            # ++/-- leave the operand state as it was
+            return self._follows_operand(j - 1)
+        # Closing brackets and string ends are values; '}' ends a block
+        return text[j] in ')]\'"`'
+
+    def _is_tag_start(self, i: int) -> bool:
+        """Decide whether '<' at offset i opens a JSX tag in expression context."""
+        following = self.content[i + 1:i + 2]
+        if not (following.isalpha() or following == '>'):
+            return False
+        if _GENERIC_PARAMETERS.match(self.content, i):
+            return False
+        # Values before '<' mean a comparison or generic
+        return not self._follows_operand(i)
+
+    def _skip_string(self, i: int, quote: str, multiline: bool = False) -> int:
+        """Return the offset just past a quoted string starting at i."""
+        text = self.content
+        j = i + 1
+        while j < len(text):
+            if text[j] == '\\':
+                j += 2
+                continue
+            if text[j] == quote or (text[j] == '\n' and not multiline):
+                return j + 1
+            j += 1
+        return j
+
+    def scan(self) -> None:
+        """Walk the source once, calling the hooks as structure is found."""
+        text = self.content
+        size = len(text)
+        modes = ['js']
+        i = 0
+
+        patterns: Dict[str, re.Pattern] = {
+            'js': _JS_SPECIAL,
+            'template': _TEMPLATE_SPECIAL,
+            'tag': _TAG_SPECIAL,
+            'children': _CHILDREN_SPECIAL,
+        }
+
+        while i < size:
+            mode = modes[-1]
+            match = patterns[mode].search(text, i)
+            if match is None:
+                break
+            i = match.start()
+            char = text[i]
+
+            if mode == 'js':
+                if text.startswith('//', i):
+                    newline = text.find('\n', i)
+                    i = self.skip_comment(i, size if newline == -1 else newline + 1)
+                elif text.startswith('/*', i):
+                    close = text.find('*/', i + 2)
+                    i = self.skip_comment(i, size if close == -1 else close + 2)
+                elif char in '\'"':
+                    i = self._skip_string(i, char)
+                elif char == '`':
+                    modes.append('template')
+                    i += 1
+                elif char == '{':
+                    modes.append('js')
+                    i += 1
+                elif char == '}':
+                    if len(modes) > 1:
+                        modes.pop()
+                    i += 1
+                elif char == '/' and not self._follows_operand(i):
+                    # Regex literal (or what a subclass makes of it): '<', quotes
+                    # or braces inside don't count
+                    i = self.expression_slash(i)
+                elif char == '<' and self._is_tag_start(i):
+                    i = self._open_tag(i, modes)
+                else:
+                    i += 1
+
+            elif mode == 'template':
+                if char == '\\':
+                    i += 2
+                elif char == '`':
+                    modes.pop()
+                    i += 1
+                elif text.startswith('${', i):
+                    modes.append('js')
+                    i += 2
+                else:
+                    i += 1
+
+            elif mode == 'tag':
+                if char in '\'"':
+                    # JSX attribute strings may span lines
+                    i = self._skip_string(i, char, multiline=True)
+                elif char == '{':
+                    modes.append('js')
+                    i += 1
+                elif text.startswith('/>', i):
+                    # Self-closing element
+                    modes.pop()
+                    self.close_element(i + 2)
+                    i += 2
+                elif char == '>':
+                    modes[-1] = 'children'
+                    i += 1
+                else:
+                    i += 1
+
+            else:  # children: plain text, never code
+                if char == '{':
+                    modes.append('js')
+                    i += 1
+                elif text.startswith('</', i):
+                    close = text.find('>', i)
+                    i = size if close == -1 else close + 1
+                    modes.pop()
+                    self.close_element(i)
+                elif self._opens_child_tag(i):
+                    i = self._open_tag(i, modes)
+                else:
+                    i += 1
+
+    def _opens_child_tag(self, i: int) -> bool:
+        following = self.content[i + 1:i + 2]
+        return following.isalpha() or following == '>'
+
+    def _open_tag(self, i: int, modes: List[str]) -> int:
+        """Enter an element opened at offset i and return the offset after its name."""
+        name_match = _TAG_NAME.match(self.content, i + 1)
+        self.open_element(name_match.group() if name_match else '', i)
+
+        if name_match is None:
+            # Fragment: <>
+            modes.append('children')
+            return i + 2
+
+        modes.append('tag')
+        return name_match.end()
+
+
+class MonolithIndex(JsxScanner):
+    """Line offsets and JSX element depths of a component, built in one pass."""
+
+    def __init__(self, content: str):
+        super().__init__(content)
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', content)]
+        self.elements: List[JsxElement] = []
+        self._open: List[JsxElement] = []
+        self.scan()
+
+        for element in self.elements:
+            element.start_line = self.line_of(element.start)
+            element.end_line = self.line_of(max(element.start, element.end - 1))
+        self.elements.sort(key=lambda element: element.start)
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number containing an offset."""
+        return bisect_right(self.line_starts, offset)
+
+    def import_header(self) -> str:
+        """Return the leading import statements, parsed once for every section."""
+        header = []
+        continued = False
+
+        for line in self.content.splitlines(keepends=True):
+            stripped = line.strip()
+            if continued or stripped.startswith('import'):
+                header.append(line)
+                # Multi-line imports run until their `from '...'` clause
+                continued = not (
+                    stripped.endswith(';')
+                    or ' from ' in stripped
+                    or stripped.startswith('}')
+                    or re.match(r'import\s+[\'"]', stripped)
+                )
+            elif stripped and not stripped.startswith(('//', '/*', '*')):
+                break
+
+        return ''.join(header)
+
+    def top_level_sections(self, tags: Sequence[str] = ('section', 'div')) -> List[JsxElement]:
+        """
+        Find the direct children of the main JSX tree with one of the given tags.
+
+        The main tree is the root element spanning the most source.
+        """
+        roots = [element for element in self.elements if element.depth == 0]
+        if not roots:
+            return []
+
+        root = max(roots, key=lambda element: element.end - element.start)
+        return [
+            element for element in self.elements
+            if element.depth == 1
+            and element.tag in tags
+            and root.start < element.start
+            and element.end <= root.end
+        ]
+
+    def open_element(self, tag: str, start: int) -> None:
+        self._open.append(JsxElement(tag, len(self._open), start))
+
+    def close_element(self, end: int) -> None:
+        if self._open:
+            element = self._open.pop()
+            element.end = end
+            self.elements.append(element)
+
+def detect_sections(
+    content: str,
+    tags: Sequence[str] = ('section', 'div'),
+    index: Optional[MonolithIndex] = None
+) -> List[Dict[str, int]]:
+    """
+    Return {'start', 'end'} line ranges of the top-level sections in content.
+
+    Args:
+        content: Component source
+        tags: Element tags that count as sections
+        index: Prebuilt index of the same content, if available
+
+    Returns:
+        Line ranges (1-based, inclusive) in source order
+    """
+    index = index or MonolithIndex(content)
+    return [
+        {'start': element.start_line, 'end': element.end_line}
+        for element in index.top_level_sections(tags)
+    ]
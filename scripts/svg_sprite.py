@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+SVG Sprite - Conservative SVG minification and icon <symbol> sprite sheets.
+
+Minification drops what browsers ignore (XML declarations, comments, editor
+metadata, whitespace between tags) and trims path coordinates to a fixed
+precision. Small icons are then bundled into one sprite of <symbol>
+elements, so a page fetches one file instead of one request per icon.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from asset_metadata import read_image_size
+
+# Icons are small, self-contained SVGs; larger ones stay standalone files
+ICON_MAX_SIZE = 64
+ICON_MAX_BYTES = 16 * 1024
+COORDINATE_PRECISION = 3
+
+_XML_DECLARATION = re.compile(r'<\?xml.*?\?>', re.DOTALL)
+_DOCTYPE = re.compile(r'<!DOCTYPE[^>]*>', re.IGNORECASE)
+_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_METADATA = re.compile(r'<(metadata|sodipodi:namedview|title|desc)\b[^>]*?(?:/>|>.*?</\1>)', re.DOTALL)
+_EDITOR_ATTRIBUTE = re.compile(r'\s(?:xmlns:)?(?:inkscape|sodipodi|sketch|serif)(?::[\w-]+)?="[^"]*"')
+_BETWEEN_TAGS = re.compile(r'>\s+<')
+_GEOMETRY_ATTRIBUTE = re.compile(r'(\s(?:d|points)=")([^"]*)(")')
+# One number of path/points grammar; compact paths run numbers together, as in M1.5.5-2
+_NUMBER = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_ATTRIBUTE_WHITESPACE = re.compile(r'="([^"]*)"')
+
+_ROOT_TAG = re.compile(r'<svg\b([^>]*)>', re.DOTALL)
+_ATTRIBUTE = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"')
+_ID = re.compile(r'\sid="([^"]+)"')
+# Root attributes that do not belong on a <symbol>
+_ROOT_ONLY = {'width', 'height', 'x', 'y', 'version', 'xmlns', 'xmlns:xlink', 'viewBox'}
+
+
+def _round_number(number: str) -> str:
+    value = float(number)
+    text = f"{value:.{COORDINATE_PRECISION}f}".rstrip('0').rstrip('.')
+    if text in ('-0', ''):
+        return '0'
+    # Path grammar allows numbers without a leading zero
+    if text.startswith('0.'):
+        return text[1:]
+    if text.startswith('-0.'):
+        return '-' + text[2:]
+    return text
+
+def round_numbers(value: str) -> str:
+    """
+    Round the numbers in a d or points value, keeping adjacent numbers apart.
+
+    Rounding can drop a decimal point ('1.9999' → '2') or turn '.99999'
+    into '1'; a space is inserted wherever the next number would otherwise
+    be read as part of the previous one. Integers (including arc flags
+    written together, as in '011') are left as written.
+    """
+    parts = []
+    position = 0
+    previous = None
+    for match in _NUMBER.finditer(value):
+        token = match.group()
+        text = _round_number(token) if '.' in token or 'e' in token or 'E' in token else token
+        if previous is not None and match.start() == position:
+            merges = text[0].isdigit() or (
+                text[0] == '.' and '.' not in previous and 'e' not in previous
+            )
+            if merges:
+                parts.append(' ')
+        else:
+            parts.append(value[position:match.start()])
+        parts.append(text)
+        previous = text
+        position = match.end()
+    parts.append(value[position:])
+    return ''.join(parts)
+
+def minify_svg(svg: str) -> str:
+    """
+    Minify SVG markup without changing how it renders.
+
+    Whitespace between tags is only removed when the file has no text
+    elements, where it could be significant.
+    """
+    svg = _XML_DECLARATION.sub('', svg)
+    svg = _DOCTYPE.sub('', svg)
+    svg = _COMMENT.sub('', svg)
+    svg = _METADATA.sub('', svg)
+    svg = _EDITOR_ATTRIBUTE.sub('', svg)
+    svg = _GEOMETRY_ATTRIBUTE.sub(
+        lambda m: m.group(1) + round_numbers(m.group(2)) + m.group(3),
+        svg
+    )
+    svg = _ATTRIBUTE_WHITESPACE.sub(lambda m: '="' + ' '.join(m.group(1).split()) + '"', svg)
+    if '<text' not in svg:
+        svg = _BETWEEN_TAGS.sub('><', svg)
+    return svg.strip()
+
+def symbol_id(name: str) -> str:
+    """Sprite symbol ID for an icon file name, e.g. ic_baseline-phone.svg → ic-baseline-phone."""
+    return re.sub(r'[^a-z0-9]+', '-', Path(name).stem.lower()).strip('-')
+
+def icon_export_name(icon_id: str) -> str:
+    """Manifest key for a symbol ID."""
+    name = icon_id.replace('-', '_').upper()
+    return name if not name[:1].isdigit() else f"ICON_{name}"
+
+def is_icon(path: Path, max_size: int = ICON_MAX_SIZE) -> bool:
+    """Check whether an SVG is small enough, in bytes and pixels, to be an icon."""
+    if path.stat().st_size > ICON_MAX_BYTES:
+        return False
+    size = read_image_size(path)
+    return size is not None and max(size) <= max_size
+
+def collect_icons(directories: Iterable[Path], max_size: int = ICON_MAX_SIZE) -> List[Path]:
+    """Icon-sized SVG files directly inside the given directories, in name order."""
+    icons = []
+    for directory in directories:
+        if directory.is_dir():
+            icons.extend(
+                path for path in sorted(directory.glob('*.svg'))
+                if is_icon(path, max_size)
+            )
+    return icons
+
+
+class SvgSprite:
+    """Builds a <symbol> sprite sheet from standalone SVG icons."""
+
+    def __init__(self):
+        self.symbols: List[str] = []
+        self.ids: Dict[str, str] = {}
+        self.needs_xlink = False
+
+    def add(self, name: str, svg: str) -> Optional[str]:
+        """
+        Add an icon as a <symbol>.
+
+        Internal IDs (masks, clip paths, gradients) are prefixed with the
+        symbol ID so icons cannot clash inside one document; IDs nothing
+        refers to, such as design-tool layer names, are dropped.
+
+        Returns:
+            The symbol ID, or None if the file has no root <svg> element
+        """
+        svg = minify_svg(svg)
+        root = _ROOT_TAG.search(svg)
+        close = svg.rfind('</svg>')
+        if root is None or close < root.end():
+            return None
+
+        icon_id = symbol_id(name)
+        if icon_id in self.ids.values():
+            icon_id = f"{icon_id}-{len(self.symbols)}"
+
+        attributes = dict(_ATTRIBUTE.findall(root.group(1)))
+        view_box = attributes.get('viewBox')
+        if not view_box and 'width' in attributes and 'height' in attributes:
+            view_box = f"0 0 {attributes['width']} {attributes['height']}"
+
+        inner = svg[root.end():close]
+        for internal_id in set(_ID.findall(inner)):
+            if f'#{internal_id}' not in inner:
+                inner = inner.replace(f' id="{internal_id}"', '')
+                continue
+            prefixed = f"{icon_id}-{internal_id}"
+            inner = inner.replace(f'id="{internal_id}"', f'id="{prefixed}"')
+            inner = inner.replace(f'url(#{internal_id})', f'url(#{prefixed})')
+            inner = inner.replace(f'href="#{internal_id}"', f'href="#{prefixed}"')
+        self.needs_xlink = self.needs_xlink or 'xlink:' in inner
+
+        symbol_attributes = [f'id="{icon_id}"']
+        if view_box:
+            symbol_attributes.append(f'viewBox="{view_box}"')
+        symbol_attributes += [
+            f'{key}="{value}"' for key, value in attributes.items()
+            if key not in _ROOT_ONLY and not key.startswith('xmlns:')
+        ]
+
+        self.symbols.append(f"<symbol {' '.join(symbol_attributes)}>{inner}</symbol>")
+        self.ids[name] = icon_id
+        return icon_id
+
+    def render(self) -> str:
+        """Sprite document; reference a symbol as sprite.svg#<id>."""
+        namespaces = 'xmlns="http://www.w3.org/2000/svg"'
+        if self.needs_xlink:
+            namespaces += ' xmlns:xlink="http://www.w3.org/1999/xlink"'
+        return f"<svg {namespaces}>{''.join(self.symbols)}</svg>\n"
+
+
+def build_sprite(icons: Iterable[Path]) -> Tuple[SvgSprite, int]:
+    """
+    Bundle icon files into a sprite.
+
+    Returns:
+        Tuple of (sprite, total bytes of the source files)
+    """
+    sprite = SvgSprite()
+    source_bytes = 0
+    for path in icons:
+        svg = path.read_text(encoding='utf-8')
+        source_bytes += len(svg.encode('utf-8'))
+        sprite.add(path.name, svg)
+    return sprite, source_bytes
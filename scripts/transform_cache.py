@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Transform Cache - Content-addressed on-disk memoization for codemod transforms.
+
+Entries are keyed on a hash of the input, its parameters and the
+transformer version, and evicted least-recently-used once the cache grows
+past its size bound. Long-running processes can also keep recent results
+in memory.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+from output_writer import OutputWriter
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class TransformCache:
+    """Size-bounded LRU cache of transform results stored as files."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        version: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        memory_items: int = 0
+    ):
+        """
+        Args:
+            cache_dir: Directory holding cache entries
+            version: Transformer version; changing it invalidates every entry
+            max_bytes: Size bound enforced by prune()
+            memory_items: Recent results also kept in memory (0 disables)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.hits = 0
+        self.misses = 0
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._writer = OutputWriter()
+
+    def key(self, content: str, *params: object) -> str:
+        """Build the cache key for an input and its parameters."""
+        digest = hashlib.sha256()
+        digest.update(self.version.encode('utf-8'))
+        for param in params:
+            digest.update(b'\0' + repr(param).encode('utf-8'))
+        digest.update(b'\0' + content.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key[2:]
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached result, marking it recently used, or None on a miss."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        value = data.decode('utf-8')
+        self._remember(key, value)
+        return value
+
+    def _remember(self, key: str, value: str) -> None:
+        if self.memory_items <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def put(self, key: str, value: str) -> None:
+        """Store a result; failures only cost a future cache miss."""
+        self._remember(key, value)
+        try:
+            self._writer.write_atomic(self._entry_path(key), value.encode('utf-8'))
+        except OSError:
+            pass
+
+    def _entries(self) -> Iterable[os.DirEntry]:
+        try:
+            shards = list(os.scandir(self.cache_dir))
+        except OSError:
+            return
+        for shard in shards:
+            if shard.is_dir(follow_symlinks=False):
+                with os.scandir(shard.path) as it:
+                    yield from (entry for entry in it if entry.is_file(follow_symlinks=False))
+
+    def prune(self) -> int:
+        """
+        Evict least-recently-used entries until the cache fits its bound.
+
+        Returns:
+            Number of entries evicted
+        """
+        entries = []
+        total = 0
+        for entry in self._entries():
+            stat = entry.stat(follow_symlinks=False)
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total += stat.st_size
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        return evicted
+
+    def summary(self) -> str:
+        """One-line summary of cache activity."""
+        return f"{self.hits} hits, {self.misses} misses"
@@ -1,23 +1,409 @@
 #!/usr/bin/env python3
 """Update all asset paths in components to use shared-assets package."""
 
-import re
+import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+from asset_metadata import AssetIndex
+from file_index import find_files, shared_index
+from file_state import FileStateCache, hash_bytes
+from file_watcher import watch
+from image_variants import DEFAULT_WIDTHS, VariantPipeline, variant_var_name
+from output_writer import OutputWriter
+from parallel import map_in_pool, resolve_jobs
+from placeholders import PlaceholderGenerator
+from prefilter import open_mapped
+from profiler import DEFAULT_PROFILE, shared_profiler
+from rewrite_engine import RewriteEngine, RewriteRule
+from svg_sprite import build_sprite, collect_icons, icon_export_name, minify_svg
+
+DEFAULT_STATE_FILE = '.codemod-cache/asset-paths.json'
+DEFAULT_ASSET_INDEX = '.codemod-cache/asset-index.json'
+DEFAULT_PLACEHOLDER_CACHE = '.codemod-cache/placeholders.json'
+
+# Reference prefixes of apps/main/public/img and the shared-assets package
+PUBLIC_IMAGE_PREFIX = '/img/'
+SHARED_IMAGE_PREFIX = '@reiki-goddess/shared-assets/images/'
+
+# shared-assets/images folders included in the manifest
+MANIFEST_FOLDERS = ['contact', 'about', 'home', 'blog']
+
+# Standalone icons bundled into the shared-assets sprite
+ICON_DIRS = ['apps/main/public/images', 'apps/main/public/img']
+SPRITE_PATH = 'packages/shared-assets/icons/sprite.svg'
+
+
+def build_asset_rules(page_folder: str) -> List[RewriteRule]:
+    """Rewrite rules mapping /img/ references into a shared-assets page folder."""
+    target = f'{SHARED_IMAGE_PREFIX}{page_folder}/'
+    return [
+        # Image src attributes
+        RewriteRule(
+            'img-src',
+            r'src="\/img\/(.*?)"',
+            f'src={{require("{target}\\1")}}',
+            collapse_slashes=True,
+            tokens=(b'/img/',)
+        ),
+        # CSS background URLs
+        RewriteRule(
+            'bg-url',
+            r'bg-\[url\(\/img\/(.*?)\)\]',
+            f'bg-[url({target}\\1)]',
+            collapse_slashes=True,
+            tokens=(b'/img/',)
+        ),
+        # Any remaining /img/ references
+        RewriteRule(
+            'img-ref',
+            r'\/img\/(.*?)(["\'`])',
+            f'{target}\\1\\2',
+            collapse_slashes=True,
+            tokens=(b'/img/',)
+        ),
+    ]
+
+# Compiled engines per page folder, shared by the updater and pool workers
+_ENGINES: Dict[str, RewriteEngine] = {}
+
+def get_asset_engine(page_folder: str) -> RewriteEngine:
+    """Return the compiled rewrite engine for a page folder."""
+    engine = _ENGINES.get(page_folder)
+    if engine is None:
+        engine = RewriteEngine(build_asset_rules(page_folder))
+        _ENGINES[page_folder] = engine
+    return engine
+
+def rewrite_asset_file(task: Tuple[str, str, Optional[str], bool]) -> Dict:
+    """
+    Rewrite asset paths in one file. Runs in the parent or a pool worker.
+    
+    Args:
+        task: Tuple of (file path, page folder, content hash recorded for
+            the current rules or None, whether to hash the content)
+    
+    Returns:
+        Dict with 'updated', 'unchanged', 'digest', 'bytes_read',
+        'bytes_written' and 'error' keys
+    """
+    file_path, page_folder, known_digest, track_digest = task
+    result = {
+        'updated': False, 'unchanged': False, 'digest': None,
+        'bytes_read': 0, 'bytes_written': 0, 'error': None
+    }
+    
+    try:
+        engine = get_asset_engine(page_folder)
+        
+        with shared_profiler.phase('assets.read'), open_mapped(file_path) as view:
+            result['bytes_read'] = len(view)
+            if track_digest:
+                result['digest'] = hash_bytes(view)
+                if result['digest'] == known_digest:
+                    # Touched but not modified - nothing to rewrite
+                    result['unchanged'] = True
+                    return result
+            
+            # Most files hold no /img/ reference; reject them before decoding
+            if not engine.may_match(view):
+                return result
+            
+            data = bytes(view)
+        
+        # Rewrite src attributes, CSS background URLs and any remaining
+        # /img/ references in a single pass
+        with shared_profiler.phase('assets.match'):
+            content, replaced = engine.apply(data.decode('utf-8'))
+        
+        if replaced:
+            data = content.encode('utf-8')
+            with shared_profiler.phase('assets.write'):
+                with open(file_path, 'wb') as f:
+                    f.write(data)
+            result['updated'] = True
+            result['bytes_written'] = len(data)
+            if track_digest:
+                result['digest'] = hash_bytes(data)
+    
+    except Exception as e:
+        result['error'] = str(e)
+    
+    return result
+
+def manifest_var_name(folder: str, file: str) -> str:
+    """Export name for an image in the manifest."""
+    var_name = file.replace('-', '_').replace('.', '_').upper()
+    return f"{folder.upper()}_{var_name}"
+
+def render_srcset(var_name: str, by_format: Dict[str, List], reference) -> List[str]:
+    """
+    Render one manifest entry of the srcset table.
+    
+    Args:
+        var_name: Manifest export name of the source image
+        by_format: Format → [(width, path), ...] from VariantPipeline.build
+        reference: Callable (width, format, path) → JS expression for the URL
+    
+    Returns:
+        Lines of the object literal entry
+    """
+    lines = [f"  {var_name}: {{"]
+    for fmt, variants in by_format.items():
+        candidates = ', '.join(
+            f"${{{reference(width, fmt, path)}}} {width}w" for width, path in sorted(variants)
+        )
+        lines.append(f"    {fmt}: `{candidates}`,")
+    lines.append("  },")
+    return lines
+
+def render_icons(icons: Dict[str, str], sprite_export: str) -> List[str]:
+    """
+    Render the sprite export and symbol ID table.
+    
+    Args:
+        icons: Manifest key → sprite symbol ID
+        sprite_export: Statement exporting the sprite URL as ICON_SPRITE
+    """
+    return [
+        "// Icon sprite: <svg><use href={`${ICON_SPRITE}#${ICONS.NAME}`} /></svg>",
+        sprite_export,
+        "export const ICONS = {",
+        *(f'  {key}: "{icon_id}",' for key, icon_id in sorted(icons.items())),
+        "} as const;",
+        "",
+    ]
+
+def render_placeholders(export: str, folders: Dict[str, Dict[str, str]]) -> List[str]:
+    """
+    Render a table of blur placeholders keyed like the image exports.
+    
+    Args:
+        export: Name of the exported constant
+        folders: Folder → file name → data URI from PlaceholderGenerator.build
+    """
+    return [
+        "// Inline blur placeholders (LQIP), shown until the image loads",
+        f"export const {export} = {{",
+        *(
+            f'  {manifest_var_name(folder, file)}: "{uri}",'
+            for folder, files in folders.items()
+            for file, uri in sorted(files.items())
+        ),
+        "} as const;",
+        "",
+    ]
+
+def render_manifest(
+    images: Dict[str, Dict[str, Dict]],
+    variants: Optional[Dict] = None,
+    icons: Optional[Dict[str, str]] = None,
+    placeholders: Optional[Dict[str, Dict[str, str]]] = None
+) -> str:
+    """
+    Render images.ts from indexed folder metadata.
+    
+    Args:
+        images: Mapping of folder → file name → metadata from AssetIndex
+        variants: Responsive variants from VariantPipeline.build, if generated
+        icons: Manifest key → sprite symbol ID, if a sprite was built
+        placeholders: Blur placeholders from PlaceholderGenerator.build, if generated
+    
+    Returns:
+        Manifest source
+    """
+    manifest_content = """/**
+ * Asset manifest for shared-assets package
+ * Auto-generated - do not edit manually
+ */
+
+"""
+    
+    dimensions = []
+    for folder, files in images.items():
+        manifest_content += f"// {folder.capitalize()} page assets\n"
+        for file in sorted(files):
+            var_name = manifest_var_name(folder, file)
+            manifest_content += f"export const {var_name} = require('../images/{folder}/{file}');\n"
+            entry = files[file]
+            if entry.get('width') and entry.get('height'):
+                dimensions.append(f"  {var_name}: {{ width: {entry['width']}, height: {entry['height']} }},\n")
+        manifest_content += "\n"
+    
+    manifest_content += "// Intrinsic image dimensions, for reserving layout space\n"
+    manifest_content += "export const IMAGE_DIMENSIONS = {\n"
+    manifest_content += ''.join(dimensions)
+    manifest_content += "} as const;\n"
+    
+    if variants is not None:
+        srcset = []
+        for folder, files in variants.items():
+            for file in sorted(files):
+                srcset += render_srcset(
+                    manifest_var_name(folder, file),
+                    files[file],
+                    lambda width, fmt, path: f"require('../{path}')"
+                )
+        manifest_content += "\n// Responsive variants: format → srcset\n"
+        manifest_content += "export const IMAGE_SRCSET = {\n"
+        manifest_content += ''.join(line + "\n" for line in srcset)
+        manifest_content += "} as const;\n"
+    
+    if placeholders is not None:
+        manifest_content += "\n" + "\n".join(render_placeholders("IMAGE_PLACEHOLDERS", placeholders))
+    
+    if icons is not None:
+        sprite = SPRITE_PATH.split('/', 2)[2]
+        manifest_content += "\n" + "\n".join(
+            render_icons(icons, f"export const ICON_SPRITE = require('../{sprite}');")
+        )
+    
+    return manifest_content
+
+def render_page_manifest(
+    folder: str,
+    files: Dict[str, Dict],
+    variants: Optional[Dict] = None,
+    placeholders: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Render one page folder's manifest module for split mode.
+    
+    Static ESM re-exports let the bundler drop any image a page never uses.
+    
+    Args:
+        folder: Page folder name
+        files: File name → metadata from AssetIndex
+        variants: This folder's variants from VariantPipeline.build, if generated
+        placeholders: This folder's file name → placeholder data URI, if generated
+    """
+    lines = [
+        "/**",
+        f" * {folder.capitalize()} page assets",
+        " * Auto-generated - do not edit manually",
+        " */",
+        "",
+    ]
+    
+    dimensions = []
+    for file in sorted(files):
+        var_name = manifest_var_name(folder, file)
+        lines.append(f'export {{ default as {var_name} }} from "../../images/{folder}/{file}";')
+        entry = files[file]
+        if entry.get('width') and entry.get('height'):
+            dimensions.append(f"  {var_name}: {{ width: {entry['width']}, height: {entry['height']} }},")
+    
+    lines += [
+        "",
+        "// Intrinsic image dimensions, for reserving layout space",
+        f"export const {folder.upper()}_IMAGE_DIMENSIONS = {{",
+        *dimensions,
+        "} as const;",
+        "",
+    ]
+    
+    if variants is not None:
+        imports = []
+        srcset = []
+        for file in sorted(variants):
+            var_name = manifest_var_name(folder, file)
+            for fmt, entries in variants[file].items():
+                for width, path in sorted(entries):
+                    imports.append(
+                        f'import {variant_var_name(var_name, width, fmt)} from "../../{path}";'
+                    )
+            srcset += render_srcset(
+                var_name,
+                variants[file],
+                lambda width, fmt, path, var_name=var_name: variant_var_name(var_name, width, fmt)
+            )
+        
+        # Imports must precede the exports above
+        lines[5:5] = imports + ([""] if imports else [])
+        lines += [
+            "// Responsive variants: format → srcset",
+            f"export const {folder.upper()}_IMAGE_SRCSET = {{",
+            *srcset,
+            "} as const;",
+            "",
+        ]
+    
+    if placeholders is not None:
+        lines += render_placeholders(f"{folder.upper()}_IMAGE_PLACEHOLDERS", {folder: placeholders})
+    
+    return "\n".join(lines)
+
+def render_icon_manifest(icons: Dict[str, str]) -> str:
+    """Render the icons module for split mode."""
+    sprite = SPRITE_PATH.split('/', 2)[2]
+    lines = [
+        "/**",
+        " * Icon sprite",
+        " * Auto-generated - do not edit manually",
+        " */",
+        "",
+        *render_icons(icons, f'export {{ default as ICON_SPRITE }} from "../../{sprite}";'),
+    ]
+    return "\n".join(lines)
+
+def render_lazy_index(folders: List[str], icons: bool = False) -> str:
+    """
+    Render images.ts for split mode: lazy loaders only, no static imports.
+    
+    Pages import their own module directly, e.g.
+    `@reiki-goddess/shared-assets/src/manifest/home`, so no page chunk
+    carries another page's asset references.
+    """
+    lines = [
+        "/**",
+        " * Asset manifest for shared-assets package",
+        " * Auto-generated - do not edit manually",
+        " *",
+        " * Each page's assets live in ./manifest/<page>.ts. Import that module",
+        " * directly for static use, or load it on demand with the accessors below.",
+        " */",
+        "",
+    ]
+    for folder in folders:
+        lines.append(
+            f"export const load{folder.capitalize()}Images = () => import(\"./manifest/{folder}\");"
+        )
+    if icons:
+        lines.append('export const loadIcons = () => import("./manifest/icons");')
+    lines.append("")
+    return "\n".join(lines)
 
 class AssetPathUpdater:
     """Updates asset paths to use the shared-assets package."""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(
+        self,
+        project_root: str = ".",
+        state_file: Optional[str] = DEFAULT_STATE_FILE,
+        jobs: int = 1
+    ):
+        """
+        Args:
+            project_root: Repository root
+            state_file: Incremental state file relative to the root, or None
+                to process every file on every run
+            jobs: Worker processes used by update_directory
+        """
         self.project_root = Path(project_root).resolve()
         self.updates = []
+        self.skipped = 0
+        self.jobs = jobs
+        self.state = (
+            FileStateCache(self.project_root / state_file, self.project_root)
+            if state_file else None
+        )
         
         # Map original paths to new shared-assets paths
         self.path_mappings = {
-            '/img/': '@reiki-goddess/shared-assets/images/',
-            '/static/img/': '@reiki-goddess/shared-assets/images/',
-            '../static/img/': '@reiki-goddess/shared-assets/images/',
-            './static/img/': '@reiki-goddess/shared-assets/images/',
+            PUBLIC_IMAGE_PREFIX: SHARED_IMAGE_PREFIX,
+            '/static/img/': SHARED_IMAGE_PREFIX,
+            '../static/img/': SHARED_IMAGE_PREFIX,
+            './static/img/': SHARED_IMAGE_PREFIX,
         }
         
         # Map page names to asset folders
@@ -30,54 +416,53 @@ class AssetPathUpdater:
     
     def update_file(self, file_path: Path) -> bool:
         """Update asset paths in a single file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            original = content
-            
-            # Determine which page folder to use based on component location
-            page_folder = self.detect_page_folder(file_path)
-            
-            # Update image src attributes
-            content = re.sub(
-                r'src="\/img\/(.*?)"',
-                f'src={{require("@reiki-goddess/shared-assets/images/{page_folder}/\\1")}}',
-                content
-            )
-            
-            # Update CSS background URLs
-            content = re.sub(
-                r'bg-\[url\(\/img\/(.*?)\)\]',
-                f'bg-[url(@reiki-goddess/shared-assets/images/{page_folder}/\\1)]',
-                content
-            )
-            
-            # Update any remaining /img/ references
-            content = re.sub(
-                r'\/img\/(.*?)(["\'`])',
-                f'@reiki-goddess/shared-assets/images/{page_folder}/\\1\\2',
-                content
-            )
-            
-            # Fix any double slashes
-            content = re.sub(r'\/\/', '/', content)
-            
-            if content != original:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                self.updates.append({
-                    'file': str(file_path.relative_to(self.project_root)),
-                    'page_folder': page_folder
-                })
-                return True
-            
+        return self._apply_result(file_path, rewrite_asset_file(self._make_task(file_path)))
+    
+    def _make_task(self, file_path: Path) -> Tuple[str, str, Optional[str], bool]:
+        """Build the worker task for a file."""
+        # Determine which page folder to use based on component location
+        page_folder = self.detect_page_folder(file_path)
+        known_digest = None
+        if self.state:
+            known_digest = self.state.known_digest(file_path, self.get_engine(page_folder).version)
+        return (str(file_path), page_folder, known_digest, self.state is not None)
+    
+    def _apply_result(self, file_path: Path, result: Dict) -> bool:
+        """Record a worker result in the update list and incremental state."""
+        if result['error']:
+            print(f"❌ Error updating {file_path}: {result['error']}")
             return False
-            
-        except Exception as e:
-            print(f"❌ Error updating {file_path}: {e}")
+        
+        # Workers cannot reach the parent's profiler; byte counts travel in the result
+        shared_profiler.count('files_read')
+        shared_profiler.count('files_rewritten', result['updated'])
+        shared_profiler.count('bytes_read', result['bytes_read'])
+        shared_profiler.count('bytes_written', result['bytes_written'])
+        
+        page_folder = self.detect_page_folder(file_path)
+        
+        if result['updated']:
+            self.updates.append({
+                'file': str(file_path.relative_to(self.project_root)),
+                'page_folder': page_folder
+            })
+        
+        if self.state:
+            self.state.record(file_path, result['digest'], self.get_engine(page_folder).version)
+        
+        return result['updated']
+    
+    def is_unchanged(self, file_path: Path) -> bool:
+        """Check the incremental state to see if a file can be skipped unread."""
+        if not self.state:
             return False
+        
+        engine = self.get_engine(self.detect_page_folder(file_path))
+        return self.state.is_fresh(file_path, file_path.stat(), engine.version)
+    
+    def get_engine(self, page_folder: str) -> RewriteEngine:
+        """Return the compiled rewrite engine for a page folder."""
+        return get_asset_engine(page_folder)
     
     def detect_page_folder(self, file_path: Path) -> str:
         """Detect which page folder to use for assets based on file path."""
@@ -92,57 +477,215 @@ class AssetPathUpdater:
     
     def update_directory(self, directory: Path) -> int:
         """Update all TypeScript/React files in a directory."""
-        updated_count = 0
+        directory = self.project_root / directory
+        with shared_profiler.phase('assets.discover'):
+            # Single pruned walk; index files are skipped
+            candidates = find_files(directory, ('.tsx', '.ts'), exclude_names=('index.ts',))
+            
+            pending = []
+            for file_path in candidates:
+                if self.is_unchanged(file_path):
+                    self.skipped += 1
+                else:
+                    pending.append(file_path)
+            
+            # The walk saw every file here; entries for deleted or renamed files go
+            if self.state:
+                self.state.prune(candidates, directory)
+        shared_profiler.count('files_skipped_by_state', len(candidates) - len(pending))
         
-        for file_path in directory.rglob("*.tsx"):
-            if self.update_file(file_path):
+        # Workers only rewrite files; results are applied here in discovery
+        # order so the update list and report stay deterministic
+        with shared_profiler.phase('assets.rewrite'):
+            results = map_in_pool(
+                rewrite_asset_file,
+                [self._make_task(file_path) for file_path in pending],
+                self.jobs
+            )
+        
+        updated_count = 0
+        for file_path, result in zip(pending, results):
+            if self._apply_result(file_path, result):
                 updated_count += 1
                 print(f"✅ Updated: {file_path.relative_to(self.project_root)}")
         
-        for file_path in directory.rglob("*.ts"):
-            if 'index.ts' not in str(file_path):  # Skip index files
-                if self.update_file(file_path):
-                    updated_count += 1
-                    print(f"✅ Updated: {file_path.relative_to(self.project_root)}")
+        if self.state:
+            with shared_profiler.phase('assets.state_save'):
+                self.state.save()
         
         return updated_count
     
-    def create_asset_manifest(self) -> None:
-        """Create or update the asset manifest file."""
-        manifest_path = self.project_root / "packages/shared-assets/src/images.ts"
+    def handle_changes(self, changed: Set[Path], components_dir: Path, manifest_options: Dict) -> None:
+        """
+        Reprocess only what a batch of watched changes affects.
+        
+        Changed component files go through the incremental per-file path;
+        any change under shared-assets images regenerates the manifest.
         
-        # Scan for all images in shared-assets
+        Args:
+            changed: Changed paths from the file watcher; a directory means
+                its contents should be rescanned
+            components_dir: Component tree relative to the project root
+            manifest_options: Keyword arguments for create_asset_manifest
+        """
+        components_dir = self.project_root / components_dir
         images_dir = self.project_root / "packages/shared-assets/images"
-        images = {}
         
-        for folder in ['contact', 'about', 'home', 'blog']:
+        rescan = []
+        files = []
+        manifest = False
+        for path in sorted(changed):
+            if path == images_dir or images_dir in path.parents:
+                manifest = True
+            elif path == components_dir or components_dir in path.parents:
+                if path.is_dir():
+                    rescan.append(path)
+                elif path.suffix in ('.ts', '.tsx') and path.name != 'index.ts' \
+                        and not path.name.endswith('.d.ts') and path.exists():
+                    files.append(path)
+        
+        # Added or removed files make cached listings stale
+        shared_index.invalidate(components_dir)
+        
+        for directory in rescan:
+            self.update_directory(directory)
+        
+        for file_path in files:
+            if any(directory in file_path.parents for directory in rescan) or self.is_unchanged(file_path):
+                continue
+            if self.update_file(file_path):
+                print(f"✅ Updated: {file_path.relative_to(self.project_root)}")
+        
+        if self.state:
+            self.state.save()
+        
+        if manifest:
+            self.create_asset_manifest(**manifest_options)
+    
+    def minify_svgs(self, images_dir: Path, writer: OutputWriter) -> None:
+        """Minify the manifest folders' SVGs in place where that saves bytes."""
+        before = after = 0
+        for folder in MANIFEST_FOLDERS:
             folder_path = images_dir / folder
-            if folder_path.exists():
-                images[folder] = []
-                for img in folder_path.iterdir():
-                    if img.is_file():
-                        images[folder].append(img.name)
-        
-        # Generate manifest content
-        manifest_content = """/**
- * Asset manifest for shared-assets package
- * Auto-generated - do not edit manually
- */
-
-"""
+            if not folder_path.exists():
+                continue
+            for path in sorted(folder_path.glob('*.svg')):
+                svg = path.read_text(encoding='utf-8')
+                minified = minify_svg(svg) + "\n"
+                before += len(svg.encode('utf-8'))
+                if len(minified) < len(svg):
+                    writer.write(path, minified)
+                    svg = minified
+                after += len(svg.encode('utf-8'))
         
-        for folder, files in images.items():
-            manifest_content += f"// {folder.capitalize()} page assets\n"
-            for file in sorted(files):
-                var_name = file.replace('-', '_').replace('.', '_').upper()
-                manifest_content += f"export const {folder.upper()}_{var_name} = require('../images/{folder}/{file}');\n"
-            manifest_content += "\n"
+        print(f"🗜️  Minified SVGs: {before:,} → {after:,} bytes")
+    
+    def build_icon_sprite(self, writer: OutputWriter) -> Dict[str, str]:
+        """
+        Bundle standalone icons into the shared-assets sprite.
         
-        # Write manifest
-        with open(manifest_path, 'w') as f:
-            f.write(manifest_content)
+        Returns:
+            Manifest key → sprite symbol ID
+        """
+        icons = collect_icons(self.project_root / directory for directory in ICON_DIRS)
+        sprite, source_bytes = build_sprite(icons)
+        content = sprite.render()
+        writer.write(self.project_root / SPRITE_PATH, content)
         
-        print(f"📝 Updated asset manifest: {manifest_path.relative_to(self.project_root)}")
+        print(f"🧩 Icon sprite: {len(sprite.ids)} icons, {source_bytes:,} → "
+              f"{len(content.encode('utf-8')):,} bytes in 1 request")
+        return {icon_export_name(icon_id): icon_id for icon_id in sprite.ids.values()}
+    
+    def create_asset_manifest(
+        self,
+        mode: str = 'require',
+        variant_widths: Optional[List[int]] = None,
+        svg: bool = False,
+        placeholders: bool = False
+    ) -> None:
+        """
+        Create or update the asset manifest.
+        
+        Args:
+            mode: 'require' writes a single images.ts with one require() per
+                image; 'split' writes one ESM module per page folder under
+                src/manifest/ and a lazy-loading images.ts
+            variant_widths: Generate responsive variants at these widths and
+                add srcset data to the manifest; None skips variants
+            svg: Minify SVGs and bundle icons into a sprite whose symbol IDs
+                the manifest exports
+            placeholders: Export an inline blur placeholder per raster image
+        """
+        manifest_path = self.project_root / "packages/shared-assets/src/images.ts"
+        images_dir = self.project_root / "packages/shared-assets/images"
+        writer = OutputWriter()
+        
+        icons = None
+        if svg:
+            with shared_profiler.phase('manifest.svg'):
+                self.minify_svgs(images_dir, writer)
+                icons = self.build_icon_sprite(writer)
+        
+        # Scan shared-assets through the persistent index; unchanged folders
+        # are not re-listed and unchanged files are not re-read
+        with shared_profiler.phase('manifest.scan'):
+            index = AssetIndex(self.project_root / DEFAULT_ASSET_INDEX)
+            images = {}
+            
+            for folder in MANIFEST_FOLDERS:
+                folder_path = images_dir / folder
+                if folder_path.exists():
+                    images[folder] = index.scan_folder(folder_path, folder)
+            
+            index.save()
+        shared_profiler.count('images_reprocessed', index.files_reprocessed)
+        
+        # Responsive variants, re-encoded only when a source hash changes
+        variants = None
+        if variant_widths:
+            pipeline = VariantPipeline(images_dir.parent, variant_widths, jobs=self.jobs)
+            with shared_profiler.phase('manifest.variants'):
+                variants = pipeline.build(images_dir, images)
+            print(f"🖼️  Responsive variants: {pipeline.summary()}")
+            for error in pipeline.errors:
+                print(f"❌ Error encoding {error}")
+        
+        # Blur placeholders, decoded only for content hashes not seen before
+        lqip = None
+        if placeholders:
+            generator = PlaceholderGenerator(self.project_root / DEFAULT_PLACEHOLDER_CACHE, jobs=self.jobs)
+            with shared_profiler.phase('manifest.placeholders'):
+                lqip = generator.build(images_dir, images)
+            print(f"🌫️  Placeholders: {generator.summary()}")
+            for error in generator.errors:
+                print(f"❌ Error rendering placeholder {error}")
+        
+        # Write manifest files only if their content changed
+        outputs = {}
+        with shared_profiler.phase('manifest.render'):
+            if mode == 'split':
+                for folder, files in images.items():
+                    outputs[manifest_path.parent / "manifest" / f"{folder}.ts"] = render_page_manifest(
+                        folder,
+                        files,
+                        variants.get(folder, {}) if variants is not None else None,
+                        lqip.get(folder, {}) if lqip is not None else None
+                    )
+                if icons is not None:
+                    outputs[manifest_path.parent / "manifest" / "icons.ts"] = render_icon_manifest(icons)
+                outputs[manifest_path] = render_lazy_index(list(images), icons is not None)
+            else:
+                outputs[manifest_path] = render_manifest(images, variants, icons, lqip)
+        
+        with shared_profiler.phase('manifest.write'):
+            for path, content in outputs.items():
+                relative_path = path.relative_to(self.project_root)
+                if writer.write(path, content):
+                    print(f"📝 Updated asset manifest: {relative_path}")
+                else:
+                    print(f"📝 Asset manifest unchanged: {relative_path}")
+        print(f"   Rescanned {index.folders_rescanned} folders, "
+              f"re-read {index.files_reprocessed} images")
     
     def generate_report(self) -> None:
         """Generate a report of all updates."""
@@ -167,13 +710,86 @@ class AssetPathUpdater:
                     print(f"  - {file}")
         else:
             print("\nNo files needed updating.")
+        
+        if self.skipped:
+            print(f"\nSkipped {self.skipped} unchanged files (incremental state)")
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Reprocess every file and rebuild the incremental state'
+    )
+    parser.add_argument(
+        '--state-file',
+        default=DEFAULT_STATE_FILE,
+        help=f'Incremental state file (default: {DEFAULT_STATE_FILE})'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Rewrite files in N worker processes (0 = one per CPU)'
+    )
+    parser.add_argument(
+        '--manifest-mode',
+        choices=['require', 'split'],
+        default='require',
+        help="'split' emits one ESM module per page folder with lazy loaders"
+    )
+    parser.add_argument(
+        '--variants',
+        action='store_true',
+        help='Generate responsive WebP/AVIF/JPEG variants and srcset data (needs Pillow)'
+    )
+    parser.add_argument(
+        '--variant-widths',
+        type=lambda value: [int(width) for width in value.split(',')],
+        default=list(DEFAULT_WIDTHS),
+        metavar='W1,W2,...',
+        help=f"Variant widths in pixels (default: {','.join(map(str, DEFAULT_WIDTHS))})"
+    )
+    parser.add_argument(
+        '--svg',
+        action='store_true',
+        help='Minify SVGs and bundle icons into a <symbol> sprite exposed by the manifest'
+    )
+    parser.add_argument(
+        '--placeholders',
+        action='store_true',
+        help='Export an inline blur placeholder per raster image (Pillow for blur)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and reprocess changed components and images as they are saved'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='Watch by polling file stats instead of inotify'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=DEFAULT_PROFILE,
+        metavar='PATH',
+        help=f'Record phase timings, rule counts and bytes; write JSON to PATH (default: {DEFAULT_PROFILE})'
+    )
+    args = parser.parse_args()
+    
+    if args.profile:
+        shared_profiler.enable()
+    
     print("🚀 Starting Asset Path Updates")
     print("=" * 50)
     
-    updater = AssetPathUpdater()
+    updater = AssetPathUpdater(state_file=args.state_file, jobs=resolve_jobs(args.jobs))
+    if args.full and updater.state:
+        updater.state.clear()
     
     # Update shared-components
     print("\n📦 Updating shared-components...")
@@ -183,12 +799,30 @@ def main():
     
     # Update asset manifest
     print("\n📝 Updating asset manifest...")
-    updater.create_asset_manifest()
+    manifest_options = {
+        'mode': args.manifest_mode,
+        'variant_widths': args.variant_widths if args.variants else None,
+        'svg': args.svg,
+        'placeholders': args.placeholders,
+    }
+    updater.create_asset_manifest(**manifest_options)
     
     # Generate report
     updater.generate_report()
     
     print("\n✨ Asset path updates complete!")
+    
+    if args.profile:
+        shared_profiler.summary()
+        shared_profiler.save(updater.project_root / args.profile)
+        print(f"\n📝 Profile written: {args.profile}")
+    
+    if args.watch:
+        watch(
+            [updater.project_root / components_dir, updater.project_root / "packages/shared-assets/images"],
+            lambda changed: updater.handle_changes(changed, components_dir, manifest_options),
+            polling=args.poll
+        )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file